@@ -0,0 +1,212 @@
+"""Benchmark DeepLCLI against the local translator stub.
+
+Measures cold-start latency, warm latency, batch throughput and memory, and
+the throughput of `WorkerPool` with 1, 2, 4... processes up to the number of
+CPU cores. Saves the results as JSON so that releases can be compared:
+
+```
+python -m benchmarks.bench -o before.json
+python -m benchmarks.bench -o after.json --compare before.json
+```
+"""
+
+import argparse
+import asyncio
+import importlib.metadata
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from benchmarks.translator_stub import TranslatorStub
+from deepl import DeepLCLI, WorkerPool, __version__
+
+FR_LANG = "en"
+TO_LANG = "ja"
+
+
+def rss_bytes(pid: int) -> int | None:
+    """Get the resident set size of a process and all of its descendants (Linux only)."""
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    children: dict[int, list[int]] = {}
+    for stat in proc.glob("[0-9]*/stat"):
+        try:
+            # The process name may contain spaces, so split after its closing parenthesis
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+
+    total = 0
+    stack = [pid]
+    while stack:
+        p = stack.pop()
+        stack.extend(children.get(p, []))
+        try:
+            total += int((proc / str(p) / "statm").read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            continue
+    return total
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples in milliseconds."""
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "n": len(ms),
+        "min_ms": ms[0],
+        "p50_ms": statistics.median(ms),
+        "p95_ms": ms[min(len(ms) - 1, round(len(ms) * 0.95))],
+        "max_ms": ms[-1],
+    }
+
+
+def new_translator(stub: TranslatorStub, **kwargs: Any) -> DeepLCLI:  # noqa: ANN401
+    """Create a DeepLCLI translating with the stub."""
+    t = DeepLCLI(FR_LANG, TO_LANG, **kwargs)
+    t.url = stub.url
+    return t
+
+
+def timed(f: Callable[[], object]) -> float:
+    """Measure the wall time of a call in seconds."""
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def bench_cold(stub: TranslatorStub, repeat: int) -> dict[str, Any]:
+    """Launch a browser, translate once and close it, `repeat` times."""
+    return summarize([timed(lambda: new_translator(stub).translate("cold start")) for _ in range(repeat)])
+
+
+def bench_warm(stub: TranslatorStub, repeat: int) -> dict[str, Any]:
+    """Translate `repeat` times with a started browser."""
+    with new_translator(stub) as t:
+        t.translate("warm up")
+        return summarize([timed(lambda i=i: t.translate(f"warm {i}")) for i in range(repeat)])
+
+
+def bench_batch(stub: TranslatorStub, items: int, concurrency: int) -> dict[str, Any]:
+    """Translate `items` texts with `translate_many`, and sample memory while doing so."""
+    peak_rss: int | None = None
+
+    async def run() -> float:
+        nonlocal peak_rss
+        async with new_translator(stub, pool_size=concurrency) as t:
+            task = asyncio.ensure_future(t.translate_many_async([f"item {i}" for i in range(items)], concurrency))
+            start = time.perf_counter()
+            while not task.done():
+                rss = rss_bytes(os.getpid())
+                if rss is not None:
+                    peak_rss = max(peak_rss or 0, rss)
+                await asyncio.wait([task], timeout=0.1)
+            elapsed = time.perf_counter() - start
+            errors = [r for r in task.result() if isinstance(r, Exception)]
+            if errors:
+                msg = f"{len(errors)} items failed: {errors[0]!r}"
+                raise RuntimeError(msg)
+            return elapsed
+
+    elapsed = asyncio.run(run())
+    return {
+        "items": items,
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "items_per_s": items / elapsed,
+        "peak_rss_mb": None if peak_rss is None else peak_rss / 2**20,
+    }
+
+
+def bench_workers(stub: TranslatorStub, items: int, pages: int, worker_counts: list[int]) -> dict[str, Any]:
+    """Translate `items` texts with `WorkerPool`s of each number of processes, after warming up every page."""
+    results: dict[str, Any] = {}
+    for workers in worker_counts:
+        with WorkerPool(FR_LANG, TO_LANG, workers, pages, url=stub.url) as pool:
+            pool.translate_many([f"warm up {i}" for i in range(workers * pages)])
+            start = time.perf_counter()
+            res = pool.translate_many([f"item {i}" for i in range(items)])
+            elapsed = time.perf_counter() - start
+        errors = [r for r in res if isinstance(r, Exception)]
+        if errors:
+            msg = f"{len(errors)} items failed: {errors[0]!r}"
+            raise RuntimeError(msg)
+        results[f"workers_{workers}_items_per_s"] = items / elapsed
+    base = results[f"workers_{worker_counts[0]}_items_per_s"]
+    for workers in worker_counts[1:]:
+        results[f"workers_{workers}_speedup"] = results[f"workers_{workers}_items_per_s"] / base
+    return results
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Print the change of every metric from a baseline."""
+    print(f"compared with {baseline['deepl_version']} ({baseline['timestamp']}):")
+    for name, metrics in results["benchmarks"].items():
+        for key, value in metrics.items():
+            old = baseline["benchmarks"].get(name, {}).get(key)
+            if isinstance(value, float) and isinstance(old, (int, float)) and old:
+                print(f"  {name}.{key}: {old:.1f} -> {value:.1f} ({(value - old) / old:+.1%})")
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", type=Path, help="JSON file to save the results to")
+    parser.add_argument("--compare", type=Path, metavar="JSON", help="results of a previous run to compare with")
+    parser.add_argument("--delay", type=int, default=100, metavar="MS", help="delay of the stub translation")
+    parser.add_argument("--placeholder", type=int, default=50, metavar="MS", help="time the stub shows [...]")
+    parser.add_argument("--repeat", type=int, default=10, help="samples of cold and warm latency")
+    parser.add_argument("--items", type=int, default=200, help="texts in the batch")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrency of the batch")
+    parser.add_argument(
+        "--workers",
+        type=lambda v: [int(n) for n in v.split(",")],
+        default=[n for n in (1, 2, 4, 8, 16, 32) if n <= (os.cpu_count() or 1)],
+        metavar="N,N,...",
+        help="numbers of worker processes to measure, each with --concurrency pages",
+    )
+    args = parser.parse_args()
+
+    with TranslatorStub(delay_ms=args.delay, placeholder_ms=args.placeholder) as stub:
+        results = {
+            "deepl_version": __version__,
+            "playwright_version": importlib.metadata.version("playwright"),
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "config": {
+                "delay_ms": args.delay,
+                "placeholder_ms": args.placeholder,
+                "repeat": args.repeat,
+                "items": args.items,
+                "concurrency": args.concurrency,
+                "workers": args.workers,
+                "cpu_count": os.cpu_count(),
+            },
+            "benchmarks": {
+                "cold": bench_cold(stub, args.repeat),
+                "warm": bench_warm(stub, args.repeat),
+                "batch": bench_batch(stub, args.items, args.concurrency),
+                "workers": bench_workers(stub, args.items, args.concurrency, args.workers),
+            },
+        }
+
+    out = json.dumps(results, indent=2)
+    print(out)
+    if args.output is not None:
+        args.output.write_text(out + "\n")
+    if args.compare is not None:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
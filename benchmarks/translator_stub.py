@@ -0,0 +1,159 @@
+"""Local stand-in for the DeepL translator page.
+
+The page has the `data-testid` structure that `DeepLCLI` drives: the language
+dropdown buttons and `translator-lang-option-*` options, the
+`translator-source-input` textbox and a `d-textarea` target, whose `lang`
+attributes show the language pair, preset by a `#fr/to/` fragment. A
+"translation" is the source text prefixed with the target language, redone
+whenever the text or a language changes. It shows up after `delay_ms`,
+first with a `[...]` placeholder for `placeholder_ms` if that is positive,
+like DeepL does for long texts.
+"""
+
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from deepl.languages import FR_LANGS, TO_LANGS
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Translator stub</title>
+<script>
+customElements.define("d-textarea", class extends HTMLElement {
+  get value() { return this.textContent; }
+  set value(v) { this.textContent = v; }
+});
+</script>
+</head>
+<body>
+<main>
+  <button data-testid="translator-source-lang-btn">source</button>
+  <div data-testid="translator-source-lang-list" hidden>$source_options</div>
+  <button data-testid="translator-target-lang-btn">target</button>
+  <div data-testid="translator-target-lang-list" hidden>$target_options</div>
+  <section data-testid="translator-source-input" lang="en-US">
+    <div role="textbox" contenteditable="true"></div>
+  </section>
+  <h2 id="translation-target-heading">Translation</h2>
+  <section data-testid="translator-target-input" lang="ja-JP">
+    <d-textarea aria-labelledby="translation-target-heading"></d-textarea>
+  </section>
+</main>
+<script>
+const config = $config;
+const source = document.querySelector("[data-testid=translator-source-input]");
+const target = document.querySelector("[data-testid=translator-target-input]");
+const output = document.querySelector("d-textarea");
+// Like DeepL, a `#fr/to/` fragment presets the language pair
+const [fragmentSource, fragmentTarget] = location.hash.slice(1).split("/");
+if (fragmentSource) source.lang = fragmentSource;
+if (fragmentTarget) target.lang = fragmentTarget;
+for (const [kind, input] of [["source", source], ["target", target]]) {
+  document.querySelector(`[data-testid=translator-$${kind}-lang-btn]`).addEventListener("click", () => {
+    document.querySelector(`[data-testid=translator-$${kind}-lang-list]`).hidden = false;
+  });
+  document.querySelectorAll(`[data-testid=translator-$${kind}-lang-list] button`).forEach((b) => {
+    b.addEventListener("click", () => {
+      input.lang = b.dataset.lang;
+      translate();
+    });
+  });
+}
+let timers = [];
+const textbox = source.querySelector("[role=textbox]");
+textbox.addEventListener("input", translate);
+function translate() {
+  timers.forEach(clearTimeout);
+  const text = textbox.innerText.replace(/\\n$$/, "");
+  if (!text) {
+    output.value = "";
+    return;
+  }
+  const translation = `[$${target.lang}] $${text}`;
+  if (config.placeholder_ms > 0) {
+    timers = [
+      setTimeout(() => { output.value = translation.slice(0, translation.length >> 1) + " [...]"; }, config.delay_ms),
+      setTimeout(() => { output.value = translation; }, config.delay_ms + config.placeholder_ms),
+    ];
+  } else {
+    timers = [setTimeout(() => { output.value = translation; }, config.delay_ms)];
+  }
+}
+</script>
+</body>
+</html>
+""")
+
+
+def _options(langs: set[str]) -> str:
+    return "".join(
+        f'<button data-testid="translator-lang-option-{lang}" data-lang="{lang}">{lang}</button>'
+        for lang in sorted(langs)
+    )
+
+
+class TranslatorStub:
+    """Serve the stand-in translator page on localhost from a background thread.
+
+    Point `DeepLCLI.url` at `TranslatorStub.url` to translate against it.
+    """
+
+    def __init__(self, delay_ms: int = 100, placeholder_ms: int = 0, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Initialize TranslatorStub.
+
+        Args:
+            delay_ms (int): Delay until the (partial) translation is shown. Default is 100ms.
+            placeholder_ms (int): Time the `[...]` placeholder is shown. Default is 0ms (never).
+            host (str): Host to listen on. Default is 127.0.0.1.
+            port (int): Port to listen on. Default is a free port.
+        """
+        page = PAGE.substitute(
+            source_options=_options(FR_LANGS),
+            target_options=_options(TO_LANGS),
+            config=json.dumps({"delay_ms": delay_ms, "placeholder_ms": placeholder_ms}),
+        ).encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                pass
+
+        self.__server = ThreadingHTTPServer((host, port), Handler)
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """URL of the translator page."""
+        host, port = self.__server.server_address[:2]
+        return f"http://{host!s}:{port}/en/translator"
+
+    def __enter__(self) -> "Self":
+        """Start serving."""
+        self.__thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving."""
+        self.__server.shutdown()
+        self.__server.server_close()
@@ -1,12 +1,61 @@
 """.. include:: ../README.md"""  # noqa: D415
 
 import importlib.metadata
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache import TranslationCache
+    from .deepl import DeepLCLI
+    from .errors import DeepLCLIError, DeepLCLIPageLoadError, DeepLCLIThrottledError, DeepLCLITimeoutError
+    from .proxies import ProxyPool
+    from .ratelimit import RateLimiter, RetryPolicy
+    from .resources import AssetCache, ResourcePolicy
+    from .timings import Timings
+    from .workers import WorkerPool
 
 try:
     __version__ = importlib.metadata.version(__name__)
 except importlib.metadata.PackageNotFoundError:
     __version__ = "0.0.0"
 
-from .deepl import DeepLCLI, DeepLCLIError, DeepLCLIPageLoadError
+# Importing `.deepl` loads Playwright, so defer it until a name is actually used
+_LAZY_MODULES = {
+    "AssetCache": ".resources",
+    "DeepLCLI": ".deepl",
+    "DeepLCLIError": ".errors",
+    "DeepLCLIPageLoadError": ".errors",
+    "DeepLCLIThrottledError": ".errors",
+    "DeepLCLITimeoutError": ".errors",
+    "ProxyPool": ".proxies",
+    "RateLimiter": ".ratelimit",
+    "ResourcePolicy": ".resources",
+    "RetryPolicy": ".ratelimit",
+    "Timings": ".timings",
+    "TranslationCache": ".cache",
+    "WorkerPool": ".workers",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import public names lazily."""
+    if name in _LAZY_MODULES:
+        return getattr(importlib.import_module(_LAZY_MODULES[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
-__all__ = ("DeepLCLI", "DeepLCLIError", "DeepLCLIPageLoadError")
+__all__ = (
+    "AssetCache",
+    "DeepLCLI",
+    "DeepLCLIError",
+    "DeepLCLIPageLoadError",
+    "DeepLCLIThrottledError",
+    "DeepLCLITimeoutError",
+    "ProxyPool",
+    "RateLimiter",
+    "ResourcePolicy",
+    "RetryPolicy",
+    "Timings",
+    "TranslationCache",
+    "WorkerPool",
+)
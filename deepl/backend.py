@@ -0,0 +1,74 @@
+"""Parse translations from the responses of the DeepL translator backend."""
+
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+TRANSLATION_METHODS = ("LMT_handle_texts", "LMT_handle_jobs")
+# JSON-RPC error codes of "Too many requests"
+THROTTLED_ERROR_CODES = frozenset({1042911, 1042912})
+
+
+def is_translation_url(url: str) -> bool:
+    """Check if a URL is a JSON-RPC call of the translator that returns a translation.
+
+    Args:
+        url (str): Request URL.
+
+    Returns:
+        bool: Whether the response may hold a translation.
+    """
+    parsed = urlparse(url)
+    if not parsed.hostname or not parsed.hostname.endswith("deepl.com") or not parsed.path.endswith("/jsonrpc"):
+        return False
+    return parse_qs(parsed.query).get("method", [""])[0] in TRANSLATION_METHODS
+
+
+def parse_translation(body: Any) -> tuple[str, str | None] | None:  # noqa: ANN401
+    """Get the translated text from a JSON-RPC response body.
+
+    `LMT_handle_texts` returns `{"result": {"texts": [{"text": ...}], "lang": ...}}`,
+    one text per line of the source. `LMT_handle_jobs` returns
+    `{"result": {"translations": [{"beams": [{"sentences": [{"text": ...}]}]}]}}`;
+    only a single job is accepted, since the spacing between jobs is not returned.
+
+    Args:
+        body (Any): Decoded JSON body.
+
+    Returns:
+        tuple[str, str | None] | None: Translated text and detected source language,
+            or None if the body does not hold a complete translation.
+    """
+    result = body.get("result") if isinstance(body, dict) else None
+    if not isinstance(result, dict):
+        return None
+
+    lang = result.get("lang") if isinstance(result.get("lang"), str) else None
+    source_lang = lang.lower().split("-")[0] if lang else None
+
+    try:
+        if "texts" in result:
+            text = "\n".join(str(t["text"]) for t in result["texts"])
+        else:
+            (translation,) = result["translations"]
+            text = "".join(str(s["text"]) for s in translation["beams"][0]["sentences"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+    if not text:
+        return None
+    return text, source_lang
+
+
+def is_throttled(body: Any) -> bool:  # noqa: ANN401
+    """Check if a JSON-RPC response body is a "Too many requests" error.
+
+    Args:
+        body (Any): Decoded JSON body.
+
+    Returns:
+        bool: Whether DeepL refused the request for being too frequent.
+    """
+    error = body.get("error") if isinstance(body, dict) else None
+    if not isinstance(error, dict):
+        return False
+    return error.get("code") in THROTTLED_ERROR_CODES or "too many requests" in str(error.get("message", "")).lower()
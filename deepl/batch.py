@@ -0,0 +1,230 @@
+"""Translate many files into an output directory, resuming interrupted runs."""
+
+import asyncio
+import contextlib
+import glob
+import hashlib
+import json
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deepl.chunking import split_text
+
+if TYPE_CHECKING:
+    from deepl.deepl import DeepLCLI
+    from deepl.workers import WorkerPool
+
+MANIFEST_NAME = ".deepl-manifest.json"
+
+
+def is_binary(b: bytes) -> bool:
+    """Check if bytes (e.g. the head of a file) look binary.
+
+    Args:
+        b (bytes): Bytes to check.
+
+    Returns:
+        bool: Whether they contain control characters other than whitespace and escape.
+    """
+    chars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+    return bool(b.translate(None, chars))
+
+
+def is_text_file(path: Path) -> bool:
+    """Check if a file looks like text from its first 1024 bytes.
+
+    Args:
+        path (Path): File to check.
+
+    Returns:
+        bool: Whether it is a readable text file.
+    """
+    try:
+        with path.open(mode="rb") as f:
+            return not is_binary(f.read(1024))
+    except OSError:
+        return False
+
+
+def expand_paths(paths: Iterable[str], exclude: Path | None = None) -> list[tuple[Path, Path]]:
+    """Expand files, directories and glob patterns into text files.
+
+    A directory is searched recursively, skipping hidden entries, and a glob
+    accepts `**`. Each file is paired with its path relative to the directory,
+    or to the part of the glob before the first wildcard, so that the output
+    can mirror the input tree.
+
+    Args:
+        paths (Iterable[str]): Files, directories or glob patterns.
+        exclude (Path | None): Directory whose files are skipped, e.g. the output directory.
+
+    Returns:
+        list[tuple[Path, Path]]: Source file and relative path of each text file, without duplicates.
+
+    Raises:
+        ValueError: If two different files have the same relative path.
+    """
+    excluded = exclude.resolve() if exclude is not None else None
+    files: dict[Path, Path] = {}
+    for v in paths:
+        path = Path(v)
+        if path.is_file():
+            candidates = [(path, Path(path.name))]
+        elif path.is_dir():
+            candidates = [
+                (f, f.relative_to(path))
+                for f in sorted(path.rglob("*"))
+                if not any(part.startswith(".") for part in f.relative_to(path).parts)
+            ]
+        else:
+            base_parts = list(_until_magic(path.parts))
+            base = Path(*base_parts)
+            pattern = Path(*path.parts[len(base_parts) :]).as_posix()
+            candidates = [(f, f.relative_to(base)) for f in sorted(base.glob(pattern))] if pattern != "." else []
+
+        for source, rel in candidates:
+            if not source.is_file() or not is_text_file(source):
+                continue
+            resolved = source.resolve()
+            if excluded is not None and resolved.is_relative_to(excluded):
+                continue
+            if files.setdefault(rel, resolved) != resolved:
+                msg = f"{files[rel]} and {resolved} would both be written to {rel}."
+                raise ValueError(msg)
+
+    return [(source, rel) for rel, source in files.items()]
+
+
+def _until_magic(parts: Iterable[str]) -> Iterable[str]:
+    """Yield path parts before the first one with a glob wildcard."""
+    for part in parts:
+        if glob.has_magic(part):
+            return
+        yield part
+
+
+class Manifest:
+    """Record of the files of an output directory that are already translated.
+
+    It is a JSON file in the output directory mapping each relative path to the
+    language pair and the SHA-256 of the source it was translated from, and it
+    is rewritten after every file, so an interrupted run loses at most the
+    files in flight.
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        """Initialize Manifest, loading the existing one if any.
+
+        Args:
+            output_dir (Path): Output directory holding the manifest.
+        """
+        self.path = output_dir / MANIFEST_NAME
+        self.__entries: dict[str, dict[str, str]] = {}
+        if self.path.is_file():
+            try:
+                self.__entries = json.loads(self.path.read_text())
+            except ValueError:
+                self.__entries = {}
+
+    def is_done(self, rel: Path, digest: str, fr_lang: str, to_lang: str) -> bool:
+        """Check if a file was translated from the same source into the same language and still exists.
+
+        Args:
+            rel (Path): Relative path of the file.
+            digest (str): SHA-256 of the source.
+            fr_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            bool: Whether the translation can be skipped.
+        """
+        entry = self.__entries.get(rel.as_posix())
+        return entry == {"sha256": digest, "fr": fr_lang, "to": to_lang} and (self.path.parent / rel).is_file()
+
+    def mark_done(self, rel: Path, digest: str, fr_lang: str, to_lang: str) -> None:
+        """Record a translated file and save the manifest.
+
+        Args:
+            rel (Path): Relative path of the file.
+            digest (str): SHA-256 of the source.
+            fr_lang (str): Source language.
+            to_lang (str): Target language.
+        """
+        self.__entries[rel.as_posix()] = {"sha256": digest, "fr": fr_lang, "to": to_lang}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.__entries, ensure_ascii=False, indent=2))
+        tmp.replace(self.path)
+
+
+async def translate_files(
+    t: "DeepLCLI | WorkerPool",
+    files: list[tuple[Path, Path]],
+    output_dir: Path,
+    jobs: int = 4,
+    on_done: Callable[[Path, Path, Exception | None], None] | None = None,
+) -> tuple[int, int, int]:
+    """Translate files into an output directory mirroring their relative paths.
+
+    Files whose translation is recorded in the manifest of the output
+    directory are skipped. The others are translated `jobs` at a time with
+    `translate_document_async`. If `t` is not started, its browser (or its
+    workers) is started for the run unless every chunk of the pending files is cached.
+
+    Args:
+        t (DeepLCLI | WorkerPool): Translator, or pool of worker processes.
+        files (list[tuple[Path, Path]]): Source file and relative path of each file, e.g. from `expand_paths`.
+        output_dir (Path): Directory to write the translations to.
+        jobs (int): Number of files to translate in parallel. Default is 4.
+        on_done (Callable[[Path, Path, Exception | None], None] | None): Called with the source,
+            the output and the raised error (or None) of each translated file.
+
+    Returns:
+        tuple[int, int, int]: Numbers of translated, skipped and failed files.
+    """
+    manifest = Manifest(output_dir)
+    pending: list[tuple[Path, Path, str, str]] = []
+    translated = failed = 0
+    for source, rel in files:
+        try:
+            text = source.read_text().rstrip("\n")
+        except (OSError, UnicodeDecodeError) as e:
+            # E.g. removed meanwhile, or not in the encoding of the locale
+            failed += 1
+            if on_done is not None:
+                on_done(source, output_dir / rel, e)
+            continue
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        if not manifest.is_done(rel, digest, t.fr_lang, t.to_lang):
+            pending.append((source, rel, text, digest))
+    unreadable = failed
+
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def translate_one(source: Path, rel: Path, text: str, digest: str) -> None:
+        nonlocal translated, failed
+        output = output_dir / rel
+        async with semaphore:
+            try:
+                res = await t.translate_document_async(text, jobs) if text.strip() else ""
+                output.parent.mkdir(parents=True, exist_ok=True)
+                output.write_text(res + "\n")
+            except Exception as e:  # noqa: BLE001
+                failed += 1
+                if on_done is not None:
+                    on_done(source, output, e)
+                return
+        manifest.mark_done(rel, digest, t.fr_lang, t.to_lang)
+        translated += 1
+        if on_done is not None:
+            on_done(source, output, None)
+
+    async with contextlib.AsyncExitStack() as stack:
+        if not t.is_started and any(
+            t.needs_request(chunk) for _, _, text, _ in pending for chunk in split_text(text, t.max_length)[0]
+        ):
+            await stack.enter_async_context(t)
+        await asyncio.gather(*(translate_one(*item) for item in pending))
+
+    return translated, len(files) - len(pending) - unreadable, failed
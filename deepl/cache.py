@@ -0,0 +1,180 @@
+"""Persistent cache of translations."""
+
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text to be used as a cache key.
+
+    Args:
+        text (str): Text to normalize.
+
+    Returns:
+        str: NFC-normalized text without surrounding whitespace.
+    """
+    return unicodedata.normalize("NFC", text).strip()
+
+
+class TranslationCache:
+    """SQLite-backed cache of translations keyed by language pair and normalized text.
+
+    Entries older than `ttl` seconds are treated as missing and removed, and the
+    least recently used entries are evicted once there are more than `max_entries`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        max_entries: int | None = 100_000,
+        ttl: float | None = None,
+    ) -> None:
+        """Initialize TranslationCache.
+
+        Args:
+            path (str | Path): SQLite database file. Default is an in-memory database.
+            max_entries (int | None): Maximum number of entries. Default is 100000.
+            ttl (float | None): Lifetime of an entry in seconds. Default is no limit.
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        # Worker processes may share the file, so wait for each other's writes instead of failing at once
+        self.__conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ":memory:":
+            # Readers and a writer do not block each other
+            self.__conn.execute("PRAGMA journal_mode=WAL")
+        with self.__conn:
+            self.__conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS translations (
+                    fr_lang TEXT NOT NULL,
+                    to_lang TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    translation TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (fr_lang, to_lang, source)
+                )
+                """,
+            )
+            self.__conn.execute(
+                "CREATE INDEX IF NOT EXISTS translations_accessed_at ON translations (accessed_at)",
+            )
+
+    def __reduce__(self) -> tuple[type["TranslationCache"], tuple[str | Path, int | None, float | None]]:
+        """Pickle as the settings to reopen the same file, e.g. in a worker process.
+
+        Raises:
+            TypeError: If the cache is in memory, since it cannot be shared.
+        """
+        if self.path == ":memory:":
+            msg = "An in-memory TranslationCache cannot be shared with another process."
+            raise TypeError(msg)
+        return TranslationCache, (self.path, self.max_entries, self.ttl)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        with self.__lock:
+            (n,) = self.__conn.execute("SELECT COUNT(*) FROM translations").fetchone()
+        return n
+
+    def contains(self, fr_lang: str, to_lang: str, script: str) -> bool:
+        """Check if an unexpired translation is cached, without counting a hit or miss.
+
+        Args:
+            fr_lang (str): Source language.
+            to_lang (str): Target language.
+            script (str): Source script.
+
+        Returns:
+            bool: Whether `get` would return a translation.
+        """
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT created_at FROM translations WHERE fr_lang = ? AND to_lang = ? AND source = ?",
+                (fr_lang, to_lang, normalize_text(script)),
+            ).fetchone()
+        return row is not None and (self.ttl is None or row[0] >= time.time() - self.ttl)
+
+    def get(self, fr_lang: str, to_lang: str, script: str) -> str | None:
+        """Look up a translation.
+
+        Args:
+            fr_lang (str): Source language.
+            to_lang (str): Target language.
+            script (str): Source script.
+
+        Returns:
+            str | None: Cached translation, or None if missing or expired.
+        """
+        key = (fr_lang, to_lang, normalize_text(script))
+        now = time.time()
+        with self.__lock, self.__conn:
+            row = self.__conn.execute(
+                "SELECT translation, created_at FROM translations WHERE fr_lang = ? AND to_lang = ? AND source = ?",
+                key,
+            ).fetchone()
+            if row is not None and self.ttl is not None and row[1] < now - self.ttl:
+                self.__conn.execute(
+                    "DELETE FROM translations WHERE fr_lang = ? AND to_lang = ? AND source = ?",
+                    key,
+                )
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.__conn.execute(
+                "UPDATE translations SET accessed_at = ? WHERE fr_lang = ? AND to_lang = ? AND source = ?",
+                (now, *key),
+            )
+            self.hits += 1
+            return row[0]
+
+    def set(self, fr_lang: str, to_lang: str, script: str, translation: str) -> None:
+        """Store a translation and evict expired or least recently used entries.
+
+        Args:
+            fr_lang (str): Source language.
+            to_lang (str): Target language.
+            script (str): Source script.
+            translation (str): Translated script.
+        """
+        now = time.time()
+        with self.__lock, self.__conn:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                (fr_lang, to_lang, normalize_text(script), translation, now, now),
+            )
+            if self.ttl is not None:
+                self.__conn.execute("DELETE FROM translations WHERE created_at < ?", (now - self.ttl,))
+            if self.max_entries is not None:
+                self.__conn.execute(
+                    """
+                    DELETE FROM translations WHERE rowid IN (
+                        SELECT rowid FROM translations ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self.__lock, self.__conn:
+            self.__conn.execute("DELETE FROM translations")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.__lock:
+            self.__conn.close()
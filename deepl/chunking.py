@@ -0,0 +1,101 @@
+"""Split long text into chunks that DeepL accepts and join their translations back."""
+
+import re
+
+# Whitespace after a sentence terminator, or any whitespace containing a line break.
+# CJK full stops, exclamation and question marks are usually not followed by a space, so a boundary may be empty there.
+_BOUNDARY = re.compile(r"(?<=[.!?])\s+|(?<=[\u3002\uff01\uff1f])\s*(?=\S)|\s*\n\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def split_text(text: str, max_length: int) -> tuple[list[str], list[str]]:
+    """Split text into chunks of at most `max_length` chars on paragraph and sentence boundaries.
+
+    Sentences are packed greedily into chunks. A sentence longer than
+    `max_length` is split between words, and a word longer than `max_length`
+    is cut. The whitespace between chunks is kept so that
+    `join_text(chunks, separators) == text`.
+
+    Args:
+        text (str): Text to split.
+        max_length (int): Maximum length of a chunk.
+
+    Returns:
+        tuple[list[str], list[str]]: Chunks and the `len(chunks) + 1` separators around them.
+
+    Raises:
+        ValueError: If `max_length` is not positive.
+    """
+    if max_length < 1:
+        msg = f"Max length must be positive (Now: {max_length})"
+        raise ValueError(msg)
+
+    core = text.strip()
+    if not core:
+        return [], [text]
+
+    start = text.index(core)
+    head, tail = text[:start], text[start + len(core) :]
+
+    chunks: list[str] = []
+    separators = [head]
+    for piece, separator in _pack(_split_pieces(core, max_length), max_length):
+        chunks.append(piece)
+        separators.append(separator)
+    separators[-1] += tail
+
+    return chunks, separators
+
+
+def join_text(chunks: list[str], separators: list[str]) -> str:
+    """Join (translated) chunks with the separators returned by `split_text`.
+
+    Args:
+        chunks (list[str]): Chunks to join.
+        separators (list[str]): Separators around the chunks.
+
+    Returns:
+        str: Joined text.
+    """
+    return separators[0] + "".join(chunk + separator for chunk, separator in zip(chunks, separators[1:], strict=True))
+
+
+def _split_pieces(text: str, max_length: int) -> list[tuple[str, str]]:
+    """Split text into sentences no longer than `max_length` with their trailing whitespace."""
+    pieces: list[tuple[str, str]] = []
+    for sentence, separator in _split_on(_BOUNDARY, text):
+        if len(sentence) <= max_length:
+            pieces.append((sentence, separator))
+            continue
+        words = _split_on(_WHITESPACE, sentence)
+        words[-1] = (words[-1][0], words[-1][1] + separator)
+        for word, word_separator in words:
+            cuts = [word[i : i + max_length] for i in range(0, len(word), max_length)]
+            pieces.extend((cut, "") for cut in cuts[:-1])
+            pieces.append((cuts[-1], word_separator))
+    return pieces
+
+
+def _split_on(pattern: re.Pattern[str], text: str) -> list[tuple[str, str]]:
+    """Split text on a separator pattern into (part, following separator) pairs."""
+    pairs: list[tuple[str, str]] = []
+    pos = 0
+    for m in pattern.finditer(text):
+        pairs.append((text[pos : m.start()], m.group()))
+        pos = m.end()
+    pairs.append((text[pos:], ""))
+    return pairs
+
+
+def _pack(pieces: list[tuple[str, str]], max_length: int) -> list[tuple[str, str]]:
+    """Merge consecutive pieces greedily while they fit in `max_length`."""
+    packed: list[tuple[str, str]] = []
+    for piece, separator in pieces:
+        if packed:
+            last, last_separator = packed[-1]
+            merged = last + last_separator + piece
+            if len(merged) <= max_length:
+                packed[-1] = (merged, separator)
+                continue
+        packed.append((piece, separator))
+    return packed
@@ -2,24 +2,53 @@
 
 import asyncio
 import contextlib
+import functools
 import os
-from collections.abc import Coroutine
-from typing import Any
+import sqlite3
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
-from install_playwright import install
 from playwright._impl._errors import Error as PlaywrightError
 from playwright.async_api import ProxySettings, async_playwright
-from playwright.async_api._generated import Browser, Playwright
+from playwright.async_api._generated import Browser, BrowserContext, Page, Playwright, Response
 
-from deepl.languages import FR_LANGS, TO_LANGS
+from deepl.backend import TRANSLATION_METHODS, is_throttled, is_translation_url, parse_translation
+from deepl.cache import TranslationCache
+from deepl.chunking import join_text, split_text
+from deepl.errors import DeepLCLIError, DeepLCLIPageLoadError, DeepLCLIThrottledError, DeepLCLITimeoutError
+from deepl.install import SKIP_INSTALL_ENV, ensure_installed, is_install_skipped
+from deepl.languages import FR_LANGS, TO_LANGS, is_selected
+from deepl.loop import LoopThread, iterate_in_thread
+from deepl.packing import is_packable, join_segments, pack_segments, split_segments
+from deepl.pool import PagePool
+from deepl.proxies import ProxyPool
+from deepl.ratelimit import RateLimiter, RetryPolicy, is_retryable_status, parse_retry_after
+from deepl.recycling import RecycleStats, browser_rss
+from deepl.resources import AssetCache, ResourcePolicy, ResourceStats, handle_route
+from deepl.timings import Timings, measure, set_source
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
-class DeepLCLIError(Exception):
-    """Generic error for DeepLCLI."""
+T = TypeVar("T")
 
-
-class DeepLCLIPageLoadError(Exception):
-    """Page load error for DeepLCLI."""
+SOURCE_TEXTBOX = "[data-testid=translator-source-input] div[role=textbox]"
 
 
 class DeepLCLI:
@@ -39,14 +68,45 @@ class DeepLCLI:
     // new Set(fr).difference(new Set(to))
     // new Set(to).difference(new Set(fr))
     ```
+
+    A single Chromium can be shared by many translations by using `DeepLCLI` as
+    a (async) context manager. The browser is launched on enter and reused by
+    every `translate`/`translate_async` call until the context is closed.
+    While started, `pool_size` pages stay on the translator with the language
+    pair selected, so a translation only fills in the text and waits.
+
+    The synchronous API runs on an event loop in a background thread owned by
+    the instance, so it works inside code that already runs a loop, and many
+    threads (e.g. of a web server) may call it at once to share the warm pages:
+
+    ```
+    with DeepLCLI("en", "ja") as t:
+        t.translate("hello")
+        t.translate("world")
+    ```
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0915
         self,
         fr_lang: str,
         to_lang: str,
         timeout: int = 15000,
-        proxy: ProxySettings | None = None,
+        proxy: ProxySettings | Sequence[ProxySettings] | ProxyPool | None = None,
+        *,
+        pool_size: int = 1,
+        page_max_uses: int | None = None,
+        page_health_check: bool = True,
+        cache: TranslationCache | None = None,
+        install_browser: bool = True,
+        on_timings: Callable[[Timings], None] | None = None,
+        trace: str | Path | None = None,
+        resources: ResourcePolicy | None = None,
+        asset_cache: AssetCache | None = None,
+        profile_dir: str | Path | None = None,
+        storage_state: str | Path | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        max_memory: int | None = None,
     ) -> None:
         """Initialize DeepLCLI.
 
@@ -54,10 +114,36 @@ class DeepLCLI:
             fr_lang (str): Source language.
             to_lang (str): Target language.
             timeout (int): Timeout in milliseconds. Default is 15000ms.
-            proxy (ProxySettings): Use a proxy to access deepl.
+            proxy (ProxySettings | Sequence[ProxySettings] | ProxyPool | None): Use a proxy to access deepl.
+                With many proxies (or a `ProxyPool`, which translators may share), each page goes through
+                the healthiest one, and pages of a failing proxy are replaced by pages of another.
+            pool_size (int): Number of warm pages kept by a shared browser. Default is 1.
+            page_max_uses (int | None): Recycle a warm page after this many translations. Default is no limit.
+            page_health_check (bool): Check that a warm page is still usable before each translation.
+            cache (TranslationCache | None): Look up translations here before requesting DeepL.
+            install_browser (bool): Install Chromium on first launch if needed. It is checked once
+                per Playwright version, and never if `$DEEPL_CLI_SKIP_INSTALL` is set.
+            on_timings (Callable[[Timings], None] | None): Called with the per-phase timings of each translation.
+            trace (str | Path | None): Save a Playwright trace of each translation on a page to this file,
+                overwriting the previous one. Pages record from their creation, so the first trace of a page
+                also covers loading the translator.
+            resources (ResourcePolicy | None): Requests of the translator page to block.
+                Default is images, media, fonts, others and common analytics.
+            asset_cache (AssetCache | None): Serve the static scripts and stylesheets of the translator from here.
+            profile_dir (str | Path | None): Run Chromium with this persistent profile, keeping cookies,
+                local storage and HTTP cache between runs. A profile can be used by one browser at a time.
+            storage_state (str | Path | None): Load cookies and local storage from this file when a page
+                is opened, and save them back when the browser closes.
+            rate_limiter (RateLimiter | None): Pace requests to DeepL, backing off when it throttles them.
+                Share one instance between translators to pace them together. Default is no limit.
+            retry (RetryPolicy | None): Retry requests that DeepL throttles or fails with a 5xx status.
+                Default is 3 retries with exponential backoff and jitter.
+            max_memory (int | None): Restart a shared browser once its processes use more than this many MiB,
+                checked every `memory_check_interval` seconds (Linux only). Translations in flight finish
+                on the old browser. With `profile_dir`, its pages are replaced instead. Default is no limit.
 
         Raises:
-            DeepLCLIError: If the language is not valid.
+            DeepLCLIError: If the language is not valid, or both `profile_dir` and `storage_state` are given.
         """
         if fr_lang not in FR_LANGS:
             raise DeepLCLIError(
@@ -67,14 +153,212 @@ class DeepLCLI:
             raise DeepLCLIError(
                 f"{to_lang!r} is not valid language. Valid language:\n" + repr(TO_LANGS),
             )
+        if profile_dir is not None and storage_state is not None:
+            msg = "profile_dir and storage_state cannot be used together."
+            raise DeepLCLIError(msg)
 
         self.fr_lang = fr_lang
         self.to_lang = to_lang
         self.translated_fr_lang: str | None = None
         self.translated_to_lang: str | None = None
         self.max_length = 1500
+        self.url = "https://www.deepl.com/en/translator"
         self.timeout = timeout
-        self.proxy = proxy
+        self.proxy: ProxySettings | None = None
+        self.proxies: ProxyPool | None = None
+        if isinstance(proxy, ProxyPool):
+            self.proxies = proxy
+        elif isinstance(proxy, dict):
+            self.proxy = cast("ProxySettings", proxy)
+        elif proxy is not None:
+            self.proxies = ProxyPool(cast("Sequence[ProxySettings]", proxy))
+        self.pool_size = pool_size
+        self.page_max_uses = page_max_uses
+        self.page_health_check = page_health_check
+        self.cache = cache
+        self.install_browser = install_browser
+        self.on_timings = on_timings
+        self.trace = trace
+        self.last_timings: Timings | None = None
+        self.resources = resources or ResourcePolicy()
+        self.asset_cache = asset_cache
+        self.resource_stats = ResourceStats()
+        self.profile_dir = profile_dir
+        self.storage_state = storage_state
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.max_memory = max_memory
+        self.memory_check_interval = 10.0
+        self.recycle_stats = RecycleStats()
+        self.__playwright: Playwright | None = None
+        self.__browser: Browser | BrowserContext | None = None
+        self.__last_page: Page | None = None
+        self.__page_proxies: dict[Page, ProxySettings] = {}
+        self.__browser_proxy: ProxySettings | None = None
+        self.__pool: PagePool | None = None
+        self.__loop: LoopThread | None = None
+        self.__loop_lock = threading.Lock()
+        self.__loop_finalizer: weakref.finalize | None = None
+        self.__start_lock: asyncio.Lock | None = None
+        self.__users = 0
+        self.__call_scoped = False
+        self.__memory_checked = 0.0
+        self.__recycling: asyncio.Future[None] | None = None
+
+    def __enter__(self) -> "Self":
+        """Launch a shared browser for the synchronous API."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the shared browser."""
+        self.close()
+
+    async def __aenter__(self) -> "Self":
+        """Launch a shared browser for the asynchronous API."""
+        await self.start_async()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the shared browser."""
+        await self.close_async()
+
+    @property
+    def is_started(self) -> bool:
+        """Whether a shared browser is running."""
+        return self.__browser is not None
+
+    def needs_request(self, script: str, to_lang: str | None = None) -> bool:
+        """Check if translating script would throw a request to DeepL, i.e. it is valid and not cached.
+
+        Args:
+            script (str): Script to translate.
+            to_lang (str | None): Target language. Default is `to_lang`.
+
+        Returns:
+            bool: Whether a browser is needed to translate it.
+        """
+        try:
+            script = self.__sanitize_script(script)
+        except DeepLCLIError:
+            return False
+        return self.cache is None or not self.cache.contains(self.fr_lang, to_lang or self.to_lang, script)
+
+    def start(self) -> None:
+        """Launch a shared browser reused by `translate` until `close` is called.
+
+        The browser runs on the background event loop of this instance, which
+        every synchronous method uses, so it may be called from any thread.
+        Inside asyncio, `start_async` shares the browser with `translate_async` instead.
+        """
+        self.__run(self.start_async())
+
+    def close(self) -> None:
+        """Close the shared browser launched by `start`, and stop the background event loop."""
+        with self.__loop_lock:
+            loop, self.__loop = self.__loop, None
+        if loop is None:
+            return
+        try:
+            loop.run(self.close_async())
+        finally:
+            loop.stop()
+            if self.__loop_finalizer is not None:
+                self.__loop_finalizer.detach()
+
+    async def start_async(self) -> None:
+        """Launch a shared browser reused by `translate_async` until `close_async` is called.
+
+        `pool_size` pages are opened on the translator with the language pair
+        already selected, so that each translation only fills in the text.
+        """
+        async with self.__get_start_lock():
+            if self.__browser is None:
+                await self.__launch(self.pool_size)
+            # Started for good, even if a call started it for itself
+            self.__call_scoped = False
+
+    @contextlib.asynccontextmanager
+    async def __using_browser(self, pool_size: int) -> AsyncGenerator[None, None]:
+        """Use the shared browser during a call, starting it with `pool_size` pages for calls only if needed.
+
+        A browser started this way is closed when the last call using it
+        leaves, so concurrent calls (e.g. from many threads) share it.
+        """
+        async with self.__get_start_lock():
+            if self.__browser is None:
+                await self.__launch(pool_size)
+                self.__call_scoped = True
+            self.__users += 1
+        try:
+            yield
+        finally:
+            async with self.__get_start_lock():
+                self.__users -= 1
+                if not self.__users and self.__call_scoped:
+                    await self.close_async()
+
+    def __get_start_lock(self) -> asyncio.Lock:
+        """Get the lock of starting and closing the shared browser, created on the event loop using it."""
+        if self.__start_lock is None:
+            self.__start_lock = asyncio.Lock()
+        return self.__start_lock
+
+    async def __launch(self, pool_size: int) -> None:
+        """Launch the shared browser and open a pool of `pool_size` warm pages."""
+        self.__playwright = await async_playwright().start()
+        try:
+            self.__browser = await self.__get_browser(self.__playwright)
+            self.__pool = self.__new_pool(self.__browser, pool_size)
+            await self.__with_retries(self.__pool.start)
+        except BaseException:
+            await self.close_async()
+            raise
+
+    def __new_pool(self, browser: Browser | BrowserContext, pool_size: int) -> PagePool:
+        """Create a pool of `pool_size` warm pages of a browser, or fewer if the proxies cannot take them."""
+        capacity = None if self.proxies is None or self.profile_dir is not None else self.proxies.capacity
+        return PagePool(
+            functools.partial(self.__new_page, browser),
+            size=pool_size if capacity is None else min(pool_size, capacity),
+            max_uses=self.page_max_uses,
+            health_check=self.__is_page_healthy if self.page_health_check or self.proxies else None,
+            stats=self.recycle_stats,
+        )
+
+    async def close_async(self) -> None:
+        """Close the shared browser launched by `start_async`."""
+        recycling, self.__recycling = self.__recycling, None
+        if recycling is not None:
+            recycling.cancel()
+            await asyncio.gather(recycling, return_exceptions=True)
+        self.__call_scoped = False
+        pool, self.__pool = self.__pool, None
+        browser, self.__browser = self.__browser, None
+        playwright, self.__playwright = self.__playwright, None
+        last_page, self.__last_page = self.__last_page, None
+        try:
+            if browser is not None:
+                await self.__save_storage_state(browser, last_page)
+            if pool is not None:
+                await pool.close()
+            if browser is not None:
+                await browser.close()
+        finally:
+            for page in list(self.__page_proxies):
+                self.__release_proxy(page)
+            if playwright is not None:
+                await playwright.stop()
 
     def translate(self, script: str) -> str:
         """Translate script.
@@ -91,7 +375,7 @@ class DeepLCLI:
         """
         script = self.__sanitize_script(script)
 
-        return asyncio.run(self.__translate(script))
+        return self.__run(self.__translate(script))
 
     def translate_async(self, script: str) -> Coroutine[Any, Any, str]:
         """Translate script asynchronously.
@@ -110,82 +394,964 @@ class DeepLCLI:
 
         return self.__translate(script)
 
-    async def __translate(self, script: str) -> str:
+    def translate_many(
+        self,
+        scripts: Iterable[str],
+        concurrency: int = 4,
+        *,
+        pack: bool = False,
+    ) -> list[str | Exception]:
+        """Translate many scripts in parallel.
+
+        Args:
+            scripts (Iterable[str]): Scripts to translate.
+            concurrency (int): Maximum number of translations in flight. Default is 4.
+            pack (bool): Send many short scripts in one request. Default is False.
+
+        Returns:
+            list[str | Exception]: Translated script or raised error for each script, in input order.
+
+        Raises:
+            DeepLCLIError: If the concurrency is not positive.
+        """
+        return self.__run(self.translate_many_async(scripts, concurrency, pack=pack))
+
+    async def translate_many_async(
+        self,
+        scripts: Iterable[str],
+        concurrency: int = 4,
+        *,
+        pack: bool = False,
+    ) -> list[str | Exception]:
+        """Translate many scripts in parallel asynchronously.
+
+        Each script is translated on its own page of a shared browser. If the
+        browser is not started yet, one is started with `concurrency` pages
+        until this batch and the calls sharing it meanwhile are done (none if
+        every script is cached); otherwise parallelism is also bounded by
+        `pool_size`. A failed script does not stop the others.
+
+        With `pack`, consecutive single-line scripts are joined with line
+        breaks into requests of up to `max_length` chars, and each translation
+        is split back into lines. A pack whose translation does not split into
+        as many lines as it has scripts is translated again script by script.
+
+        Args:
+            scripts (Iterable[str]): Scripts to translate.
+            concurrency (int): Maximum number of translations in flight. Default is 4.
+            pack (bool): Send many short scripts in one request. Default is False.
+
+        Returns:
+            list[str | Exception]: Translated script or raised error for each script, in input order.
+
+        Raises:
+            DeepLCLIError: If the concurrency is not positive.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be positive (Now: {concurrency})"
+            raise DeepLCLIError(msg)
+
+        scripts = list(scripts)
+        n = sum(map(self.needs_request, scripts))
+        async with self.__using_browser(min(concurrency, n)) if n else contextlib.nullcontext():
+            if pack:
+                return await self.__translate_packed(scripts, concurrency)
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def translate_one(script: str) -> str | Exception:
+                async with semaphore:
+                    return await self.__translate_or_error(script)
+
+            return list(await asyncio.gather(*(translate_one(script) for script in scripts)))
+
+    async def __translate_packed(self, scripts: list[str], concurrency: int) -> list[str | Exception]:
+        """Translate scripts with packing, falling back to one request per script."""
+        packable = [i for i, script in enumerate(scripts) if is_packable(script) and self.needs_request(script)]
+        packs = [
+            [packable[j] for j in pack]
+            # Budget the packs by the escaped text filled into the page
+            for pack in pack_segments([scripts[i] for i in packable], self.max_length, lambda s: len(_escape(s)))
+            if len(pack) > 1
+        ]
+        singles = sorted(set(range(len(scripts))).difference(*packs))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def translate_one(script: str, *, cached: bool) -> str | Exception:
+            async with semaphore:
+                return await self.__translate_or_error(script, cached=cached)
+
+        # A pack is never looked up again, so it is sent around the cache, which gets its segments instead
+        responses = await asyncio.gather(
+            *(translate_one(join_segments([scripts[i] for i in pack]), cached=False) for pack in packs),
+            *(translate_one(scripts[i], cached=True) for i in singles),
+        )
+
+        results: list[str | Exception] = [""] * len(scripts)
+        unpacked: list[int] = []
+        for pack, res in zip(packs, responses, strict=False):
+            parts = split_segments(res, len(pack)) if isinstance(res, str) else None
+            if parts is None:
+                unpacked.extend(pack)
+                continue
+            for i, part in zip(pack, parts, strict=True):
+                results[i] = part
+                if self.cache is not None:
+                    self.cache.set(self.fr_lang, self.to_lang, self.__sanitize_script(scripts[i]), part)
+        for i, res in zip(singles, responses[len(packs) :], strict=True):
+            results[i] = res
+
+        responses = await self.translate_many_async([scripts[i] for i in unpacked], concurrency)
+        for i, res in zip(unpacked, responses, strict=True):
+            results[i] = res
+
+        return results
+
+    def translate_stream(self, scripts: Iterable[str], concurrency: int = 4) -> Iterator[str | Exception]:
+        """Translate scripts as they arrive and yield the results in order.
+
+        See `translate_stream_async`.
+
+        Args:
+            scripts (Iterable[str]): Scripts to translate. It may block, e.g. lines of stdin.
+            concurrency (int): Maximum number of scripts in flight. Default is 4.
+
+        Yields:
+            str | Exception: Translated script or raised error for each script, in input order.
+
+        Raises:
+            DeepLCLIError: If the concurrency is not positive.
+        """
+        results = self.translate_stream_async(scripts, concurrency)
+        try:
+            with contextlib.suppress(StopAsyncIteration):
+                while True:
+                    yield self.__run(anext(results))
+        finally:
+            self.__run(results.aclose())
+
+    async def translate_stream_async(
+        self,
+        scripts: Iterable[str] | AsyncIterable[str],
+        concurrency: int = 4,
+    ) -> AsyncGenerator[str | Exception, None]:
+        """Translate scripts as they arrive and yield the results in order asynchronously.
+
+        Scripts are read ahead while at most `concurrency` of them are in flight
+        or waiting to be yielded, so memory stays flat on endless input. A
+        synchronous iterable is read in a worker thread so that a blocking
+        source does not stall the translations. If the browser is not started
+        yet, one is started with `concurrency` pages on the first script that
+        is not cached, until the input ends. Closing the generator early
+        cancels the scripts in flight and stops reading.
+
+        Args:
+            scripts (Iterable[str] | AsyncIterable[str]): Scripts to translate.
+            concurrency (int): Maximum number of scripts in flight. Default is 4.
+
+        Yields:
+            str | Exception: Translated script or raised error for each script, in input order.
+
+        Raises:
+            DeepLCLIError: If the concurrency is not positive.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be positive (Now: {concurrency})"
+            raise DeepLCLIError(msg)
+
+        slots = asyncio.Semaphore(concurrency)
+        tasks: asyncio.Queue[asyncio.Future[str | Exception] | None] = asyncio.Queue()
+        browser = contextlib.AsyncExitStack()
+
+        async def produce() -> None:
+            using = False
+            try:
+                async for script in iterate_in_thread(scripts):
+                    # The slot is given back once the result is yielded
+                    await slots.acquire()
+                    if not using and self.needs_request(script):
+                        using = True
+                        await browser.enter_async_context(self.__using_browser(concurrency))
+                    await tasks.put(asyncio.ensure_future(self.__translate_or_error(script)))
+            finally:
+                await tasks.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while (task := await tasks.get()) is not None:
+                yield await task
+                slots.release()
+            await producer
+        finally:
+            producer.cancel()
+            pending: list[asyncio.Future[Any]] = [producer]
+            while not tasks.empty():
+                if (task := tasks.get_nowait()) is not None:
+                    task.cancel()
+                    pending.append(task)
+            await asyncio.gather(*pending, return_exceptions=True)
+            await browser.aclose()
+
+    def translate_as_completed(
+        self,
+        scripts: Iterable[str],
+        concurrency: int = 4,
+        deadline: int | None = None,
+    ) -> Generator[tuple[int, str | Exception], None, None]:
+        """Translate many scripts in parallel and yield each result as soon as it is ready.
+
+        See `translate_as_completed_async`. Closing the iterator (e.g. leaving
+        a `for` loop early) cancels the scripts still in flight.
+
+        Args:
+            scripts (Iterable[str]): Scripts to translate.
+            concurrency (int): Maximum number of translations in flight. Default is 4.
+            deadline (int | None): Deadline of each script in milliseconds. Default is no deadline.
+
+        Yields:
+            tuple[int, str | Exception]: Index of a script and its translation or raised error, in completion order.
+
+        Raises:
+            DeepLCLIError: If the concurrency is not positive.
+        """
+        results = self.translate_as_completed_async(scripts, concurrency, deadline)
+        try:
+            with contextlib.suppress(StopAsyncIteration):
+                while True:
+                    yield self.__run(anext(results))
+        finally:
+            self.__run(results.aclose())
+
+    async def translate_as_completed_async(
+        self,
+        scripts: Iterable[str],
+        concurrency: int = 4,
+        deadline: int | None = None,
+    ) -> AsyncGenerator[tuple[int, str | Exception], None]:
+        """Translate many scripts in parallel and yield each result as soon as it is ready asynchronously.
+
+        Unlike `translate_many_async`, a slow script does not hold back the
+        others, so latency-sensitive callers can use partial results. Each
+        script gets `deadline` milliseconds from when it takes one of the
+        `concurrency` slots, after which it is cancelled and yielded as a
+        `DeepLCLITimeoutError`. Closing the generator (e.g. breaking out of
+        `async for`) or cancelling the task iterating it cancels the scripts
+        still in flight and waits until their pages are given back, so they
+        do not keep working in the background. If the browser is not started
+        yet, one is started for this call only and closed the same way.
+
+        Args:
+            scripts (Iterable[str]): Scripts to translate.
+            concurrency (int): Maximum number of translations in flight. Default is 4.
+            deadline (int | None): Deadline of each script in milliseconds. Default is no deadline.
+
+        Yields:
+            tuple[int, str | Exception]: Index of a script and its translation or raised error, in completion order.
+
+        Raises:
+            DeepLCLIError: If the concurrency is not positive.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be positive (Now: {concurrency})"
+            raise DeepLCLIError(msg)
+
+        scripts = list(scripts)
+        n = sum(map(self.needs_request, scripts))
+        async with self.__using_browser(min(concurrency, n)) if n else contextlib.nullcontext():
+            semaphore = asyncio.Semaphore(concurrency)
+            results: asyncio.Queue[tuple[int, str | Exception]] = asyncio.Queue()
+
+            async def translate_one(i: int, script: str) -> None:
+                async with semaphore:
+                    results.put_nowait((i, await self.__translate_or_error(script, deadline)))
+
+            tasks = [asyncio.ensure_future(translate_one(i, script)) for i, script in enumerate(scripts)]
+            try:
+                for _ in tasks:
+                    yield await results.get()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def translate_document(self, script: str, concurrency: int = 4) -> str:
+        """Translate script of any length.
+
+        Script longer than `max_length` is split on paragraph and sentence
+        boundaries, the chunks are translated in parallel, and the
+        translations are joined with the original whitespace.
+
+        Args:
+            script (str): Script to translate.
+            concurrency (int): Maximum number of chunks in flight. Default is 4.
+
+        Returns:
+            str: Translated script.
+
+        Raises:
+            DeepLCLIError: If the script is empty.
+            DeepLCLIPageLoadError: If the page load fails.
+        """
+        return self.__run(self.translate_document_async(script, concurrency))
+
+    async def translate_document_async(self, script: str, concurrency: int = 4) -> str:
+        """Translate script of any length asynchronously.
+
+        See `translate_document`.
+
+        Args:
+            script (str): Script to translate.
+            concurrency (int): Maximum number of chunks in flight. Default is 4.
+
+        Returns:
+            str: Translated script.
+
+        Raises:
+            DeepLCLIError: If the script is empty.
+            DeepLCLIPageLoadError: If the page load fails.
+        """
+        chunks, separators = split_text(script.rstrip("\n"), self.max_length)
+        if not chunks:
+            msg = "Script seems to be empty."
+            raise DeepLCLIError(msg)
+
+        results = await self.translate_many_async(chunks, concurrency)
+        for res in results:
+            if isinstance(res, Exception):
+                raise res
+
+        return join_text([str(res) for res in results], separators)
+
+    def translate_to_many(
+        self,
+        script: str,
+        to_langs: Iterable[str],
+        concurrency: int = 4,
+    ) -> dict[str, str | Exception]:
+        """Translate script into many target languages.
+
+        See `translate_to_many_async`.
+
+        Args:
+            script (str): Script to translate.
+            to_langs (Iterable[str]): Target languages.
+            concurrency (int): Maximum number of pages in use. Default is 4.
+
+        Returns:
+            dict[str, str | Exception]: Translated script or raised error for each target language.
+
+        Raises:
+            DeepLCLIError: If the script is empty or too long, a language is not valid,
+                or the concurrency is not positive.
+        """
+        return self.__run(self.translate_to_many_async(script, to_langs, concurrency))
+
+    async def translate_to_many_async(
+        self,
+        script: str,
+        to_langs: Iterable[str],
+        concurrency: int = 4,
+    ) -> dict[str, str | Exception]:
+        """Translate script into many target languages asynchronously.
+
+        The target languages are shared out to up to `concurrency` pages of
+        one browser. Each page fills in the script once and then only switches
+        its target language, so a language costs one translation instead of a
+        page load. `to_lang` is ignored except that pages go back to it
+        afterwards. Cached translations are looked up for each language. If the
+        browser is not started yet, one is started for this call only.
+
+        Args:
+            script (str): Script to translate.
+            to_langs (Iterable[str]): Target languages.
+            concurrency (int): Maximum number of pages in use. Default is 4.
+
+        Returns:
+            dict[str, str | Exception]: Translated script or raised error for each target language, in input order.
+
+        Raises:
+            DeepLCLIError: If the script is empty or too long, a language is not valid,
+                or the concurrency is not positive.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be positive (Now: {concurrency})"
+            raise DeepLCLIError(msg)
+        to_langs = list(dict.fromkeys(to_langs))
+        for lang in to_langs:
+            if lang not in TO_LANGS:
+                raise DeepLCLIError(
+                    f"{lang!r} is not valid language. Valid language:\n" + repr(TO_LANGS),
+                )
+        script = self.__sanitize_script(script)
+
+        results: dict[str, str | Exception] = {}
+        for lang in to_langs:
+            res = None if self.cache is None else self.cache.get(self.fr_lang, lang, script)
+            if res is not None:
+                results[lang] = res
+        pending = [lang for lang in to_langs if lang not in results]
+
+        if pending:
+            async with self.__using_browser(min(concurrency, len(pending))):
+                await self.__translate_to_langs(script, pending, concurrency, results)
+
+        return {lang: results[lang] for lang in to_langs}
+
+    async def __translate_to_langs(
+        self,
+        script: str,
+        to_langs: list[str],
+        concurrency: int,
+        results: dict[str, str | Exception],
+    ) -> None:
+        """Translate script into languages on pages of the pool, storing the results."""
+        if self.__pool is None:
+            msg = "Browser is not started."
+            raise DeepLCLIError(msg)
+        queue = deque(to_langs)
+
+        async def work() -> None:
+            async with contextlib.AsyncExitStack() as stack:
+                page = await self.__checkout(stack)
+                previous: str | None = None
+
+                async def translate(lang: str) -> str:
+                    nonlocal previous
+                    try:
+                        if previous is None:
+                            await self.__select_language(page, "target", lang)
+                            return await self.__translate_on_page(page, script, lang)
+                        return await self.__retranslate_on_page(page, lang, previous)
+                    except BaseException:
+                        previous = None
+                        raise
+
+                try:
+                    while queue:
+                        lang = queue.popleft()
+                        try:
+                            res = await self.__with_retries(functools.partial(translate, lang))
+                        except Exception as e:  # noqa: BLE001
+                            results[lang] = e
+                            continue
+                        results[lang] = previous = res
+                        if self.cache is not None:
+                            self.cache.set(self.fr_lang, lang, script, res)
+                finally:
+                    await self.__reset_page(page)
+
+        await asyncio.gather(*(work() for _ in range(min(concurrency, len(to_langs)))))
+        self.__schedule_memory_check()
+
+    async def __reset_page(self, page: Page) -> None:
+        """Put a page back on the language pair of the pool without triggering a translation, or close it if it fails.
+
+        A closed page is discarded by the pool when it is given back.
+        """
+        try:
+            await page.fill(SOURCE_TEXTBOX, "")
+            await self.__select_language(page, "target", self.to_lang)
+        except Exception:  # noqa: BLE001
+            with contextlib.suppress(PlaywrightError):
+                await page.close()
+
+    async def __checkout(self, stack: contextlib.AsyncExitStack) -> Page:
+        """Check out a warm page until `stack` exits, waiting on the new pool if the browser is restarted meanwhile."""
+        pool = self.__pool
+        if pool is None:
+            msg = "Browser is closed."
+            raise DeepLCLIError(msg)
+        try:
+            return await stack.enter_async_context(pool.page())
+        except RuntimeError:
+            if not pool.is_closed or self.__pool is pool:
+                raise
+        return await self.__checkout(stack)
+
+    def __schedule_memory_check(self) -> None:
+        """Check the memory of the shared browser in the background, at most every `memory_check_interval` seconds."""
+        now = time.monotonic()
+        if (
+            self.max_memory is None
+            or self.__recycling is not None
+            or now - self.__memory_checked < self.memory_check_interval
+        ):
+            return
+        self.__memory_checked = now
+        self.__recycling = asyncio.ensure_future(self.__check_memory())
+
+    async def __check_memory(self) -> None:
+        """Restart the shared browser if it uses more than `max_memory`."""
+        try:
+            browser = self.__browser
+            if browser is None or self.max_memory is None:
+                return
+            self.recycle_stats.rss = rss = await browser_rss(browser)
+            if rss is not None and rss > self.max_memory * 2**20:
+                await self.__restart_browser()
+        except Exception:  # noqa: BLE001, S110
+            # Keep translating on the current browser, and try again at the next check
+            pass
+        finally:
+            self.__recycling = None
+
+    async def __restart_browser(self) -> None:
+        """Replace the shared browser with a new one, and close the old one once the pages in use are given back.
+
+        With `profile_dir`, only the pages are replaced, since a profile can be used by one browser at a time.
+        """
+        old_browser, old_pool = self.__browser, self.__pool
+        if old_browser is None or old_pool is None or self.__playwright is None:
+            return
+        await self.__save_storage_state(old_browser, self.__last_page)
+        browser = old_browser if self.profile_dir is not None else await self.__get_browser(self.__playwright)
+        pool = self.__new_pool(browser, old_pool.size)
+        try:
+            await self.__with_retries(pool.start)
+        except BaseException:
+            await pool.close()
+            if browser is not old_browser:
+                await browser.close()
+            raise
+        self.__browser, self.__pool = browser, pool
+        self.recycle_stats.browser_restarts += 1
+        try:
+            await old_pool.drain()
+        finally:
+            if browser is not old_browser:
+                await old_browser.close()
+
+    async def __translate_or_error(
+        self,
+        script: str,
+        deadline: int | None = None,
+        *,
+        cached: bool = True,
+    ) -> str | Exception:
+        """Translate script within `deadline` milliseconds if any, returning the raised error instead of raising it.
+
+        Without `cached`, the cache is neither looked up nor updated.
+        """
+        try:
+            translation = (
+                self.translate_async(script)
+                if cached
+                else self.__translate(self.__sanitize_script(script), cached=False)
+            )
+            if deadline is None:
+                return await translation
+            return await asyncio.wait_for(translation, deadline / 1000)
+        except asyncio.TimeoutError:
+            return DeepLCLITimeoutError(f"Translation did not finish within {deadline}ms.")
+        except Exception as e:  # noqa: BLE001
+            return e
+
+    def __run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background event loop, starting the loop if needed."""
+        with self.__loop_lock:
+            if self.__loop is None or not self.__loop.is_running:
+                self.__loop = LoopThread(f"deepl-{self.fr_lang}-{self.to_lang}")
+                # Stop the thread when this instance is dropped without `close`
+                self.__loop_finalizer = weakref.finalize(self, self.__loop.stop, wait=False)
+            loop = self.__loop
+        return loop.run(coro)
+
+    async def __translate(self, script: str, *, cached: bool = True) -> str:
+        """Translate script, recording its timings in `last_timings` and passing them to `on_timings`."""
+        timings = Timings()
+        try:
+            with timings.activate():
+                if not cached:
+                    return await self.__with_retries(functools.partial(self.__request, script))
+                return await self.__translate_cached(script)
+        finally:
+            self.last_timings = timings
+            if self.on_timings is not None:
+                self.on_timings(timings)
+
+    async def __translate_cached(self, script: str) -> str:
+        """Look up the cache, or throw a request and store its result."""
+        if self.cache is None:
+            return await self.__with_retries(functools.partial(self.__request, script))
+
+        with measure("cache"):
+            res = self.cache.get(self.fr_lang, self.to_lang, script)
+        if res is not None:
+            set_source("cache")
+            return res
+
+        res = await self.__with_retries(functools.partial(self.__request, script))
+        # A cache that stays locked (e.g. by other processes) must not lose a finished translation
+        with measure("cache"), contextlib.suppress(sqlite3.OperationalError):
+            self.cache.set(self.fr_lang, self.to_lang, script, res)
+        return res
+
+    async def __with_retries(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Send a request to DeepL when the rate limiter allows, retrying it while DeepL throttles it."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                with measure("rate_limit"):
+                    await self.rate_limiter.acquire()
+            try:
+                res = await request()
+            except DeepLCLIThrottledError as e:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_throttled(e.retry_after)
+                if attempt >= self.retry.retries:
+                    raise
+                with measure("backoff"):
+                    await asyncio.sleep(self.retry.delay(attempt, e.retry_after))
+                attempt += 1
+                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_success()
+            return res
+
+    async def __request(self, script: str) -> str:
         """Throw a request."""
+        if self.__pool is not None:
+            async with contextlib.AsyncExitStack() as stack:
+                with measure("acquire"):
+                    page = await self.__checkout(stack)
+                self.__last_page = page
+                try:
+                    return await self.__translate_on_page(page, script)
+                finally:
+                    await self.__save_trace(page)
+                    self.__schedule_memory_check()
+
         async with async_playwright() as p:
-            browser = await self.__get_browser(p)
+            with measure("launch"):
+                browser = await self.__get_browser(p)
+            try:
+                page = await self.__new_page(browser)
+                try:
+                    return await self.__translate_on_page(page, script)
+                finally:
+                    await self.__save_trace(page)
+                    await self.__save_storage_state(browser, page)
+                    self.__release_proxy(page)
+            finally:
+                await browser.close()
 
+    async def __new_page(self, browser: Browser | BrowserContext) -> Page:
+        """Open the translator with the language pair selected, through a proxy of `proxies` if any."""
+        if not isinstance(browser, Browser):
             page = await browser.new_page()
+        else:
+            state = self.storage_state
+            proxy = None if self.proxies is None else await self.proxies.acquire()
+            try:
+                page = await browser.new_page(
+                    storage_state=state if state is not None and await asyncio.to_thread(Path(state).is_file) else None,
+                    proxy=proxy,
+                )
+            except BaseException:
+                if self.proxies is not None and proxy is not None:
+                    self.proxies.release(proxy)
+                raise
+            if proxy is not None:
+                self.__page_proxies[page] = proxy
+                page.once("close", lambda _: self.__release_proxy(page))
+        try:
+            if self.trace is not None:
+                # Pages of a persistent profile share one context, which may be tracing already
+                with contextlib.suppress(PlaywrightError):
+                    await page.context.tracing.start(screenshots=True, snapshots=True)
             page.set_default_timeout(self.timeout)
             await page.set_viewport_size({"width": 1920, "height": 1080})
-            excluded_resources = ["image", "media", "font", "other"]
+            self.resource_stats.page_loads += 1
             await page.route(
                 "**/*",
-                lambda route: route.abort() if route.request.resource_type in excluded_resources else route.continue_(),
+                functools.partial(
+                    handle_route,
+                    policy=self.resources,
+                    asset_cache=self.asset_cache,
+                    stats=self.resource_stats,
+                ),
             )
+            with measure("goto"):
+                await self.__load_translator(page)
+            with measure("select_languages"):
+                await self.__select_languages(page)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                self.__record_proxy(page, ok=False)
+            await page.close()
+            raise
 
-            url = "https://www.deepl.com/en/translator"
+        return page
 
-            async with page.expect_response(lambda resp: resp.url == url and resp.request.method == "GET") as resp_info:
-                await page.goto(url)
+    async def __save_storage_state(self, browser: Browser | BrowserContext, page: Page | None = None) -> None:
+        """Save the cookies and local storage to `storage_state`.
 
-            response = await resp_info.value
+        They are taken from `page` (e.g. the last one used) if it is still open,
+        or else from the newest live context of `browser`, since pages may have
+        been recycled or discarded.
+        """
+        if self.storage_state is None:
+            return
+        contexts = [page.context] if page is not None and not page.is_closed() else []
+        if isinstance(browser, Browser):
+            contexts.extend(reversed(browser.contexts))
+        path = Path(self.storage_state)
+        for context in contexts:
+            try:
+                await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+                await context.storage_state(path=path)
+            except PlaywrightError:
+                continue
+            return
 
-            if not response.ok:
-                error_text = await page.inner_text("body > main > div > p")
+    async def __save_trace(self, page: Page) -> None:
+        """Save the trace recorded on a page since its creation or previous save, and keep recording."""
+        if self.trace is None:
+            return
+        with contextlib.suppress(PlaywrightError):
+            await page.context.tracing.stop_chunk(path=self.trace)
+            await page.context.tracing.start_chunk()
 
-                msg = f"Page loading failed with status code {response.status}: {error_text}"
-                raise DeepLCLIError(msg)
+    async def __load_translator(self, page: Page) -> None:
+        """Navigate to the translator page."""
+        url = self.url
 
-            try:
-                page.get_by_role("main")
-            except PlaywrightError as e:
-                msg = f"Maybe Time limit exceeded. ({self.timeout} ms)"
-                raise DeepLCLIPageLoadError(msg) from e
+        async with page.expect_response(lambda resp: resp.url == url and resp.request.method == "GET") as resp_info:
+            # The fragment presets the language pair, which `__select_languages` then only has to verify
+            await page.goto(f"{url}#{self.fr_lang}/{self.to_lang}/")
 
-            await page.locator(
-                "button[data-testid=translator-source-lang-btn]",
-            ).dispatch_event("click")
+        response = await resp_info.value
 
-            await (
-                page.get_by_test_id("translator-source-lang-list")
-                .get_by_test_id(
-                    f"translator-lang-option-{self.fr_lang}",
-                )
-                .first.dispatch_event("click")
-            )
+        if is_retryable_status(response.status):
+            msg = f"Page loading failed with status code {response.status}"
+            raise DeepLCLIThrottledError(msg, response.status, parse_retry_after(response.headers.get("retry-after")))
+        if not response.ok:
+            error_text = await page.inner_text("body > main > div > p")
 
-            await page.locator(
-                "button[data-testid=translator-target-lang-btn]",
-            ).dispatch_event("click")
+            msg = f"Page loading failed with status code {response.status}: {error_text}"
+            raise DeepLCLIError(msg)
 
-            await (
-                page.get_by_test_id("translator-target-lang-list")
-                .get_by_test_id(
-                    f"translator-lang-option-{self.to_lang}",
-                )
-                .first.dispatch_event("click")
+        try:
+            page.get_by_role("main")
+        except PlaywrightError as e:
+            msg = f"Maybe Time limit exceeded. ({self.timeout} ms)"
+            raise DeepLCLIPageLoadError(msg) from e
+
+    async def __select_languages(self, page: Page) -> None:
+        """Select the language pair with the dropdowns, skipping the sides that already show it."""
+        source, target = await page.evaluate(
+            """
+            ['source', 'target'].map(
+                (side) => document.querySelector(`[data-testid=translator-${side}-input]`)?.getAttribute('lang')
             )
+            """,
+        )
+        if not is_selected(source, self.fr_lang, FR_LANGS):
+            await self.__click_language(page, "source", self.fr_lang)
+        if not is_selected(target, self.to_lang, TO_LANGS):
+            await self.__click_language(page, "target", self.to_lang)
+
+    @classmethod
+    async def __select_language(cls, page: Page, side: str, lang: str) -> None:
+        """Select the language of the `source` or `target` dropdown, unless it already shows it."""
+        selected = await page.locator(f"[data-testid=translator-{side}-input]").get_attribute("lang")
+        if not is_selected(selected, lang, FR_LANGS if side == "source" else TO_LANGS):
+            await cls.__click_language(page, side, lang)
+
+    @staticmethod
+    async def __click_language(page: Page, side: str, lang: str) -> None:
+        """Select the language of the `source` or `target` dropdown by clicking its option."""
+        await page.locator(
+            f"button[data-testid=translator-{side}-lang-btn]",
+        ).dispatch_event("click")
 
-            await page.fill(
-                "[data-testid=translator-source-input] div[role=textbox]",
-                script,
+        await (
+            page.get_by_test_id(f"translator-{side}-lang-list")
+            .get_by_test_id(
+                f"translator-lang-option-{lang}",
             )
+            .first.dispatch_event("click")
+        )
+
+    async def __translate_on_page(self, page: Page, script: str, to_lang: str | None = None) -> str:
+        """Fill the script in a page made by `__new_page` and read the translation.
+
+        `to_lang` is the target language selected on the page, if it is not `self.to_lang`.
+        """
+        # A warm page still holds the previous translation, so clear it first
+        with measure("clear"):
+            await self.__clear_translation(page)
+
+        async def fill() -> None:
+            with measure("fill"):
+                await page.fill(SOURCE_TEXTBOX, script)
 
+        return await self.__read_translation(page, fill, to_lang or self.to_lang)
+
+    async def __retranslate_on_page(self, page: Page, to_lang: str, previous: str) -> str:
+        """Select another target language on a page showing the translation `previous`, and read the new one."""
+        return await self.__read_translation(
+            page,
+            functools.partial(self.__select_language, page, "target", to_lang),
+            to_lang,
+            previous,
+        )
+
+    async def __read_translation(
+        self,
+        page: Page,
+        trigger: Callable[[], Awaitable[None]],
+        to_lang: str,
+        previous: str = "",
+    ) -> str:
+        """Run `trigger` to start a translation on a page, and read the translation that replaces `previous`."""
+        responses: asyncio.Queue[Response] = asyncio.Queue()
+
+        def on_response(response: Response) -> None:
+            if is_translation_url(response.url):
+                responses.put_nowait(response)
+
+        page.on("response", on_response)
+        start = time.perf_counter()
+        try:
+            # A new translation may render the same text as `previous`, so count the responses to tell them apart
+            responses_before = await self.__count_translation_responses(page) if previous else 0
+            await trigger()
+
+            # Take whichever comes first: the backend response or the rendered result
+            response_task = asyncio.ensure_future(self.__read_translation_response(responses))
+            dom_task = asyncio.ensure_future(self.__read_translation_dom(page, previous, responses_before))
             try:
+                done, _ = await asyncio.wait({response_task, dom_task}, return_when=asyncio.FIRST_COMPLETED)
+                if response_task in done:
+                    res, source_lang = response_task.result()
+                    self.translated_fr_lang = source_lang or self.fr_lang
+                    self.translated_to_lang = to_lang.partition("-")[0]
+                    set_source("backend")
+                else:
+                    res = dom_task.result()
+                    set_source("page")
+            finally:
+                response_task.cancel()
+                dom_task.cancel()
+        except DeepLCLIThrottledError:
+            self.__record_proxy(page, ok=False)
+            # Empty the source so that the next attempt on this page triggers a new translation
+            with contextlib.suppress(PlaywrightError):
+                await page.fill(SOURCE_TEXTBOX, "")
+            raise
+        except Exception:
+            self.__record_proxy(page, ok=False)
+            raise
+        finally:
+            page.remove_listener("response", on_response)
+
+        self.__record_proxy(page, ok=True, latency=time.perf_counter() - start)
+        return res
+
+    def __record_proxy(self, page: Page, *, ok: bool, latency: float | None = None) -> None:
+        """Record the outcome of a translation or page load for the proxy of a page."""
+        proxy = self.__page_proxies.get(page, self.__browser_proxy)
+        if self.proxies is not None and proxy is not None:
+            self.proxies.record(proxy, ok=ok, latency=latency)
+
+    def __release_proxy(self, page: Page) -> None:
+        """Give back the proxy slot of a page, once."""
+        proxy = self.__page_proxies.pop(page, None)
+        if self.proxies is not None and proxy is not None:
+            self.proxies.release(proxy)
+
+    async def __clear_translation(self, page: Page) -> None:
+        """Clear the source text if a previous translation is shown, and wait for the translation to go."""
+        if not await self.__get_translation(page):
+            return
+
+        await page.fill(SOURCE_TEXTBOX, "")
+        try:
+            await page.wait_for_function(
+                """
+                () => !document.querySelector(
+                'd-textarea[aria-labelledby=translation-target-heading]')?.value
+                """,
+                timeout=self.timeout,
+            )
+        except PlaywrightError as e:
+            msg = f"Unable to clear previous translation in {self.timeout} ms"
+            raise DeepLCLIPageLoadError(msg) from e
+
+    @staticmethod
+    async def __read_translation_response(responses: asyncio.Queue[Response]) -> tuple[str, str | None]:
+        """Wait for a backend response holding a complete translation, or raise if DeepL throttled it."""
+        with measure("wait_response"):
+            while True:
+                response = await responses.get()
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if is_retryable_status(response.status):
+                    msg = f"Translation failed with status code {response.status}"
+                    raise DeepLCLIThrottledError(msg, response.status, retry_after)
+                try:
+                    body = await response.json()
+                except (PlaywrightError, ValueError):
+                    continue
+                if is_throttled(body):
+                    msg = "Too many requests"
+                    raise DeepLCLIThrottledError(msg, response.status, retry_after)
+                parsed = parse_translation(body)
+                if parsed is not None:
+                    return parsed
+
+    @staticmethod
+    async def __count_translation_responses(page: Page) -> int:
+        """Count the translation responses a page has received since it started being counted."""
+        return await page.evaluate(
+            """
+            (methods) => {
+                if (window.__deeplCliResponses === undefined) {
+                    window.__deeplCliResponses = 0;
+                    new PerformanceObserver((list) => {
+                        for (const entry of list.getEntries()) {
+                            const url = new URL(entry.name);
+                            if (url.pathname.endsWith('/jsonrpc') && methods.includes(url.searchParams.get('method'))) {
+                                window.__deeplCliResponses++;
+                            }
+                        }
+                    }).observe({type: 'resource'});
+                }
+                return window.__deeplCliResponses;
+            }
+            """,
+            list(TRANSLATION_METHODS),
+        )
+
+    async def __read_translation_dom(self, page: Page, previous: str = "", responses_before: int = 0) -> str:
+        """Wait for a translation to be rendered and read it.
+
+        With `previous`, the translation shown before the trigger, wait until
+        the text changes or a translation response arrives after the
+        `responses_before` counted by `__count_translation_responses`.
+        """
+        try:
+            with measure("wait_rendered"):
                 await page.wait_for_function(
                     """
-                    () => document.querySelector(
-                    'd-textarea[aria-labelledby=translation-target-heading]')?.value?.length > 0
+                    ([previous, responsesBefore]) => {
+                        const elem = document.querySelector('d-textarea[aria-labelledby=translation-target-heading]');
+                        const text = elem?.value ?? '';
+                        const responded = (window.__deeplCliResponses ?? 0) > responsesBefore;
+                        return text.length > 0 && (text !== previous || responded);
+                    }
                     """,
+                    arg=[previous, responses_before],
                     timeout=self.timeout,
                 )
-            except PlaywrightError as e:
-                msg = f"Time limit exceeded. ({self.timeout} ms)"
-                raise DeepLCLIPageLoadError(msg) from e
+        except PlaywrightError as e:
+            msg = f"Time limit exceeded. ({self.timeout} ms)"
+            raise DeepLCLIPageLoadError(msg) from e
 
-            # Wait for translation to complete (check that [...] placeholder is gone)
-            try:
+        # Wait for translation to complete (check that [...] placeholder is gone)
+        try:
+            with measure("wait_complete"):
                 await page.wait_for_function(
                     """
                     () => {
@@ -196,19 +1362,14 @@ class DeepLCLI:
                     """,
                     timeout=self.timeout,
                 )
-            except PlaywrightError as e:
-                msg = f"Translation incomplete after {self.timeout} ms"
-                raise DeepLCLIPageLoadError(msg) from e
+        except PlaywrightError as e:
+            msg = f"Translation incomplete after {self.timeout} ms"
+            raise DeepLCLIPageLoadError(msg) from e
 
+        with measure("read"):
             # Get the translated text directly from the value attribute
             try:
-                res = await page.evaluate(
-                    """
-                    document.querySelector(
-                        'd-textarea[aria-labelledby=translation-target-heading]'
-                    ).value
-                    """,
-                )
+                res = await self.__get_translation(page)
             except PlaywrightError as e:
                 msg = "Unable to get translated text"
                 raise DeepLCLIPageLoadError(msg) from e
@@ -223,9 +1384,34 @@ class DeepLCLI:
                 await output_textbox.get_attribute("lang"),
             ).split("-")[0]
 
-            await browser.close()
+        return res
 
-            return res
+    @staticmethod
+    async def __get_translation(page: Page) -> str:
+        """Read the current value of the target textarea."""
+        return await page.evaluate(
+            """
+            document.querySelector(
+                'd-textarea[aria-labelledby=translation-target-heading]'
+            )?.value ?? ''
+            """,
+        )
+
+    async def __is_page_healthy(self, page: Page) -> bool:
+        """Check that the proxy of a warm page is not failing, and that the page still shows the translator."""
+        proxy = self.__page_proxies.get(page)
+        if self.proxies is not None and proxy is not None and not self.proxies.is_available(proxy):
+            return False
+        if not self.page_health_check:
+            return True
+        # One round trip, so that the check adds little to each checkout
+        return await page.evaluate(
+            """
+            (source) => document.querySelector(source) !== null
+                && document.querySelector('d-textarea[aria-labelledby=translation-target-heading]') !== null
+            """,
+            SOURCE_TEXTBOX,
+        )
 
     def __sanitize_script(self, script: str) -> str:
         """Check command line args and stdin."""
@@ -239,21 +1425,51 @@ class DeepLCLI:
             msg = "Script seems to be empty."
             raise DeepLCLIError(msg)
 
-        return script.replace("/", r"\/").replace("|", r"\|")
-
-    async def __get_browser(self, p: Playwright) -> Browser:
-        """Launch browser executable and get playwright browser object."""
-        install([p.chromium], with_deps=True)
-
-        return await p.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--single-process" if os.name != "nt" else "",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--no-zygote",
-                "--window-size=1920,1080",
-            ],
-            proxy=self.proxy,
-        )
+        return _escape(script)
+
+    async def __get_browser(self, p: Playwright) -> Browser | BrowserContext:
+        """Launch browser executable and get playwright browser object.
+
+        With `profile_dir`, the browser is a persistent context whose pages share the profile.
+        """
+        if (
+            self.install_browser
+            and not is_install_skipped()
+            # It may download Chromium, so keep the event loop responsive meanwhile
+            and not await asyncio.to_thread(ensure_installed, p.chromium)
+        ):
+            msg = (
+                "Failed to install Chromium. Run `deepl install`, "
+                f"or set ${SKIP_INSTALL_ENV}=1 if it is installed otherwise."
+            )
+            raise DeepLCLIError(msg)
+
+        args = [
+            "--no-sandbox",
+            "--single-process" if os.name != "nt" else "",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--no-zygote",
+            "--window-size=1920,1080",
+        ]
+        proxy = self.proxy
+        if self.proxies is not None and self.profile_dir is not None:
+            # Pages of a persistent profile cannot have their own proxies, so the whole browser uses one
+            proxy = self.__browser_proxy = self.proxies.best()
+        elif self.proxies is not None and os.name == "nt":
+            # Chromium on Windows only applies the proxies of pages if it is launched with one
+            proxy = ProxySettings(server="http://per-context")
+
+        if self.profile_dir is not None:
+            return await p.chromium.launch_persistent_context(
+                self.profile_dir,
+                headless=True,
+                args=args,
+                proxy=proxy,
+            )
+        return await p.chromium.launch(headless=True, args=args, proxy=proxy)
+
+
+def _escape(script: str) -> str:
+    """Escape the characters that the translator would otherwise take as markup."""
+    return script.replace("/", r"\/").replace("|", r"\|")
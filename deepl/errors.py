@@ -0,0 +1,29 @@
+"""Errors raised by DeepLCLI."""
+
+
+class DeepLCLIError(Exception):
+    """Generic error for DeepLCLI."""
+
+
+class DeepLCLIPageLoadError(Exception):
+    """Page load error for DeepLCLI."""
+
+
+class DeepLCLITimeoutError(DeepLCLIError):
+    """Translation did not finish before its deadline."""
+
+
+class DeepLCLIThrottledError(DeepLCLIError):
+    """DeepL throttled or temporarily failed a request, so it may succeed if retried later."""
+
+    def __init__(self, message: str, status: int | None = None, retry_after: float | None = None) -> None:
+        """Initialize DeepLCLIThrottledError.
+
+        Args:
+            message (str): Error message.
+            status (int | None): Response status, if the error came with one.
+            retry_after (float | None): Seconds the server asked to wait, if any.
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
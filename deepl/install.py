@@ -0,0 +1,105 @@
+"""Install the browser used by DeepLCLI once, instead of on every launch."""
+
+import importlib.metadata
+import os
+import threading
+import warnings
+from pathlib import Path
+from typing import TypeVar
+
+from install_playwright import install
+from playwright.async_api import BrowserType as AsyncBrowserType
+from playwright.sync_api import BrowserType as SyncBrowserType
+from playwright.sync_api import sync_playwright
+
+SKIP_INSTALL_ENV = "DEEPL_CLI_SKIP_INSTALL"
+# Translators launching browsers in parallel threads install at most once
+_INSTALL_LOCK = threading.Lock()
+
+BrowserType = TypeVar("BrowserType", AsyncBrowserType, SyncBrowserType)
+
+
+def is_install_skipped() -> bool:
+    """Check if the browser installation is disabled by `$DEEPL_CLI_SKIP_INSTALL`.
+
+    Returns:
+        bool: Whether the installation should be skipped.
+    """
+    return os.environ.get(SKIP_INSTALL_ENV, "") not in ("", "0")
+
+
+def get_stamp_path(browser_name: str) -> Path:
+    """Get the stamp file recording a successful installation.
+
+    The file name contains the Playwright version, so upgrading Playwright
+    invalidates the stamp and the matching browser is installed again.
+
+    Args:
+        browser_name (str): Name of the browser type, e.g. `chromium`.
+
+    Returns:
+        Path: Stamp file path.
+    """
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    version = importlib.metadata.version("playwright")
+    return cache_dir / "deepl-cli" / f"install-{browser_name}-{version}.stamp"
+
+
+def is_installed(browser_type: BrowserType) -> bool:
+    """Check if the browser was installed by `ensure_installed` and still exists.
+
+    Args:
+        browser_type (BrowserType): Browser type to check.
+
+    Returns:
+        bool: Whether the browser is ready to launch.
+    """
+    return get_stamp_path(browser_type.name).is_file() and Path(browser_type.executable_path).exists()
+
+
+def ensure_installed(browser_type: BrowserType, *, force: bool = False) -> bool:
+    """Install the browser and its system dependencies unless already done.
+
+    It blocks while downloading, and may be called from many threads at once.
+    If only the system dependencies fail to install (e.g. without root), the
+    browser is installed without them and a warning is issued, since they
+    may well be present already.
+
+    Args:
+        browser_type (BrowserType): Browser type to install.
+        force (bool): Install even if already installed.
+
+    Returns:
+        bool: Whether the browser is installed.
+    """
+    with _INSTALL_LOCK:
+        if not force and is_installed(browser_type):
+            return True
+
+        if not install([browser_type], with_deps=True, force=force):
+            install([browser_type], force=force)
+            if not Path(browser_type.executable_path).exists():
+                return False
+            warnings.warn(
+                f"Failed to install the system dependencies of {browser_type.name}; launching it may fail.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+        stamp = get_stamp_path(browser_type.name)
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        return True
+
+
+def ensure_chromium_installed(*, force: bool = False) -> bool:
+    """Install Chromium used by DeepLCLI unless already done.
+
+    Args:
+        force (bool): Install even if already installed.
+
+    Returns:
+        bool: succeeded or failed
+    """
+    with sync_playwright() as p:
+        return ensure_installed(p.chromium, force=force)
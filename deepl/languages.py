@@ -134,3 +134,25 @@ TO_LANGS: Final[set[str]] = FR_LANGS | {
     "pt",
     "zh",
 }
+
+
+def is_selected(lang_attr: str | None, lang: str, langs: set[str]) -> bool:
+    """Check if the `lang` attribute of a side of the translator shows that a language is selected.
+
+    The attribute may carry a region, e.g. `ja-JP` for `ja`, unless the
+    region is a language of its own, e.g. `en-GB` among `TO_LANGS`.
+
+    Args:
+        lang_attr (str | None): `lang` attribute of the source or target input, e.g. `ja-JP`.
+        lang (str): Language to look for.
+        langs (set[str]): Languages of that side, i.e. `FR_LANGS` or `TO_LANGS`.
+
+    Returns:
+        bool: Whether no click is needed to select the language.
+    """
+    if not lang_attr:
+        return False
+    attr = lang_attr.lower()
+    if attr == lang.lower():
+        return True
+    return attr not in {v.lower() for v in langs} and attr.partition("-")[0] == lang.lower()
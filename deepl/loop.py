@@ -0,0 +1,118 @@
+"""Bridge synchronous and asynchronous code with threads.
+
+Run coroutines from synchronous code on an event loop in a background thread,
+and iterate synchronous iterables from coroutines without blocking their loop.
+"""
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, AsyncIterable, Coroutine, Iterable
+from typing import Any, TypeVar, cast
+
+from deepl.errors import DeepLCLIError
+
+T = TypeVar("T")
+_DONE = object()
+
+
+async def iterate_in_thread(items: Iterable[T] | AsyncIterable[T]) -> AsyncGenerator[T, None]:
+    """Iterate items asynchronously, reading a synchronous iterable (e.g. stdin) in a worker thread.
+
+    Args:
+        items (Iterable[T] | AsyncIterable[T]): Items to iterate. Asynchronous iterables are iterated as they are.
+
+    Yields:
+        T: Each item.
+    """
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+        return
+
+    it = iter(items)
+    while (item := await asyncio.to_thread(next, it, _DONE)) is not _DONE:
+        yield cast("T", item)
+
+
+class LoopThread:
+    """Event loop running in a daemon thread until `stop` is called.
+
+    Objects bound to an event loop (e.g. a Playwright browser) outlive the
+    synchronous calls that created them, since every call runs on the same
+    loop. `run` may be called from many threads at once, and from code that
+    is already running another event loop.
+    """
+
+    def __init__(self, name: str = "deepl-loop") -> None:
+        """Start the loop and its thread.
+
+        Args:
+            name (str): Name of the thread.
+        """
+        self.loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target=self.__serve, name=name, daemon=True)
+        self.__thread.start()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop still accepts coroutines."""
+        return self.__thread.is_alive() and not self.loop.is_closed()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and wait for its result.
+
+        If the waiting thread is interrupted (e.g. by KeyboardInterrupt), the coroutine is cancelled.
+
+        Args:
+            coro (Coroutine[Any, Any, T]): Coroutine to run.
+
+        Returns:
+            T: Its result.
+
+        Raises:
+            DeepLCLIError: If called from the loop itself, which would wait forever, or the loop is stopped.
+        """
+        if threading.current_thread() is self.__thread:
+            coro.close()
+            msg = "Synchronous methods cannot be called from the event loop running them; await the async ones."
+            raise DeepLCLIError(msg)
+        if not self.is_running:
+            coro.close()
+            msg = "Event loop is stopped."
+            raise DeepLCLIError(msg)
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            # E.g. KeyboardInterrupt while waiting, so that the coroutine stops and gives its page back
+            future.cancel()
+            raise
+
+    def stop(self, *, wait: bool = True) -> None:
+        """Stop the loop after cancelling the coroutines still running on it.
+
+        Args:
+            wait (bool): Wait for the thread to finish. Default is True.
+        """
+        if self.loop.is_closed():
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        except RuntimeError:
+            return
+        if wait and threading.current_thread() is not self.__thread:
+            self.__thread.join()
+
+    def __serve(self) -> None:
+        """Run the loop until stopped, then clean it up and close it."""
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
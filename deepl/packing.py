@@ -0,0 +1,76 @@
+"""Pack many short segments into one request and split the translation back."""
+
+from collections.abc import Callable
+
+SEPARATOR = "\n"
+
+
+def is_packable(segment: str) -> bool:
+    """Check if a segment can share a request with others.
+
+    A packable segment is not blank, has no surrounding whitespace (which would
+    be lost in translation), and contains no `SEPARATOR`.
+
+    Args:
+        segment (str): Segment to check.
+
+    Returns:
+        bool: Whether the segment is packable.
+    """
+    return bool(segment) and segment == segment.strip() and SEPARATOR not in segment
+
+
+def pack_segments(
+    segments: list[str],
+    max_length: int,
+    length: Callable[[str], int] = len,
+) -> list[list[int]]:
+    """Group consecutive segments whose joined length fits in `max_length`.
+
+    Args:
+        segments (list[str]): Packable segments.
+        max_length (int): Maximum length of a joined request.
+        length (Callable[[str], int]): Length of a segment as sent, e.g. after escaping. Default is `len`.
+
+    Returns:
+        list[list[int]]: Indexes of the segments in each pack.
+    """
+    packs: list[list[int]] = []
+    total = 0
+    for i, segment in enumerate(segments):
+        n = length(segment)
+        if packs and total + len(SEPARATOR) + n <= max_length:
+            packs[-1].append(i)
+            total += len(SEPARATOR) + n
+        else:
+            packs.append([i])
+            total = n
+    return packs
+
+
+def join_segments(segments: list[str]) -> str:
+    """Join segments into one request.
+
+    Args:
+        segments (list[str]): Packable segments.
+
+    Returns:
+        str: Joined request.
+    """
+    return SEPARATOR.join(segments)
+
+
+def split_segments(translation: str, n: int) -> list[str] | None:
+    """Split the translation of a joined request back into segments.
+
+    Args:
+        translation (str): Translation of a request made by `join_segments`.
+        n (int): Number of joined segments.
+
+    Returns:
+        list[str] | None: Translated segments, or None if they do not line up with the sources.
+    """
+    parts = [part.strip() for part in translation.strip().split(SEPARATOR)]
+    if len(parts) != n or not all(parts):
+        return None
+    return parts
@@ -0,0 +1,294 @@
+"""Translate a stream of JSON Lines records, each with its own language pair."""
+
+import asyncio
+import contextlib
+import json
+from collections import Counter, OrderedDict
+from collections.abc import AsyncGenerator, Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from deepl.chunking import split_text
+from deepl.errors import DeepLCLIError
+from deepl.languages import FR_LANGS, TO_LANGS
+from deepl.loop import iterate_in_thread
+
+if TYPE_CHECKING:
+    from deepl.deepl import DeepLCLI
+
+
+def parse_record(record: object, fr_lang: str | None = None, to_lang: str | None = None) -> tuple[Any, str, str, str]:
+    """Validate a decoded record such as `{"id": 1, "text": "hello.", "fr": "en", "to": "ja"}`.
+
+    Args:
+        record (object): Decoded JSON of the record.
+        fr_lang (str | None): Source language of a record without `fr`.
+        to_lang (str | None): Target language of a record without `to`.
+
+    Returns:
+        tuple[Any, str, str, str]: Id, text, source language and target language.
+
+    Raises:
+        ValueError: If the record is not an object with an `id` and a string `text`, or a language is not valid.
+    """
+    if not isinstance(record, dict):
+        msg = "Record is not a JSON object."
+        raise ValueError(msg)  # noqa: TRY004
+    if "id" not in record:
+        msg = "Record has no `id`."
+        raise ValueError(msg)
+    text = record.get("text")
+    if not isinstance(text, str):
+        msg = "Record has no string `text`."
+        raise ValueError(msg)  # noqa: TRY004
+
+    fr = record.get("fr", fr_lang)
+    to = record.get("to", to_lang)
+    if fr not in FR_LANGS:
+        msg = f"{fr!r} is not valid source language."
+        raise ValueError(msg)
+    if to not in TO_LANGS:
+        msg = f"{to!r} is not valid target language."
+        raise ValueError(msg)
+    return record["id"], text, fr, to
+
+
+class Checkpoint:
+    """Record of the ids of the records that are already translated.
+
+    It is a file with the JSON of one id per line, appended to as soon as the
+    result of a record is written out, so a restarted run skips finished
+    records and translates again at most the ones in flight. Failed records
+    are not recorded, so they are retried.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize Checkpoint, loading the existing one if any.
+
+        Args:
+            path (str | Path): Checkpoint file.
+        """
+        self.path = Path(path)
+        self.__done: set[str] = set()
+        if not self.path.is_file():
+            return
+        content = self.path.read_text()
+        for line in content.splitlines():
+            with contextlib.suppress(ValueError):
+                self.__done.add(_key(json.loads(line)))
+        if content and not content.endswith("\n"):
+            # The last line was cut off by a crash, so end it before appending
+            with self.path.open("a") as f:
+                f.write("\n")
+
+    def __contains__(self, record_id: object) -> bool:
+        """Check if the record with an id is already translated."""
+        return _key(record_id) in self.__done
+
+    def __len__(self) -> int:
+        """Return the number of translated records."""
+        return len(self.__done)
+
+    def mark_done(self, record_id: object) -> None:
+        """Record a translated record and append it to the file.
+
+        Args:
+            record_id (object): Id of the record.
+        """
+        key = _key(record_id)
+        self.__done.add(key)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as f:
+            f.write(key + "\n")
+
+
+class _Translators:
+    """Translators of each language pair, started on the first script that is not cached.
+
+    At most `max_started` of them run a browser at once. Starting another one
+    closes the least recently used translator without records in flight,
+    waiting for one to become idle if needed.
+    """
+
+    def __init__(
+        self,
+        new_translator: Callable[[str, str], "DeepLCLI"],
+        concurrency: int,
+        max_started: int,
+    ) -> None:
+        """Initialize _Translators."""
+        if max_started < 1:
+            msg = f"Max translators must be positive (Now: {max_started})"
+            raise DeepLCLIError(msg)
+        self.concurrency = concurrency
+        self.max_started = max_started
+        self.__new_translator = new_translator
+        self.__translators: OrderedDict[tuple[str, str], DeepLCLI] = OrderedDict()
+        self.__in_use: Counter[tuple[str, str]] = Counter()
+        self.__starting = asyncio.Lock()
+        self.__idle = asyncio.Condition()
+
+    async def get(self, fr_lang: str, to_lang: str, script: str) -> "DeepLCLI":
+        """Get the translator of a language pair, started if translating script needs its browser."""
+        key = (fr_lang, to_lang)
+        t = self.__translators.get(key)
+        if t is None:
+            t = self.__translators[key] = self.__new_translator(fr_lang, to_lang)
+        self.__translators.move_to_end(key)
+        if not t.is_started and any(t.needs_request(chunk) for chunk in split_text(script, t.max_length)[0]):
+            async with self.__starting:
+                if not t.is_started:
+                    await self.__make_room(key)
+                    await t.start_async()
+        return t
+
+    async def translate(self, record_id: object, script: str, fr_lang: str, to_lang: str) -> dict[str, Any]:
+        """Translate the script of a record with the translator of its language pair, and get its result."""
+        key = (fr_lang, to_lang)
+        self.__in_use[key] += 1
+        try:
+            t = await self.get(fr_lang, to_lang, script)
+            res = await t.translate_document_async(script, self.concurrency) if script.strip() else ""
+        except Exception as e:  # noqa: BLE001
+            return {"id": record_id, "translation": None, "error": str(e) or type(e).__name__}
+        finally:
+            self.__in_use[key] -= 1
+            async with self.__idle:
+                self.__idle.notify_all()
+        return {"id": record_id, "translation": res, "error": None}
+
+    async def close(self) -> None:
+        """Close the browsers of all translators."""
+        translators = list(self.__translators.values())
+        self.__translators.clear()
+        await asyncio.gather(*(t.close_async() for t in translators if t.is_started))
+
+    async def __make_room(self, key: tuple[str, str]) -> None:
+        """Close the least recently used idle translator if `max_started` others are running."""
+        async with self.__idle:
+            while True:
+                running = [k for k, t in self.__translators.items() if t.is_started and k != key]
+                if len(running) < self.max_started:
+                    return
+                idle = [k for k in running if not self.__in_use[k]]
+                if idle:
+                    # Forget it first, so that new records of its pair get a new translator
+                    t = self.__translators.pop(idle[0])
+                    break
+                await self.__idle.wait()
+        await t.close_async()
+
+
+async def translate_jsonl(  # noqa: PLR0913
+    lines: Iterable[str],
+    new_translator: Callable[[str, str], "DeepLCLI"],
+    concurrency: int = 4,
+    checkpoint: Checkpoint | None = None,
+    *,
+    fr_lang: str | None = None,
+    to_lang: str | None = None,
+    max_translators: int = 2,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Translate JSON Lines records as they arrive and yield their results as they are ready.
+
+    Each record is an object with an `id`, a `text` and optionally `fr` and
+    `to`. Records are routed to one translator per language pair, created by
+    `new_translator` and started on the first record that is not cached, so
+    the warm pages of each pair are reused by all its records. At most
+    `max_translators` browsers run at once: starting another one closes the
+    least recently used translator that has no record in flight. At most
+    `concurrency` records are in flight or waiting to be yielded, so memory
+    stays flat on endless input; the lines are read in a worker thread so
+    that a blocking source (e.g. stdin) does not stall the translations.
+
+    Each result is `{"id": ..., "translation": ..., "error": ...}` with
+    either `translation` or `error` set to None. Records in `checkpoint`
+    are skipped, and each successful record is added to it once the caller
+    has handled its result.
+
+    Args:
+        lines (Iterable[str]): JSON Lines. Blank lines are ignored.
+        new_translator (Callable[[str, str], DeepLCLI]): Create a translator for a source and target language.
+        concurrency (int): Maximum number of records in flight. Default is 4.
+        checkpoint (Checkpoint | None): Ids of the records to skip, and to add the translated ones to.
+        fr_lang (str | None): Source language of records without `fr`.
+        to_lang (str | None): Target language of records without `to`.
+        max_translators (int): Maximum number of translators with a running browser. Default is 2.
+
+    Yields:
+        dict[str, Any]: Result of each record, in the order they are ready.
+
+    Raises:
+        DeepLCLIError: If the concurrency or the maximum number of translators is not positive.
+    """
+    if concurrency < 1:
+        msg = f"Concurrency must be positive (Now: {concurrency})"
+        raise DeepLCLIError(msg)
+
+    slots = asyncio.Semaphore(concurrency)
+    results: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    tasks: set[asyncio.Task[None]] = set()
+
+    async with contextlib.AsyncExitStack() as stack:
+        translators = _Translators(new_translator, concurrency, max_translators)
+        stack.push_async_callback(translators.close)
+
+        async def translate(record_id: object, text: str, fr: str, to: str) -> None:
+            await results.put(await translators.translate(record_id, text, fr, to))
+
+        async def produce() -> None:
+            try:
+                async for record_id, job in _read_records(lines, fr_lang, to_lang):
+                    if checkpoint is not None and isinstance(job, tuple) and record_id in checkpoint:
+                        continue
+                    # The slot is given back once the result is yielded
+                    await slots.acquire()
+                    if isinstance(job, str):
+                        await results.put({"id": record_id, "translation": None, "error": job})
+                        continue
+                    task = asyncio.ensure_future(translate(record_id, *job))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                await asyncio.gather(*tasks)
+            finally:
+                await results.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while (res := await results.get()) is not None:
+                yield res
+                slots.release()
+                if checkpoint is not None and res["error"] is None:
+                    checkpoint.mark_done(res["id"])
+            await producer
+        finally:
+            producer.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(producer, *tasks, return_exceptions=True)
+
+
+async def _read_records(
+    lines: Iterable[str],
+    fr_lang: str | None,
+    to_lang: str | None,
+) -> AsyncGenerator[tuple[Any, tuple[str, str, str] | str], None]:
+    """Read JSON Lines in a worker thread, and yield the id of each record with its text and languages, or the error."""
+    n = 0
+    async for line in iterate_in_thread(lines):
+        n += 1
+        if not line.strip():
+            continue
+        record: object = None
+        try:
+            record = json.loads(line)
+            record_id, text, fr, to = parse_record(record, fr_lang, to_lang)
+        except ValueError as e:
+            yield (record.get("id") if isinstance(record, dict) else None), f"line {n}: {e}"
+            continue
+        yield record_id, (text, fr, to)
+
+
+def _key(record_id: object) -> str:
+    """Get the JSON of an id, so that ids of any JSON type can be compared."""
+    return json.dumps(record_id, ensure_ascii=False, sort_keys=True)
@@ -0,0 +1,212 @@
+"""Pool of warm translator pages."""
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+from playwright.async_api._generated import Page
+
+from deepl.recycling import RecycleStats
+
+
+class PagePool:
+    """Keep pre-navigated pages ready to be checked out by translations.
+
+    Pages are created by `factory`, which is expected to return a page that is
+    already on the translator with the language pair selected. A checked out
+    page is returned to the pool after use, recycled after `max_uses`
+    translations, and dropped if it fails the health check. Both are counted
+    in `stats`.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Page]],
+        size: int = 1,
+        max_uses: int | None = None,
+        health_check: Callable[[Page], Awaitable[bool]] | None = None,
+        stats: RecycleStats | None = None,
+    ) -> None:
+        """Initialize PagePool.
+
+        Args:
+            factory (Callable[[], Awaitable[Page]]): Create a new ready-to-use page.
+            size (int): Maximum number of pages. Default is 1.
+            max_uses (int | None): Recycle a page after this many checkouts. Default is no limit.
+            health_check (Callable[[Page], Awaitable[bool]] | None): Check an idle page before checkout.
+            stats (RecycleStats | None): Counters to add recycled and dropped pages to, e.g. shared by pools.
+
+        Raises:
+            ValueError: If `size` or `max_uses` is not positive.
+        """
+        if size < 1:
+            msg = f"Pool size must be positive (Now: {size})"
+            raise ValueError(msg)
+        if max_uses is not None and max_uses < 1:
+            msg = f"Max uses of a page must be positive (Now: {max_uses})"
+            raise ValueError(msg)
+
+        self.size = size
+        self.max_uses = max_uses
+        self.stats = stats or RecycleStats()
+        self.__factory = factory
+        self.__health_check = health_check
+        self.__idle: deque[Page] = deque()
+        self.__uses: dict[Page, int] = {}
+        self.__creating = 0
+        self.__closed = False
+        self.__changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        """Return the number of live pages, including pages being created."""
+        return len(self.__uses) + self.__creating
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the pool refuses checkouts."""
+        return self.__closed
+
+    async def start(self) -> None:
+        """Create pages until the pool is full.
+
+        Pages that fail to be created are left to be created on checkout, so
+        the pool starts with fewer warm pages unless all of them fail.
+
+        Raises:
+            BaseException: The error of the first page, if no page could be created.
+        """
+        n = self.size - len(self)
+        self.__creating += n
+        results = await asyncio.gather(*(self.__create() for _ in range(n)), return_exceptions=True)
+        pages = [r for r in results if not isinstance(r, BaseException)]
+        async with self.__changed:
+            self.__idle.extend(pages)
+            self.__changed.notify(len(pages))
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors and (not pages or any(not isinstance(e, Exception) for e in errors)):
+            raise errors[0]
+
+    async def close(self) -> None:
+        """Close all idle pages and refuse further checkouts."""
+        async with self.__changed:
+            self.__closed = True
+            idle, self.__idle = list(self.__idle), deque()
+            self.__changed.notify_all()
+        for page in idle:
+            await self.__discard(page)
+
+    async def drain(self) -> None:
+        """Close the pool, then wait until every checked out page is given back and closed."""
+        await self.close()
+        async with self.__changed:
+            await self.__changed.wait_for(lambda: len(self) == 0)
+
+    @contextlib.asynccontextmanager
+    async def page(self) -> AsyncGenerator[Page, None]:
+        """Check out a page and return it to the pool when done.
+
+        A page whose use raised an exception is discarded, since its state is unknown.
+        """
+        page = await self.acquire()
+        try:
+            yield page
+        except BaseException:
+            await self.release(page, discard=True)
+            raise
+        await self.release(page)
+
+    async def acquire(self) -> Page:
+        """Check out a healthy page, creating one if the pool is not full.
+
+        Returns:
+            Page: Page ready to use.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+        """
+        while True:
+            page = await self.__checkout()
+            if page is None:
+                page = await self.__create()
+            elif not await self.__check_health(page):
+                self.stats.pages_dropped += 1
+                await self.__discard(page)
+                continue
+            self.__uses[page] += 1
+            return page
+
+    async def release(self, page: Page, *, discard: bool = False) -> None:
+        """Return a checked out page to the pool.
+
+        Args:
+            page (Page): Page returned by `acquire`.
+            discard (bool): Close the page instead of reusing it. A page that is already closed is discarded.
+        """
+        uses = self.__uses.get(page, 0)
+        discard = discard or page.is_closed()
+        if discard or self.__closed or (self.max_uses is not None and uses >= self.max_uses):
+            if discard:
+                self.stats.pages_dropped += 1
+            elif not self.__closed:
+                self.stats.pages_recycled += 1
+            await self.__discard(page)
+            return
+        async with self.__changed:
+            self.__idle.append(page)
+            self.__changed.notify()
+
+    async def __checkout(self) -> Page | None:
+        """Take an idle page, or reserve a slot for a new one and return None."""
+        async with self.__changed:
+            while True:
+                if self.__closed:
+                    msg = "Page pool is closed."
+                    raise RuntimeError(msg)
+                if self.__idle:
+                    return self.__idle.popleft()
+                if len(self) < self.size:
+                    self.__creating += 1
+                    return None
+                await self.__changed.wait()
+
+    async def __create(self) -> Page:
+        """Create a page in a slot reserved by the caller."""
+        try:
+            page = await self.__factory()
+        except BaseException:
+            self.__creating -= 1
+            async with self.__changed:
+                self.__changed.notify()
+            raise
+        self.__creating -= 1
+        self.__uses[page] = 0
+        return page
+
+    async def __discard(self, page: Page) -> None:
+        """Forget and close a page, freeing its slot."""
+        self.__uses.pop(page, None)
+        with contextlib.suppress(Exception):
+            await page.close()
+        async with self.__changed:
+            self.__changed.notify_all()
+
+    async def __check_health(self, page: Page) -> bool:
+        """Check a page taken out of the idle ones, discarding it if the check is interrupted (e.g. cancelled)."""
+        try:
+            return await self.__is_healthy(page)
+        except BaseException:
+            self.stats.pages_dropped += 1
+            await self.__discard(page)
+            raise
+
+    async def __is_healthy(self, page: Page) -> bool:
+        """Check that a page is still usable."""
+        if page.is_closed():
+            return False
+        if self.__health_check is None:
+            return True
+        try:
+            return await self.__health_check(page)
+        except Exception:  # noqa: BLE001
+            return False
@@ -0,0 +1,210 @@
+"""Pace requests to DeepL and back off when it throttles them."""
+
+import asyncio
+import email.utils
+import functools
+import random
+import threading
+import time
+from collections.abc import Callable
+from http import HTTPStatus
+
+_MAX_STATUS = 599
+
+
+def is_retryable_status(status: int) -> bool:
+    """Check if a response status means that DeepL is throttling or temporarily failing.
+
+    Args:
+        status (int): Response status.
+
+    Returns:
+        bool: Whether the request may succeed if retried later, i.e. 429 or 5xx.
+    """
+    return status == HTTPStatus.TOO_MANY_REQUESTS or HTTPStatus.INTERNAL_SERVER_ERROR <= status <= _MAX_STATUS
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header.
+
+    Args:
+        value (str | None): Header value, either seconds or an HTTP date.
+
+    Returns:
+        float | None: Seconds to wait from now, or None if missing or malformed.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+class RateLimiter:
+    """Token bucket pacing the requests of every translator that shares it.
+
+    Up to `burst` requests start at once, then `rate` per second. When DeepL
+    throttles a request, the rate is multiplied by `backoff` (down to
+    `min_rate`), the saved-up burst is dropped, and no request starts until
+    the server's `Retry-After` has passed. Each successful request raises the
+    rate by `increase` back up to its initial value, so the limiter settles
+    just below the rate DeepL tolerates.
+
+    It keeps no event loop state, so one instance can be shared by
+    translators running on different threads and event loops.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 4,
+        *,
+        min_rate: float = 0.1,
+        backoff: float = 0.5,
+        increase: float = 0.05,
+    ) -> None:
+        """Initialize RateLimiter.
+
+        Args:
+            rate (float): Maximum requests per second. Default is 2.
+            burst (int): Requests that may start at once after an idle period. Default is 4.
+            min_rate (float): Rate that backing off never goes below. Default is 0.1.
+            backoff (float): Factor applied to the rate on throttling. Default is 0.5.
+            increase (float): Requests per second added to the rate on success. Default is 0.05.
+
+        Raises:
+            ValueError: If a rate or `burst` is not positive, or `backoff` is not between 0 and 1.
+        """
+        if rate <= 0 or min_rate <= 0 or burst < 1:
+            msg = f"Rates and burst must be positive (Now: rate={rate}, min_rate={min_rate}, burst={burst})"
+            raise ValueError(msg)
+        if not 0 < backoff <= 1:
+            msg = f"Backoff must be between 0 and 1 (Now: {backoff})"
+            raise ValueError(msg)
+
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.backoff = backoff
+        self.increase = increase
+        self.rate = rate
+        self.throttled = 0
+        self.__tokens = float(burst)
+        self.__updated = time.monotonic()
+        self.__paused_until = 0.0
+        self.__lock = threading.Lock()
+
+    def __reduce__(self) -> tuple[Callable[..., "RateLimiter"], tuple[float, int]]:
+        """Pickle as the settings, so that a copy in another process starts afresh and paces only that process."""
+        new = functools.partial(RateLimiter, min_rate=self.min_rate, backoff=self.backoff, increase=self.increase)
+        return new, (self.max_rate, self.burst)
+
+    def __str__(self) -> str:
+        """Return the current rate and the number of throttled requests."""
+        return f"{self.rate:.2f} requests/s (max {self.max_rate:.2f}), {self.throttled} throttled"
+
+    def reserve(self) -> float:
+        """Take a token, going into debt if the bucket is empty.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+            self.__tokens -= 1
+            # Tokens are not earned while paused, so the debt starts being paid off when the pause ends
+            debt = -self.__tokens / self.rate if self.__tokens < 0 else 0.0
+            return max(self.__paused_until - now, 0.0) + debt
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Raise the rate after a request that was not throttled."""
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.rate = min(self.rate + self.increase, self.max_rate)
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        """Lower the rate after a throttled request.
+
+        Args:
+            retry_after (float | None): Seconds the server asked to wait, if any.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+            self.throttled += 1
+            self.rate = max(self.rate * self.backoff, self.min_rate)
+            self.__tokens = min(self.__tokens, 0.0)
+            if retry_after is not None:
+                self.__paused_until = max(self.__paused_until, now + retry_after)
+
+    def __refill(self, now: float) -> None:
+        """Add the tokens earned since the last update at the current rate."""
+        elapsed = max(now - max(self.__updated, self.__paused_until), 0.0)
+        self.__tokens = min(self.__tokens + elapsed * self.rate, float(self.burst))
+        self.__updated = max(now, self.__updated)
+
+
+class RetryPolicy:
+    """How often and how long to wait before retrying a throttled translation.
+
+    The delay before retry `n` (from 0) is `base_delay * 2**n` capped at
+    `max_delay`, of which a random fraction up to `jitter` is taken off so
+    that concurrent translations do not retry in lockstep. It is never
+    shorter than the server's `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 1.0,
+    ) -> None:
+        """Initialize RetryPolicy.
+
+        Args:
+            retries (int): Retries of a translation after the first attempt. Default is 3.
+            base_delay (float): Delay in seconds before the first retry. Default is 1.
+            max_delay (float): Longest delay in seconds. Default is 30.
+            jitter (float): Largest fraction of the delay taken off at random, from 0 to 1. Default is 1.
+
+        Raises:
+            ValueError: If `retries` or a delay is negative, or `jitter` is not between 0 and 1.
+        """
+        if retries < 0 or base_delay < 0 or max_delay < 0:
+            msg = f"Retries and delays must not be negative (Now: {retries}, {base_delay}, {max_delay})"
+            raise ValueError(msg)
+        if not 0 <= jitter <= 1:
+            msg = f"Jitter must be between 0 and 1 (Now: {jitter})"
+            raise ValueError(msg)
+
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Get the delay before a retry.
+
+        Args:
+            attempt (int): Number of retries made so far.
+            retry_after (float | None): Seconds the server asked to wait, if any.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        delay = min(self.base_delay * 2**attempt, self.max_delay)
+        delay -= delay * self.jitter * random.random()  # noqa: S311
+        return max(delay, retry_after or 0.0)
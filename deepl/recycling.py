@@ -0,0 +1,73 @@
+"""Measure the memory of a browser and count how often its pages and itself are replaced."""
+
+import asyncio
+import contextlib
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from playwright._impl._errors import Error as PlaywrightError
+from playwright.async_api._generated import Browser, BrowserContext
+
+
+class RecycleStats:
+    """Counters of the pages and browsers replaced to keep a long-running translator healthy."""
+
+    def __init__(self) -> None:
+        """Initialize RecycleStats."""
+        self.pages_recycled = 0
+        self.pages_dropped = 0
+        self.browser_restarts = 0
+        self.rss: int | None = None
+
+    def __str__(self) -> str:
+        """Return the counters and the last measured memory in one line."""
+        rss = "-" if self.rss is None else f"{self.rss / 2**20:.0f} MiB"
+        return (
+            f"{self.pages_recycled} pages recycled after max uses, {self.pages_dropped} dropped as unusable, "
+            f"{self.browser_restarts} browser restarts, browser memory {rss}"
+        )
+
+
+def process_rss(pids: Iterable[int]) -> int | None:
+    """Get the total resident set size of processes (Linux only).
+
+    Args:
+        pids (Iterable[int]): Process IDs. Processes that have exited are skipped.
+
+    Returns:
+        int | None: Bytes, or None if it cannot be measured on this platform.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    total = 0
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    for pid in pids:
+        with contextlib.suppress(OSError, IndexError, ValueError):
+            total += int((proc / str(pid) / "statm").read_text().split()[1]) * page_size
+    return total
+
+
+async def browser_rss(browser: Browser | BrowserContext) -> int | None:
+    """Get the total resident set size of the processes (browser, renderers, GPU...) of a Chromium browser.
+
+    Args:
+        browser (Browser | BrowserContext): Browser, or persistent context.
+
+    Returns:
+        int | None: Bytes, or None if it cannot be measured, e.g. not on Linux.
+    """
+    owner = browser if isinstance(browser, Browser) else browser.browser
+    if owner is None:
+        return None
+    try:
+        session = await owner.new_browser_cdp_session()
+        try:
+            info = await session.send("SystemInfo.getProcessInfo")
+        finally:
+            await session.detach()
+    except PlaywrightError:
+        return None
+    return await asyncio.to_thread(process_rss, [process["id"] for process in info.get("processInfo", [])])
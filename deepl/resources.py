@@ -0,0 +1,285 @@
+"""Block unneeded requests of the translator page and serve its static assets from disk."""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Collection
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from playwright.async_api._generated import Route
+
+DEFAULT_BLOCKED_TYPES = frozenset({"image", "media", "font", "other"})
+DEFAULT_BLOCKED_DOMAINS = frozenset(
+    {
+        "doubleclick.net",
+        "facebook.net",
+        "google-analytics.com",
+        "googletagmanager.com",
+        "hotjar.com",
+        "sentry.io",
+    },
+)
+CACHEABLE_TYPES = frozenset({"script", "stylesheet"})
+# Headers describing the encoding of the original transfer, which a fulfilled body no longer has
+_TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age=(\d+)")
+
+
+def _matches_domain(hostname: str, domains: Collection[str]) -> bool:
+    """Check if a hostname is one of the domains or a subdomain of one."""
+    return any(hostname == domain or hostname.endswith("." + domain) for domain in domains)
+
+
+class ResourcePolicy:
+    """Decide which requests of the translator page are aborted.
+
+    A request is blocked if its resource type is in `block_types`, its domain
+    is in `block_domains`, or `allow_domains` is given and its domain is not in
+    it. Domains match their subdomains too. Documents are never blocked by type.
+    """
+
+    def __init__(
+        self,
+        block_types: Collection[str] = DEFAULT_BLOCKED_TYPES,
+        block_domains: Collection[str] = DEFAULT_BLOCKED_DOMAINS,
+        allow_domains: Collection[str] | None = None,
+    ) -> None:
+        """Initialize ResourcePolicy.
+
+        Args:
+            block_types (Collection[str]): Playwright resource types to block,
+                e.g. `image` or `script`. Default is images, media, fonts and others.
+            block_domains (Collection[str]): Domains to block. Default is common analytics.
+            allow_domains (Collection[str] | None): Only allow these domains. Default is all.
+        """
+        self.block_types = frozenset(block_types) - {"document"}
+        self.block_domains = frozenset(block_domains)
+        self.allow_domains = None if allow_domains is None else frozenset(allow_domains)
+
+    def is_blocked(self, url: str, resource_type: str) -> bool:
+        """Check if a request should be aborted.
+
+        Args:
+            url (str): Request URL.
+            resource_type (str): Playwright resource type of the request.
+
+        Returns:
+            bool: Whether to abort the request.
+        """
+        if resource_type in self.block_types:
+            return True
+        hostname = urlparse(url).hostname or ""
+        if _matches_domain(hostname, self.block_domains):
+            return True
+        return self.allow_domains is not None and not _matches_domain(hostname, self.allow_domains)
+
+
+class ResourceStats:
+    """Counters of the requests of translator pages."""
+
+    def __init__(self) -> None:
+        """Initialize ResourceStats."""
+        self.page_loads = 0
+        self.blocked = 0
+        self.cached = 0
+        self.cached_bytes = 0
+        self.fetched = 0
+
+    def __str__(self) -> str:
+        """Return the totals and the savings per page load."""
+        n = max(self.page_loads, 1)
+        saved_requests = (self.blocked + self.cached) / n
+        saved_kib = self.cached_bytes / 1024 / n
+        return (
+            f"{self.page_loads} page loads, {self.blocked} requests blocked, "
+            f"{self.cached} served from cache ({self.cached_bytes / 1024:.0f} KiB), {self.fetched} fetched; "
+            f"saved {saved_requests:.1f} requests and {saved_kib:.0f} KiB per page load"
+        )
+
+
+class AssetCache:
+    """SQLite-backed cache of the static scripts and stylesheets of the translator.
+
+    A response is kept for its `Cache-Control: max-age`, or `ttl` seconds if it
+    has none, and is not stored at all with `no-store` or a non-200 status.
+    Only GET requests to `domains` are cached.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        ttl: float = 24 * 60 * 60,
+        domains: Collection[str] = ("deepl.com",),
+    ) -> None:
+        """Initialize AssetCache.
+
+        Args:
+            path (str | Path): SQLite database file. Default is an in-memory database.
+            ttl (float): Lifetime in seconds of a response without `max-age`. Default is a day.
+            domains (Collection[str]): Domains whose assets are cached. Default is DeepL.
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self.domains = frozenset(domains)
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        with self.__conn:
+            self.__conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS assets (
+                    url TEXT PRIMARY KEY,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """,
+            )
+
+    def __reduce__(self) -> tuple[type["AssetCache"], tuple[str | Path, float, tuple[str, ...]]]:
+        """Pickle as the settings to reopen the same file, e.g. in a worker process.
+
+        Raises:
+            TypeError: If the cache is in memory, since it cannot be shared.
+        """
+        if self.path == ":memory:":
+            msg = "An in-memory AssetCache cannot be shared with another process."
+            raise TypeError(msg)
+        return AssetCache, (self.path, self.ttl, tuple(self.domains))
+
+    def __len__(self) -> int:
+        """Return the number of cached assets, including expired ones."""
+        with self.__lock:
+            (n,) = self.__conn.execute("SELECT COUNT(*) FROM assets").fetchone()
+        return n
+
+    def is_cacheable(self, url: str, method: str, resource_type: str) -> bool:
+        """Check if a request is for a static asset of the translator.
+
+        Args:
+            url (str): Request URL.
+            method (str): Request method.
+            resource_type (str): Playwright resource type of the request.
+
+        Returns:
+            bool: Whether its response may be cached.
+        """
+        return (
+            method == "GET"
+            and resource_type in CACHEABLE_TYPES
+            and _matches_domain(urlparse(url).hostname or "", self.domains)
+        )
+
+    def get(self, url: str) -> tuple[dict[str, str], bytes] | None:
+        """Look up an unexpired asset.
+
+        Args:
+            url (str): Request URL.
+
+        Returns:
+            tuple[dict[str, str], bytes] | None: Response headers and body, or None if missing or expired.
+        """
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT headers, body FROM assets WHERE url = ? AND expires_at > ?",
+                (url, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, url: str, status: int, headers: dict[str, str], body: bytes) -> bool:
+        """Store a response if it is cacheable.
+
+        Args:
+            url (str): Request URL.
+            status (int): Response status.
+            headers (dict[str, str]): Response headers.
+            body (bytes): Decoded response body.
+
+        Returns:
+            bool: Whether the response was stored.
+        """
+        cache_control = next((v.lower() for k, v in headers.items() if k.lower() == "cache-control"), "")
+        if status != HTTPStatus.OK or "no-store" in cache_control:
+            return False
+        max_age = _MAX_AGE.search(cache_control)
+        ttl = int(max_age.group(1)) if max_age else self.ttl
+        if ttl <= 0:
+            return False
+
+        headers = {k: v for k, v in headers.items() if k.lower() not in _TRANSFER_HEADERS}
+        now = time.time()
+        with self.__lock, self.__conn:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?)",
+                (url, json.dumps(headers), body, now + ttl),
+            )
+            self.__conn.execute("DELETE FROM assets WHERE expires_at <= ?", (now,))
+        return True
+
+    def clear(self) -> None:
+        """Remove all assets."""
+        with self.__lock, self.__conn:
+            self.__conn.execute("DELETE FROM assets")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.__lock:
+            self.__conn.close()
+
+
+async def handle_route(
+    route: "Route",
+    policy: ResourcePolicy,
+    asset_cache: AssetCache | None,
+    stats: ResourceStats,
+) -> None:
+    """Abort, fulfill from the asset cache, or continue a request of the translator page.
+
+    Args:
+        route (Route): Intercepted request.
+        policy (ResourcePolicy): Requests to block.
+        asset_cache (AssetCache | None): Cache of static assets.
+        stats (ResourceStats): Counters to update.
+    """
+    request = route.request
+    if policy.is_blocked(request.url, request.resource_type):
+        stats.blocked += 1
+        await route.abort()
+        return
+
+    if asset_cache is None or not asset_cache.is_cacheable(request.url, request.method, request.resource_type):
+        stats.fetched += 1
+        await route.continue_()
+        return
+
+    cached = asset_cache.get(request.url)
+    if cached is not None:
+        headers, body = cached
+        stats.cached += 1
+        stats.cached_bytes += len(body)
+        await route.fulfill(status=HTTPStatus.OK, headers=headers, body=body)
+        return
+
+    # Only pages import this, so Playwright is already loaded
+    from playwright._impl._errors import Error as PlaywrightError  # noqa: PLC0415
+
+    stats.fetched += 1
+    try:
+        response = await route.fetch()
+        body = await response.body()
+    except PlaywrightError:
+        # E.g. a network error or timeout, so let the page request it without caching
+        await route.continue_()
+        return
+    asset_cache.set(request.url, response.status, response.headers, body)
+    await route.fulfill(response=response, body=body)
@@ -0,0 +1,279 @@
+"""Serve translations from a warm browser over local HTTP, and send work to it."""
+
+import asyncio
+import contextlib
+import http.client
+import json
+import signal
+import socket
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from deepl.errors import DeepLCLIError, DeepLCLIThrottledError
+
+if TYPE_CHECKING:
+    from playwright.async_api import ProxySettings
+
+    from deepl.cache import TranslationCache
+    from deepl.deepl import DeepLCLI
+    from deepl.proxies import ProxyPool
+    from deepl.ratelimit import RateLimiter
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+
+def parse_address(address: str) -> tuple[str, int] | Path:
+    """Parse a server address.
+
+    Args:
+        address (str): `HOST:PORT`, or `unix:PATH` for a Unix domain socket.
+
+    Returns:
+        tuple[str, int] | Path: Host and port, or socket path.
+
+    Raises:
+        ValueError: If the address is invalid.
+    """
+    if address.startswith("unix:"):
+        return Path(address.removeprefix("unix:"))
+
+    host, sep, port = address.rpartition(":")
+    if not sep or not host or not port.isdigit():
+        msg = f"{address!r} is not HOST:PORT or unix:PATH."
+        raise ValueError(msg)
+    return host, int(port)
+
+
+class TranslationServer:
+    """HTTP server translating with one started `DeepLCLI` per language pair.
+
+    Endpoints:
+
+    - `POST /translate` with `{"text": ..., "fr": ..., "to": ...}` returns
+      `{"translation": ...}`, or `{"error": ...}` with a 4xx/5xx status.
+    - `GET /health` returns `{"status": "ok", "pairs": [...]}`.
+
+    Each language pair gets its own browser with `pool_size` warm pages,
+    launched on its first request and kept until the server stops.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        timeout: int = 15000,
+        pool_size: int = 1,
+        concurrency: int = 4,
+        cache: "TranslationCache | None" = None,
+        *,
+        rate_limiter: "RateLimiter | None" = None,
+        proxy: "ProxySettings | ProxyPool | None" = None,
+        max_memory: int | None = None,
+    ) -> None:
+        """Initialize TranslationServer.
+
+        Args:
+            timeout (int): Timeout in milliseconds. Default is 15000ms.
+            pool_size (int): Number of warm pages per language pair. Default is 1.
+            concurrency (int): Maximum number of chunks of a long text in flight. Default is 4.
+            cache (TranslationCache | None): Cache shared by all language pairs.
+            rate_limiter (RateLimiter | None): Rate limiter shared by all language pairs.
+            proxy (ProxySettings | ProxyPool | None): Proxy, or pool of proxies, shared by all language pairs.
+            max_memory (int | None): Restart the browser of a language pair once it uses more than this many MiB.
+        """
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.concurrency = concurrency
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.proxy = proxy
+        self.max_memory = max_memory
+        self.__translators: dict[tuple[str, str], DeepLCLI] = {}
+        self.__lock = asyncio.Lock()
+
+    async def serve(self, address: str = DEFAULT_ADDRESS) -> None:
+        """Serve until cancelled (e.g. by SIGINT or SIGTERM), then close all browsers.
+
+        Args:
+            address (str): `HOST:PORT`, or `unix:PATH` for a Unix domain socket.
+        """
+        addr = parse_address(address)
+        if isinstance(addr, Path):
+            addr.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(self.__handle, path=addr)
+        else:
+            server = await asyncio.start_server(self.__handle, *addr)
+
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        if task is not None:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                with contextlib.suppress(NotImplementedError):
+                    loop.add_signal_handler(sig, task.cancel)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+            if isinstance(addr, Path):
+                addr.unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        """Close all browsers."""
+        translators, self.__translators = self.__translators, {}
+        for t in translators.values():
+            await t.close_async()
+
+    async def translate(self, script: str, fr_lang: str, to_lang: str) -> str:
+        """Translate script with the warm browser of the language pair.
+
+        Args:
+            script (str): Script to translate.
+            fr_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated script.
+
+        Raises:
+            DeepLCLIError: If the arguments are not valid.
+            DeepLCLIPageLoadError: If the page load fails.
+        """
+        t = await self.__get_translator(fr_lang, to_lang)
+        return await t.translate_document_async(script, self.concurrency)
+
+    async def __get_translator(self, fr_lang: str, to_lang: str) -> "DeepLCLI":
+        """Get the started translator of a language pair, starting it if needed."""
+        if (fr_lang, to_lang) in self.__translators:
+            return self.__translators[fr_lang, to_lang]
+        async with self.__lock:
+            if (fr_lang, to_lang) not in self.__translators:
+                from deepl.deepl import DeepLCLI  # noqa: PLC0415
+
+                t = DeepLCLI(
+                    fr_lang,
+                    to_lang,
+                    self.timeout,
+                    self.proxy,
+                    pool_size=self.pool_size,
+                    cache=self.cache,
+                    rate_limiter=self.rate_limiter,
+                    max_memory=self.max_memory,
+                )
+                await t.start_async()
+                self.__translators[fr_lang, to_lang] = t
+            return self.__translators[fr_lang, to_lang]
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle a HTTP request."""
+        try:
+            status, payload = await self.__dispatch(reader)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": f"Invalid request: {e}"}
+
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode()
+            + body,
+        )
+        with contextlib.suppress(ConnectionError):
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+    async def __dispatch(self, reader: asyncio.StreamReader) -> tuple[HTTPStatus, dict[str, Any]]:
+        """Route a HTTP request and get the response status and payload."""
+        method, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+        headers: dict[str, str] = {}
+        while (line := await reader.readline()).strip():
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_BODY_SIZE:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": f"Body exceeds {MAX_BODY_SIZE} bytes."}
+        body = await reader.readexactly(length)
+
+        if (method, path) == ("GET", "/health"):
+            return HTTPStatus.OK, {"status": "ok", "pairs": [list(pair) for pair in self.__translators]}
+        if path != "/translate":
+            return HTTPStatus.NOT_FOUND, {"error": f"{path!r} is not found."}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{method} is not allowed."}
+        return await self.__handle_translate(json.loads(body))
+
+    async def __handle_translate(self, request: Any) -> tuple[HTTPStatus, dict[str, Any]]:  # noqa: ANN401
+        """Translate the text of a `POST /translate` request."""
+        try:
+            translation = await self.translate(str(request["text"]), str(request["fr"]), str(request["to"]))
+        except (KeyError, TypeError) as e:
+            return HTTPStatus.BAD_REQUEST, {"error": f"text, fr and to are required: {e}"}
+        except DeepLCLIThrottledError as e:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)}
+        except DeepLCLIError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except Exception as e:  # noqa: BLE001
+            return HTTPStatus.BAD_GATEWAY, {"error": str(e)}
+        return HTTPStatus.OK, {"translation": translation}
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, path: Path, timeout: float | None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.__path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(str(self.__path))
+
+
+def translate_via_server(
+    address: str,
+    script: str,
+    fr_lang: str,
+    to_lang: str,
+    timeout: float | None = None,
+) -> str:
+    """Translate script with a running `deepl serve`.
+
+    Args:
+        address (str): `HOST:PORT`, or `unix:PATH` for a Unix domain socket.
+        script (str): Script to translate.
+        fr_lang (str): Source language.
+        to_lang (str): Target language.
+        timeout (float | None): Timeout in seconds. Default is waiting for the server.
+
+    Returns:
+        str: Translated script.
+
+    Raises:
+        DeepLCLIError: If the server is unreachable or the translation fails.
+    """
+    addr = parse_address(address)
+    conn = (
+        _UnixHTTPConnection(addr, timeout)
+        if isinstance(addr, Path)
+        else http.client.HTTPConnection(*addr, timeout=timeout)
+    )
+    body = json.dumps({"text": script, "fr": fr_lang, "to": to_lang}).encode()
+    try:
+        conn.request("POST", "/translate", body, {"Content-Type": "application/json"})
+        response = conn.getresponse()
+        payload = json.loads(response.read())
+    except (OSError, http.client.HTTPException, ValueError) as e:
+        msg = f"Unable to reach the server at {address}: {e}"
+        raise DeepLCLIError(msg) from e
+    finally:
+        conn.close()
+
+    if response.status != HTTPStatus.OK:
+        msg = f"Server failed with status code {response.status}: {payload.get('error')}"
+        raise DeepLCLIError(msg)
+    return payload["translation"]
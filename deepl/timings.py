@@ -0,0 +1,114 @@
+"""Per-phase timings of a translation."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Generator
+from contextvars import ContextVar
+
+PHASES = (
+    "cache",
+    "rate_limit",
+    "launch",
+    "acquire",
+    "goto",
+    "select_languages",
+    "clear",
+    "fill",
+    "wait_response",
+    "wait_rendered",
+    "wait_complete",
+    "read",
+    "backoff",
+)
+
+_current: ContextVar["Timings | None"] = ContextVar("deepl_timings", default=None)
+
+
+class Timings:
+    """Wall time spent in each phase of one translation, in milliseconds.
+
+    Phases:
+
+    - `cache`: looking up and storing the translation cache.
+    - `rate_limit`: waiting for the rate limiter.
+    - `launch`: launching a browser for a call without a shared browser.
+    - `acquire`: waiting for a warm page of the pool, including opening a new one.
+    - `goto`: loading the translator page.
+    - `select_languages`: clicking the language dropdowns.
+    - `clear`: clearing the previous translation of a warm page.
+    - `fill`: filling in the source text.
+    - `wait_response`: waiting for the backend response, if it came first.
+    - `wait_rendered`: waiting for the translation to be rendered, if it came first.
+    - `wait_complete`: waiting for the `[...]` placeholder to go away.
+    - `read`: reading the rendered translation.
+    - `backoff`: waiting before retrying a throttled request.
+
+    A phase that did not happen is missing from `phases`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize Timings."""
+        self.phases: dict[str, float] = {}
+        self.total = 0.0
+        self.source: str | None = None
+
+    def __repr__(self) -> str:
+        """Return the timings in one line."""
+        return f"Timings({self})"
+
+    def __str__(self) -> str:
+        """Return the phases in order and the total, e.g. `goto=812ms fill=3ms ... total=1204ms (page)`."""
+        phases = sorted(self.phases.items(), key=lambda item: PHASES.index(item[0]))
+        return " ".join(
+            [f"{phase}={ms:.0f}ms" for phase, ms in phases] + [f"total={self.total:.0f}ms ({self.source or 'failed'})"],
+        )
+
+    @contextlib.contextmanager
+    def activate(self) -> Generator["Timings", None, None]:
+        """Record `measure` calls of this context (and the tasks it creates) here, and the total time."""
+        token = _current.set(self)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total = (time.perf_counter() - start) * 1000
+            _current.reset(token)
+
+
+@contextlib.contextmanager
+def measure(phase: str) -> Generator[None, None, None]:
+    """Add the time spent in the block to a phase of the active `Timings`, if any.
+
+    The time of a block interrupted by cancellation is not recorded, since the
+    phase lost a race and did not hold up the translation.
+
+    Args:
+        phase (str): One of `PHASES`.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    cancelled = False
+    try:
+        yield
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        if not cancelled:
+            timings.phases[phase] = timings.phases.get(phase, 0.0) + (time.perf_counter() - start) * 1000
+
+
+def set_source(source: str) -> None:
+    """Record where the translation of the active `Timings` came from.
+
+    Args:
+        source (str): `cache`, `backend` or `page`.
+    """
+    timings = _current.get()
+    if timings is not None:
+        timings.source = source
@@ -0,0 +1,390 @@
+"""Translate on browsers in several processes, to use more than one CPU core."""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import itertools
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+from collections.abc import Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from deepl.chunking import join_text, split_text
+from deepl.errors import DeepLCLIError
+from deepl.languages import FR_LANGS, TO_LANGS
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.queues import Queue
+
+    from typing_extensions import Self
+
+# A task is (id, script), and a result is (id, translation or error); None tells a consumer to stop
+_Task = tuple[int, str] | None
+_Result = tuple[int, str | Exception] | None
+
+
+class WorkerPool:
+    """Pool of processes, each running its own browser with `pages` warm pages.
+
+    Playwright drives a browser from one event loop, so a single process
+    saturates one core under heavy load. A `WorkerPool` starts `workers`
+    processes, each with a started `DeepLCLI`, and hands scripts to them
+    through a shared queue: every page of every worker takes the next script
+    as soon as it is free, so a slow script does not hold up the others.
+    Results are merged back in input order.
+
+    Options are passed to `DeepLCLI` in each worker and so must be picklable.
+    Caches and proxy pools are reopened from their settings in each worker;
+    a `RateLimiter` is copied, so give each worker its share of the rate.
+
+    ```
+    with WorkerPool("en", "ja", workers=4, pages=4) as pool:
+        pool.translate_many(texts)
+    ```
+    """
+
+    def __init__(
+        self,
+        fr_lang: str,
+        to_lang: str,
+        workers: int | None = None,
+        pages: int = 4,
+        *,
+        url: str | None = None,
+        **options: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize WorkerPool.
+
+        Args:
+            fr_lang (str): Source language.
+            to_lang (str): Target language.
+            workers (int | None): Number of processes. Default is the number of CPU cores.
+            pages (int): Number of warm pages of each process. Default is 4.
+            url (str | None): Translator page to use instead of DeepL's, e.g. a local stand-in.
+            **options (Any): Keyword arguments of `DeepLCLI`, except `pool_size`.
+
+        Raises:
+            DeepLCLIError: If a language is not valid, or `workers` or `pages` is not positive.
+        """
+        if fr_lang not in FR_LANGS:
+            raise DeepLCLIError(
+                f"{fr_lang!r} is not valid language. Valid language:\n" + repr(FR_LANGS),
+            )
+        if to_lang not in TO_LANGS:
+            raise DeepLCLIError(
+                f"{to_lang!r} is not valid language. Valid language:\n" + repr(TO_LANGS),
+            )
+        workers = workers or os.cpu_count() or 1
+        if workers < 1 or pages < 1:
+            msg = f"Workers and pages must be positive (Now: {workers}, {pages})"
+            raise DeepLCLIError(msg)
+
+        self.fr_lang = fr_lang
+        self.to_lang = to_lang
+        self.workers = workers
+        self.pages = pages
+        self.url = url
+        self.options = options
+        self.max_length = 1500
+        self.__context = multiprocessing.get_context("spawn")
+        self.__tasks: Queue[_Task] | None = None
+        self.__results: Queue[_Result] | None = None
+        self.__processes: list[BaseProcess] = []
+        self.__collector: threading.Thread | None = None
+        self.__futures: dict[int, concurrent.futures.Future[str]] = {}
+        self.__ids = itertools.count()
+        self.__lock = threading.Lock()
+        self.__broken: str | None = None
+
+    def __enter__(self) -> "Self":
+        """Start the workers."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the workers."""
+        self.close()
+
+    async def __aenter__(self) -> "Self":
+        """Start the workers without blocking the event loop."""
+        await asyncio.to_thread(self.start)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the workers without blocking the event loop."""
+        await asyncio.to_thread(self.close)
+
+    @property
+    def is_started(self) -> bool:
+        """Whether the workers are running."""
+        return bool(self.__processes)
+
+    def needs_request(self, script: str) -> bool:  # noqa: ARG002
+        """Check if translating script would need the workers, which is always the case.
+
+        Cache lookups happen in the workers, so a cached script also goes through them.
+
+        Args:
+            script (str): Script to translate.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def start(self) -> None:
+        """Start the worker processes. Each one launches its browser in the background."""
+        if self.__processes:
+            return
+        self.__broken = None
+        self.__tasks = self.__context.Queue()
+        self.__results = self.__context.Queue()
+        self.__processes = [
+            self.__context.Process(
+                target=_work,
+                args=(self.fr_lang, self.to_lang, self.pages, self.url, self.options, self.__tasks, self.__results),
+                daemon=True,
+            )
+            for _ in range(self.workers)
+        ]
+        for process in self.__processes:
+            process.start()
+        self.__collector = threading.Thread(target=self.__collect, daemon=True)
+        self.__collector.start()
+
+    def close(self) -> None:
+        """Let the workers finish the scripts in flight, then stop them."""
+        processes, self.__processes = self.__processes, []
+        if not processes or self.__tasks is None or self.__results is None:
+            return
+        for _ in range(self.workers * self.pages):
+            self.__tasks.put(None)
+        for process in processes:
+            process.join()
+        self.__results.put(None)
+        if self.__collector is not None:
+            self.__collector.join()
+        self.__fail_pending("Worker pool is closed.")
+
+    def submit(self, script: str) -> concurrent.futures.Future[str]:
+        """Queue a script for the next free page of any worker.
+
+        Args:
+            script (str): Script to translate.
+
+        Returns:
+            concurrent.futures.Future[str]: Translated script, or the raised error.
+
+        Raises:
+            DeepLCLIError: If the pool is not started, or a worker died.
+        """
+        if not self.__processes or self.__tasks is None:
+            msg = "Worker pool is not started."
+            raise DeepLCLIError(msg)
+        if self.__broken is not None:
+            raise DeepLCLIError(self.__broken)
+
+        future: concurrent.futures.Future[str] = concurrent.futures.Future()
+        with self.__lock:
+            task_id = next(self.__ids)
+            self.__futures[task_id] = future
+        self.__tasks.put((task_id, script))
+        return future
+
+    def translate_many(self, scripts: Iterable[str]) -> list[str | Exception]:
+        """Translate many scripts on the workers.
+
+        If the pool is not started, it is started for this call only.
+
+        Args:
+            scripts (Iterable[str]): Scripts to translate.
+
+        Returns:
+            list[str | Exception]: Translated script or raised error for each script, in input order.
+        """
+        if not self.__processes:
+            with self:
+                return self.translate_many(scripts)
+
+        futures = [self.submit(script) for script in scripts]
+        concurrent.futures.wait(futures)
+        return [_outcome(future) for future in futures]
+
+    async def translate_many_async(self, scripts: Iterable[str]) -> list[str | Exception]:
+        """Translate many scripts on the workers asynchronously.
+
+        See `translate_many`.
+
+        Args:
+            scripts (Iterable[str]): Scripts to translate.
+
+        Returns:
+            list[str | Exception]: Translated script or raised error for each script, in input order.
+        """
+        if not self.__processes:
+            async with self:
+                return await self.translate_many_async(scripts)
+
+        futures = [asyncio.wrap_future(self.submit(script)) for script in scripts]
+        results: list[str | Exception] = []
+        for res in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(res, BaseException) and not isinstance(res, Exception):
+                raise res
+            results.append(res)
+        return results
+
+    async def translate_document_async(self, script: str, concurrency: int = 4) -> str:  # noqa: ARG002
+        """Translate script of any length on the workers asynchronously.
+
+        Script longer than `max_length` is split like `DeepLCLI.translate_document`,
+        and the chunks are spread over the workers.
+
+        Args:
+            script (str): Script to translate.
+            concurrency (int): Ignored; the chunks in flight are bounded by the pages of the workers.
+
+        Returns:
+            str: Translated script.
+
+        Raises:
+            DeepLCLIError: If the script is empty.
+        """
+        chunks, separators = split_text(script.rstrip("\n"), self.max_length)
+        if not chunks:
+            msg = "Script seems to be empty."
+            raise DeepLCLIError(msg)
+
+        results = await self.translate_many_async(chunks)
+        for res in results:
+            if isinstance(res, Exception):
+                raise res
+
+        return join_text([str(res) for res in results], separators)
+
+    def __collect(self) -> None:
+        """Resolve the futures of the results sent back by the workers, until told to stop."""
+        results = self.__results
+        if results is None:
+            return
+        while True:
+            try:
+                item = results.get(timeout=1)
+            except queue.Empty:
+                self.__check_workers()
+                continue
+            if item is None:
+                return
+            task_id, res = item
+            with self.__lock:
+                future = self.__futures.pop(task_id, None)
+            if future is None:
+                continue
+            if isinstance(res, Exception):
+                future.set_exception(res)
+            else:
+                future.set_result(res)
+
+    def __check_workers(self) -> None:
+        """Fail every pending script if a worker died, since its scripts in flight are lost."""
+        for process in list(self.__processes):
+            if process.exitcode not in {None, 0}:
+                self.__broken = f"A worker exited unexpectedly with code {process.exitcode}."
+                self.__fail_pending(self.__broken)
+                return
+
+    def __fail_pending(self, message: str) -> None:
+        """Fail the futures of all scripts that have no result yet."""
+        with self.__lock:
+            futures, self.__futures = self.__futures, {}
+        for future in futures.values():
+            future.set_exception(DeepLCLIError(message))
+
+
+def _work(  # noqa: PLR0913, PLR0917
+    fr_lang: str,
+    to_lang: str,
+    pages: int,
+    url: str | None,
+    options: dict[str, Any],
+    tasks: "Queue[_Task]",
+    results: "Queue[_Result]",
+) -> None:
+    """Translate tasks from the queue until every page of this worker gets a None."""
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(fr_lang, to_lang, pages, url, options, tasks, results))
+
+
+async def _serve(  # noqa: PLR0913, PLR0917
+    fr_lang: str,
+    to_lang: str,
+    pages: int,
+    url: str | None,
+    options: dict[str, Any],
+    tasks: "Queue[_Task]",
+    results: "Queue[_Result]",
+) -> None:
+    """Start a translator with `pages` pages, each taking tasks from the queue."""
+    from deepl.deepl import DeepLCLI  # noqa: PLC0415
+
+    t = DeepLCLI(fr_lang, to_lang, pool_size=pages, **options)
+    if url is not None:
+        t.url = url
+
+    error: Exception | None = None
+    try:
+        await t.start_async()
+    except Exception as e:  # noqa: BLE001
+        # Keep taking tasks so that they fail instead of hanging, but cached ones still succeed
+        error = e
+
+    async def consume() -> None:
+        while (task := await asyncio.to_thread(tasks.get)) is not None:
+            task_id, script = task
+            res: str | Exception
+            if error is not None and t.needs_request(script):
+                res = _picklable(error)
+            else:
+                try:
+                    res = await t.translate_async(script)
+                except Exception as e:  # noqa: BLE001
+                    res = _picklable(e)
+            results.put((task_id, res))
+
+    try:
+        await asyncio.gather(*(consume() for _ in range(pages)))
+    finally:
+        await t.close_async()
+
+
+def _outcome(future: concurrent.futures.Future[str]) -> str | Exception:
+    """Get the result of a done future, or its error."""
+    error = future.exception()
+    if error is None:
+        return future.result()
+    if not isinstance(error, Exception):
+        raise error
+    return error
+
+
+def _picklable(error: Exception) -> Exception:
+    """Get an error that can be sent back to the main process."""
+    try:
+        pickle.loads(pickle.dumps(error))  # noqa: S301
+    except Exception:  # noqa: BLE001
+        return DeepLCLIError(f"{type(error).__name__}: {error}")
+    return error
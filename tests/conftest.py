@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+from deepl import DeepLCLI, TranslationCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TranslationCache:
+    # Tests translate cached scripts only, so Chromium is neither needed nor installed
+    monkeypatch.setenv("DEEPL_CLI_SKIP_INSTALL", "1")
+    cache = TranslationCache(tmp_path / "cache.sqlite3")
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    cache.set("en", "ja", "world.", "世界。")
+    cache.set("en", "ja", "slow.", "遅い。")
+    cache.set("en", "de", "hello.", "Hallo.")
+    cache.set("ja", "en", "世界。", "World.")
+    return cache
+
+
+@pytest.fixture
+def deepl(cache: TranslationCache) -> DeepLCLI:
+    return DeepLCLI("en", "ja", cache=cache)
@@ -0,0 +1,77 @@
+import asyncio
+import contextlib
+from collections.abc import Coroutine
+from typing import Any
+
+import pytest
+
+from deepl import DeepLCLI, DeepLCLIError, DeepLCLITimeoutError
+
+
+def slow_down(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch, cancelled: list[str]) -> None:
+    """Make the translation of "slow." take an hour, recording when it is cancelled."""
+    translate_async = deepl.translate_async
+
+    async def slow(script: str) -> str:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(script)
+            raise
+        return script
+
+    def patched(script: str) -> Coroutine[Any, Any, str]:
+        return slow(script) if script == "slow." else translate_async(script)
+
+    monkeypatch.setattr(deepl, "translate_async", patched)
+
+
+@pytest.mark.asyncio
+async def test_translate_as_completed(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch) -> None:
+    cancelled: list[str] = []
+    slow_down(deepl, monkeypatch, cancelled)
+
+    results = [res async for res in deepl.translate_as_completed_async(["slow.", "hello.", "", "world."], deadline=50)]
+
+    by_index = dict(results)
+    assert by_index[1] == "こんにちは。"
+    assert by_index[3] == "世界。"
+    assert isinstance(by_index[2], DeepLCLIError)
+    # The slow script comes last, without holding back the others
+    i, error = results[-1]
+    assert i == 0
+    assert isinstance(error, DeepLCLITimeoutError)
+    assert str(error) == "Translation did not finish within 50ms."
+    assert cancelled == ["slow."]
+
+
+@pytest.mark.asyncio
+async def test_translate_as_completed_closed_early(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch) -> None:
+    cancelled: list[str] = []
+    slow_down(deepl, monkeypatch, cancelled)
+
+    async with contextlib.aclosing(deepl.translate_as_completed_async(["slow.", "hello."], 2)) as results:
+        async for res in results:
+            assert res == (1, "こんにちは。")
+            break
+    assert cancelled == ["slow."]
+
+
+@pytest.mark.asyncio
+async def test_translate_as_completed_invalid_concurrency(deepl: DeepLCLI) -> None:
+    with pytest.raises(DeepLCLIError, match="Concurrency must be positive"):
+        await anext(deepl.translate_as_completed_async(["hello."], 0))
+
+
+def test_translate_as_completed_sync(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch) -> None:
+    cancelled: list[str] = []
+    slow_down(deepl, monkeypatch, cancelled)
+    try:
+        assert sorted(deepl.translate_as_completed(["world.", "hello."])) == [(0, "世界。"), (1, "こんにちは。")]
+
+        results = deepl.translate_as_completed(["slow.", "hello."])
+        assert next(results) == (1, "こんにちは。")
+        results.close()
+        assert cancelled == ["slow."]
+    finally:
+        deepl.close()
@@ -0,0 +1,55 @@
+import pytest
+
+from deepl.backend import is_throttled, is_translation_url, parse_translation
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www2.deepl.com/jsonrpc?method=LMT_handle_texts", True),
+        ("https://www2.deepl.com/jsonrpc?method=LMT_handle_jobs", True),
+        ("https://www2.deepl.com/jsonrpc?method=LMT_split_text", False),
+        ("https://www.deepl.com/en/translator", False),
+        ("https://example.com/jsonrpc?method=LMT_handle_texts", False),
+    ],
+)
+def test_is_translation_url(url: str, expected: bool) -> None:  # noqa: FBT001
+    assert is_translation_url(url) is expected
+
+
+def test_parse_handle_texts() -> None:
+    body = {"jsonrpc": "2.0", "result": {"lang": "EN", "texts": [{"text": "こんにちは。"}, {"text": "世界。"}]}}
+    assert parse_translation(body) == ("こんにちは。\n世界。", "en")
+
+
+def test_parse_handle_jobs() -> None:
+    body = {"result": {"translations": [{"beams": [{"sentences": [{"text": "Hallo."}, {"text": " Welt."}]}]}]}}
+    assert parse_translation(body) == ("Hallo. Welt.", None)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        None,
+        {"error": {"code": 1042912, "message": "Too many requests"}},
+        {"result": {"texts": []}},
+        {"result": {"translations": [{"beams": []}]}},
+        {"result": {"translations": [{"beams": [{"sentences": []}]}] * 2}},
+    ],
+)
+def test_parse_incomplete(body: object) -> None:
+    assert parse_translation(body) is None
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ({"error": {"code": 1042912, "message": "Too many requests"}}, True),
+        ({"error": {"code": 1, "message": "Too many requests."}}, True),
+        ({"error": {"code": 1, "message": "Bad request"}}, False),
+        ({"result": {"texts": [{"text": "Hallo."}]}}, False),
+        (None, False),
+    ],
+)
+def test_is_throttled(body: object, expected: bool) -> None:  # noqa: FBT001
+    assert is_throttled(body) is expected
@@ -0,0 +1,128 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from deepl import DeepLCLI, TranslationCache
+from deepl.batch import MANIFEST_NAME, Manifest, expand_paths, translate_files
+from deepl.main import main
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "in" / "sub").mkdir(parents=True)
+    (tmp_path / "in" / ".git").mkdir()
+    (tmp_path / "in" / "a.txt").write_text("hello.\n")
+    (tmp_path / "in" / "sub" / "b.md").write_text("world.\n")
+    (tmp_path / "in" / "sub" / "c.bin").write_bytes(b"\x00\x01")
+    (tmp_path / "in" / ".git" / "d.txt").write_text("hidden.\n")
+    return tmp_path
+
+
+def make_translator() -> DeepLCLI:
+    cache = TranslationCache()
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    cache.set("en", "ja", "world.", "世界。")
+    return DeepLCLI("en", "ja", cache=cache)
+
+
+def test_expand_directory(tree: Path) -> None:
+    assert expand_paths([str(tree / "in")]) == [
+        ((tree / "in" / "a.txt").resolve(), Path("a.txt")),
+        ((tree / "in" / "sub" / "b.md").resolve(), Path("sub/b.md")),
+    ]
+
+
+def test_expand_glob_and_file(tree: Path) -> None:
+    files = expand_paths([str(tree / "in" / "**" / "*.md"), str(tree / "in" / "a.txt")])
+    assert [rel for _, rel in files] == [Path("sub/b.md"), Path("a.txt")]
+
+
+def test_expand_excludes_output(tree: Path) -> None:
+    (tree / "in" / "out").mkdir()
+    (tree / "in" / "out" / "a.txt").write_text("こんにちは。\n")
+    assert [rel for _, rel in expand_paths([str(tree / "in")], exclude=tree / "in" / "out")] == [
+        Path("a.txt"),
+        Path("sub/b.md"),
+    ]
+
+
+def test_expand_conflict(tree: Path) -> None:
+    (tree / "a.txt").write_text("bye.\n")
+    with pytest.raises(ValueError, match="would both be written"):
+        expand_paths([str(tree / "a.txt"), str(tree / "in" / "a.txt")])
+
+
+def test_manifest(tmp_path: Path) -> None:
+    manifest = Manifest(tmp_path)
+    (tmp_path / "a.txt").write_text("A\n")
+    assert not manifest.is_done(Path("a.txt"), "0", "en", "ja")
+    manifest.mark_done(Path("a.txt"), "0", "en", "ja")
+    assert Manifest(tmp_path).is_done(Path("a.txt"), "0", "en", "ja")
+    assert not Manifest(tmp_path).is_done(Path("a.txt"), "1", "en", "ja")
+    assert not Manifest(tmp_path).is_done(Path("a.txt"), "0", "en", "de")
+    (tmp_path / "a.txt").unlink()
+    assert not Manifest(tmp_path).is_done(Path("a.txt"), "0", "en", "ja")
+
+
+@pytest.mark.asyncio
+async def test_translate_files_resumes(tree: Path) -> None:
+    files = expand_paths([str(tree / "in")])
+    out = tree / "out"
+    done: list[Path] = []
+
+    t = make_translator()
+    assert await translate_files(t, files, out, on_done=lambda _, output, __: done.append(output)) == (2, 0, 0)
+    assert (out / "a.txt").read_text() == "こんにちは。\n"
+    assert (out / "sub" / "b.md").read_text() == "世界。\n"
+    assert sorted(done) == [out / "a.txt", out / "sub" / "b.md"]
+    assert set(json.loads((out / MANIFEST_NAME).read_text())) == {"a.txt", "sub/b.md"}
+    assert not t.is_started
+
+    (tree / "in" / "a.txt").write_text("world.\n")
+    assert await translate_files(t, files, out) == (1, 1, 0)
+    assert (out / "a.txt").read_text() == "世界。\n"
+
+
+def test_main_batch(tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = tree / "cache.sqlite3"
+    TranslationCache(cache).set("en", "ja", "hello.", "こんにちは。")
+    monkeypatch.setenv("DEEPL_CLI_CACHE", str(cache))
+    monkeypatch.setattr(
+        sys, "argv", ["deepl", "-F", "en", "-T", "ja", "-f", str(tree / "in" / "*.txt"), "-o", str(tree / "out")]
+    )
+    main()
+    assert (tree / "out" / "a.txt").read_text() == "こんにちは。\n"
+
+
+def test_main_fan_out(tree: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    cache = tree / "cache.sqlite3"
+    TranslationCache(cache).set("en", "ja", "hello.", "こんにちは。")
+    TranslationCache(cache).set("en", "de", "hello.", "Hallo.")
+    monkeypatch.setenv("DEEPL_CLI_CACHE", str(cache))
+    monkeypatch.setattr(sys, "argv", ["deepl", "-F", "en", "-T", "ja,de", "-f", str(tree / "in" / "a.txt")])
+    main()
+    assert json.loads(capsys.readouterr().out) == {"ja": "こんにちは。", "de": "Hallo."}
+
+
+def test_main_batch_unreadable_file(
+    tree: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    (tree / "in" / "latin1.txt").write_bytes("café.\n".encode("latin-1"))
+    cache = tree / "cache.sqlite3"
+    TranslationCache(cache).set("en", "ja", "hello.", "こんにちは。")
+    monkeypatch.setenv("DEEPL_CLI_CACHE", str(cache))
+    monkeypatch.setattr(
+        sys, "argv", ["deepl", "-F", "en", "-T", "ja", "-f", str(tree / "in" / "*.txt"), "-o", str(tree / "out")]
+    )
+    with pytest.raises(SystemExit) as e:
+        main()
+    assert e.value.code == 1
+    assert (tree / "out" / "a.txt").read_text() == "こんにちは。\n"
+    assert not (tree / "out" / "latin1.txt").exists()
+    err = capsys.readouterr().err
+    assert "latin1.txt" in err
+    assert "1 translated, 0 skipped, 1 failed" in err
@@ -0,0 +1,97 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from deepl import DeepLCLI, TranslationCache
+
+
+def test_get_and_set() -> None:
+    cache = TranslationCache()
+    assert cache.get("en", "ja", "hello.") is None
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    assert cache.get("en", "ja", "hello.") == "こんにちは。"
+    assert cache.get("en", "de", "hello.") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_key_is_normalized() -> None:
+    cache = TranslationCache()
+    cache.set("en", "fr", "café\n", "café")
+    assert cache.get("en", "fr", " café") == "café"
+
+
+def test_contains_does_not_count() -> None:
+    cache = TranslationCache()
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    assert cache.contains("en", "ja", "hello.")
+    assert not cache.contains("en", "ja", "bye.")
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_ttl_expires_entries() -> None:
+    cache = TranslationCache(ttl=-1)
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    assert not cache.contains("en", "ja", "hello.")
+    assert cache.get("en", "ja", "hello.") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted() -> None:
+    cache = TranslationCache(max_entries=2)
+    cache.set("en", "ja", "a", "A")
+    cache.set("en", "ja", "b", "B")
+    cache.get("en", "ja", "a")
+    cache.set("en", "ja", "c", "C")
+    assert len(cache) == 2
+    assert cache.contains("en", "ja", "a")
+    assert not cache.contains("en", "ja", "b")
+
+
+def test_persistent(tmp_path: Path) -> None:
+    path = tmp_path / "sub" / "cache.sqlite3"
+    cache = TranslationCache(path)
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    cache.close()
+    assert TranslationCache(path).get("en", "ja", "hello.") == "こんにちは。"
+
+
+def test_shared_file_is_not_locked_by_readers(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    writer = TranslationCache(path)
+    reader = sqlite3.connect(path)
+    assert reader.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    # A reader in the middle of a transaction, like another worker process
+    reader.execute("BEGIN")
+    reader.execute("SELECT COUNT(*) FROM translations").fetchone()
+    writer.set("en", "ja", "hello.", "こんにちは。")
+    reader.rollback()
+    assert TranslationCache(path).get("en", "ja", "hello.") == "こんにちは。"
+
+
+def test_translate_from_cache_without_browser() -> None:
+    cache = TranslationCache()
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    t = DeepLCLI("en", "ja", cache=cache)
+    assert t.translate("hello.") == "こんにちは。"
+    assert t.translate_many(["hello.", "hello."]) == ["こんにちは。", "こんにちは。"]
+    assert not t.is_started
+    assert cache.hits == 3
+
+
+@pytest.mark.asyncio
+async def test_translate_async_from_cache() -> None:
+    cache = TranslationCache()
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    t = DeepLCLI("en", "ja", cache=cache)
+    t.max_length = 10
+    assert await t.translate_document_async("hello.\n\nhello.") == "こんにちは。\n\nこんにちは。"
+
+
+def test_translate_to_many_from_cache() -> None:
+    cache = TranslationCache()
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    cache.set("en", "de", "hello.", "Hallo.")
+    t = DeepLCLI("en", "ja", cache=cache)
+    assert t.translate_to_many("hello.", ["de", "ja", "de"]) == {"de": "Hallo.", "ja": "こんにちは。"}
+    assert not t.is_started
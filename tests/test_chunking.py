@@ -0,0 +1,48 @@
+import pytest
+
+from deepl.chunking import join_text, split_text
+
+
+def test_short_text_is_one_chunk() -> None:
+    assert split_text("Hello world. Bye.", 100) == (["Hello world. Bye."], ["", ""])
+
+
+def test_split_on_sentences() -> None:
+    chunks, separators = split_text("Hello world. This is a test.\n\nNew para! Yes?", 20)
+    assert chunks == ["Hello world.", "This is a test.", "New para! Yes?"]
+    assert separators == ["", " ", "\n\n", ""]
+
+
+def test_split_on_cjk_sentences() -> None:
+    chunks, _ = split_text("今日は晴れ。明日は雨。\n次の段落。", 7)
+    assert chunks == ["今日は晴れ。", "明日は雨。", "次の段落。"]
+
+
+def test_long_sentence_is_split_on_words() -> None:
+    chunks, _ = split_text("aaa bbb ccc ddd", 7)
+    assert chunks == ["aaa bbb", "ccc ddd"]
+
+
+def test_long_word_is_cut() -> None:
+    chunks, _ = split_text("abcdefghij", 4)
+    assert chunks == ["abcd", "efgh", "ij"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "  \n",
+        "\n  One. Two.  Three!\n\n\nFour?  \n",
+        "a" * 50 + " " + "b. " * 20,
+    ],
+)
+def test_join_restores_text(text: str) -> None:
+    chunks, separators = split_text(text, 8)
+    assert all(0 < len(chunk) <= 8 for chunk in chunks)
+    assert join_text(chunks, separators) == text
+
+
+def test_invalid_max_length() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        split_text("hello", 0)
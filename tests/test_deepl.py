@@ -1,3 +1,5 @@
+import asyncio
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
@@ -10,6 +12,114 @@ def test_en_to_ja() -> None:
     assert t.translate("hello.") in ("こんにちは", "こんにちは。")
 
 
+def test_shared_browser() -> None:
+    with DeepLCLI("en", "ja", 100000) as t:
+        assert t.is_started
+        assert t.translate("hello.") in ("こんにちは", "こんにちは。")
+        assert t.translate("hello.") in ("こんにちは", "こんにちは。")
+    assert not t.is_started
+
+
+def test_pooled_pages_are_recycled() -> None:
+    with DeepLCLI("en", "ja", 100000, pool_size=2, page_max_uses=1) as t:
+        for _ in range(3):
+            assert t.translate("hello.") in ("こんにちは", "こんにちは。")
+
+
+def test_timings() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    t.translate("hello.")
+    assert t.last_timings is not None
+    assert {"launch", "goto", "select_languages", "fill"} <= set(t.last_timings.phases)
+    assert t.last_timings.source in ("backend", "page")
+
+
+def test_storage_state(tmp_path: Path) -> None:
+    state = tmp_path / "state.json"
+    t = DeepLCLI("en", "ja", 100000, storage_state=state)
+    assert t.translate("hello.") in ("こんにちは", "こんにちは。")
+    assert state.is_file()
+    assert t.translate("hello.") in ("こんにちは", "こんにちは。")
+
+
+def test_storage_state_with_recycled_pages(tmp_path: Path) -> None:
+    state = tmp_path / "sub" / "state.json"
+    t = DeepLCLI("en", "ja", 100000, storage_state=state, page_max_uses=1)
+    assert not state.parent.exists()
+    with t:
+        assert t.translate("hello.") in ("こんにちは", "こんにちは。")
+    assert state.is_file()
+
+
+def test_profile_dir(tmp_path: Path) -> None:
+    with DeepLCLI("en", "ja", 100000, profile_dir=tmp_path / "profile") as t:
+        assert t.translate("hello.") in ("こんにちは", "こんにちは。")
+    assert any((tmp_path / "profile").iterdir())
+
+
+def test_profile_dir_and_storage_state(tmp_path: Path) -> None:
+    with pytest.raises(DeepLCLIError, match="cannot be used together"):
+        DeepLCLI("en", "ja", profile_dir=tmp_path / "profile", storage_state=tmp_path / "state.json")
+
+
+def test_translate_to_many() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    res = t.translate_to_many("hello.", ["ja", "de", "fr"], concurrency=2)
+    assert list(res) == ["ja", "de", "fr"]
+    assert res["ja"] in ("こんにちは", "こんにちは。")
+    assert res["de"] in ("Hallo", "Hallo.")
+    assert res["fr"] in ("Bonjour", "Bonjour.")
+
+
+def test_translate_to_many_invalid_lang() -> None:
+    t = DeepLCLI("en", "ja")
+    with pytest.raises(DeepLCLIError, match="'xx' is not valid language"):
+        t.translate_to_many("hello.", ["de", "xx"])
+
+
+def test_translate_many() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    res = t.translate_many(["hello.", "\n", "hello."], concurrency=2)
+    assert res[0] in ("こんにちは", "こんにちは。")
+    assert isinstance(res[1], DeepLCLIError)
+    assert res[2] in ("こんにちは", "こんにちは。")
+
+
+def test_translate_many_packed() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    res = t.translate_many(["hello.", "hello.", "hello."], pack=True)
+    assert all(r in ("こんにちは", "こんにちは。") for r in res)
+
+
+def test_translate_stream() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    res = list(t.translate_stream(iter(["hello.", "\n", "hello."]), concurrency=2))
+    assert res[0] in ("こんにちは", "こんにちは。")
+    assert isinstance(res[1], DeepLCLIError)
+    assert res[2] in ("こんにちは", "こんにちは。")
+
+
+def test_translate_many_invalid_concurrency() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    with pytest.raises(DeepLCLIError):
+        t.translate_many(["hello."], concurrency=0)
+
+
+def test_translate_document() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    t.max_length = 10
+    res = t.translate_document("hello.\n\nhello.")
+    first, second = res.split("\n\n")
+    assert first in ("こんにちは", "こんにちは。")
+    assert second in ("こんにちは", "こんにちは。")
+
+
+def test_close_without_start() -> None:
+    t = DeepLCLI("en", "ja", 100000)
+    t.close()
+    assert not t.is_started
+
+
 def test_blank_script() -> None:
     t = DeepLCLI("en", "ja", 100000)
     with pytest.raises(DeepLCLIError):
@@ -64,6 +174,13 @@ async def test_translate_async() -> None:
     assert res in ("こんにちは", "こんにちは。")
 
 
+@pytest.mark.asyncio
+async def test_translate_async_shared_browser() -> None:
+    async with DeepLCLI("en", "ja", 100000) as t:
+        res = await asyncio.gather(t.translate_async("hello."), t.translate_async("hello."))
+    assert all(r in ("こんにちは", "こんにちは。") for r in res)
+
+
 @pytest.mark.asyncio
 async def test_translate_async_long_text() -> None:
     t = DeepLCLI("ru", "ja", 100000)
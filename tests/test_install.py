@@ -0,0 +1,108 @@
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from deepl import DeepLCLI, DeepLCLIError
+from deepl import deepl as deepl_module
+from deepl import install as deepl_install
+from deepl.install import ensure_installed, get_stamp_path, is_install_skipped
+
+
+class FakeBrowserType:
+    name = "chromium"
+
+    def __init__(self, executable_path: Path) -> None:
+        self.executable_path = str(executable_path)
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[Any]:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    calls: list[Any] = []
+
+    def install(browser_types: list[Any], **kwargs: Any) -> bool:  # noqa: ANN401
+        calls.append((browser_types, kwargs))
+        Path(browser_types[0].executable_path).touch()
+        return True
+
+    monkeypatch.setattr(deepl_install, "install", install)
+    return calls
+
+
+def test_install_once(calls: list[Any], tmp_path: Path) -> None:
+    browser_type: Any = FakeBrowserType(tmp_path / "chrome")
+    assert ensure_installed(browser_type)
+    assert ensure_installed(browser_type)
+    assert len(calls) == 1
+    assert get_stamp_path("chromium").is_file()
+
+
+def test_reinstall_if_browser_is_removed(calls: list[Any], tmp_path: Path) -> None:
+    browser_type: Any = FakeBrowserType(tmp_path / "chrome")
+    ensure_installed(browser_type)
+    (tmp_path / "chrome").unlink()
+    ensure_installed(browser_type)
+    assert len(calls) == 2
+
+
+def test_force_install(calls: list[Any], tmp_path: Path) -> None:
+    browser_type: Any = FakeBrowserType(tmp_path / "chrome")
+    ensure_installed(browser_type)
+    ensure_installed(browser_type, force=True)
+    assert len(calls) == 2
+    assert calls[1][1]["force"]
+
+
+def test_stamp_is_keyed_by_playwright_version() -> None:
+    assert importlib.metadata.version("playwright") in get_stamp_path("chromium").name
+
+
+@pytest.mark.parametrize(("value", "expected"), [("", False), ("0", False), ("1", True)])
+def test_is_install_skipped(monkeypatch: pytest.MonkeyPatch, value: str, expected: bool) -> None:  # noqa: FBT001
+    monkeypatch.setenv("DEEPL_CLI_SKIP_INSTALL", value)
+    assert is_install_skipped() is expected
+
+
+def test_install_once_from_many_threads(calls: list[Any], tmp_path: Path) -> None:
+    browser_type: Any = FakeBrowserType(tmp_path / "chrome")
+    with ThreadPoolExecutor(4) as executor:
+        assert all(executor.map(lambda _: ensure_installed(browser_type), range(8)))
+    assert len(calls) == 1
+
+
+def test_failed_install_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DEEPL_CLI_SKIP_INSTALL", raising=False)
+    monkeypatch.setattr(deepl_module, "ensure_installed", lambda _: False)
+    with pytest.raises(DeepLCLIError, match="Failed to install Chromium"):
+        DeepLCLI("en", "ja").translate("hello.")
+
+
+def test_install_without_deps(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    calls: list[bool] = []
+
+    def install(browser_types: list[Any], *, with_deps: bool = False, force: bool = False) -> bool:  # noqa: ARG001
+        calls.append(with_deps)
+        if with_deps:
+            # E.g. no root to install system packages, but the browser itself is there
+            return False
+        Path(browser_types[0].executable_path).touch()
+        return True
+
+    monkeypatch.setattr(deepl_install, "install", install)
+    browser_type: Any = FakeBrowserType(tmp_path / "chrome")
+    with pytest.warns(RuntimeWarning, match="system dependencies"):
+        assert ensure_installed(browser_type)
+    assert ensure_installed(browser_type)
+    assert calls == [True, False]
+
+
+def test_install_fails_without_browser(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(deepl_install, "install", lambda *_, **__: False)
+    browser_type: Any = FakeBrowserType(tmp_path / "chrome")
+    assert not ensure_installed(browser_type)
+    assert not get_stamp_path("chromium").exists()
@@ -0,0 +1,25 @@
+import pytest
+
+from deepl.languages import FR_LANGS, TO_LANGS, is_selected
+
+
+@pytest.mark.parametrize(
+    ("lang_attr", "lang", "langs", "expected"),
+    [
+        ("ja", "ja", TO_LANGS, True),
+        ("ja-JP", "ja", TO_LANGS, True),
+        ("en-US", "en", FR_LANGS, True),
+        ("en-US", "en-US", TO_LANGS, True),
+        ("en-us", "en-US", TO_LANGS, True),
+        ("zh-Hant", "zh-Hant", TO_LANGS, True),
+        # A region that is a target language of its own is not its base language
+        ("de-CH", "de", TO_LANGS, False),
+        ("en-GB", "en-US", TO_LANGS, False),
+        ("ja", "en", FR_LANGS, False),
+        ("jav", "ja", FR_LANGS, False),
+        ("", "ja", TO_LANGS, False),
+        (None, "ja", TO_LANGS, False),
+    ],
+)
+def test_is_selected(lang_attr: str | None, lang: str, langs: set[str], expected: bool) -> None:  # noqa: FBT001
+    assert is_selected(lang_attr, lang, langs) is expected
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from deepl import DeepLCLI, DeepLCLIError
+from deepl.loop import LoopThread, iterate_in_thread
+
+
+async def current_loop() -> asyncio.AbstractEventLoop:
+    await asyncio.sleep(0.01)
+    return asyncio.get_running_loop()
+
+
+def test_run_from_many_threads() -> None:
+    loop = LoopThread()
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            loops = list(executor.map(lambda _: loop.run(current_loop()), range(32)))
+        assert set(loops) == {loop.loop}
+    finally:
+        loop.stop()
+    assert not loop.is_running
+    with pytest.raises(DeepLCLIError, match="stopped"):
+        loop.run(current_loop())
+
+
+@pytest.mark.asyncio
+async def test_run_inside_running_loop() -> None:
+    loop = LoopThread()
+    try:
+        assert loop.run(current_loop()) is loop.loop
+    finally:
+        loop.stop()
+
+
+def test_run_from_loop_itself() -> None:
+    loop = LoopThread()
+
+    async def nested() -> None:
+        loop.run(current_loop())
+
+    try:
+        with pytest.raises(DeepLCLIError, match="cannot be called from the event loop"):
+            loop.run(nested())
+    finally:
+        loop.stop()
+
+
+def test_stop_cancels_running_coroutines() -> None:
+    loop = LoopThread()
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    async def forever() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    asyncio.run_coroutine_threadsafe(forever(), loop.loop)
+    assert started.wait(5)
+    loop.stop()
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_iterate_in_thread() -> None:
+    threads: list[threading.Thread] = []
+
+    def items() -> Iterator[int | None]:
+        for item in (1, None, 2):
+            threads.append(threading.current_thread())
+            yield item
+
+    async def async_items() -> AsyncGenerator[int, None]:
+        yield 3
+
+    assert [item async for item in iterate_in_thread(items())] == [1, None, 2]
+    assert threading.main_thread() not in threads
+    assert [item async for item in iterate_in_thread(async_items())] == [3]
+
+
+def test_translate_from_many_threads(deepl: DeepLCLI) -> None:
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(deepl.translate, ["hello.", "world."] * 16))
+        assert results == ["こんにちは。", "世界。"] * 16
+    finally:
+        deepl.close()
+
+
+@pytest.mark.asyncio
+async def test_translate_inside_running_loop(deepl: DeepLCLI) -> None:
+    try:
+        assert deepl.translate("hello.") == "こんにちは。"
+        assert deepl.translate_many(["world.", "hello."]) == ["世界。", "こんにちは。"]
+    finally:
+        deepl.close()
+
+
+@pytest.mark.asyncio
+async def test_calls_share_browser_started_for_them(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+
+    async def launch(pool_size: int) -> None:  # noqa: ARG001
+        await asyncio.sleep(0.05)
+        events.append("launch")
+        setattr(deepl, "_DeepLCLI__browser", object())  # noqa: B010
+
+    async def close_async() -> None:
+        events.append("close")
+        setattr(deepl, "_DeepLCLI__browser", None)  # noqa: B010
+
+    async def translate_async(script: str) -> str:
+        await asyncio.sleep(0.05 if script == "hello." else 0.2)
+        events.append(script)
+        return script
+
+    monkeypatch.setattr(deepl, "_DeepLCLI__launch", launch)
+    monkeypatch.setattr(deepl, "close_async", close_async)
+    monkeypatch.setattr(deepl, "needs_request", lambda *_: True)
+    monkeypatch.setattr(deepl, "translate_async", translate_async)
+
+    async def late() -> list[str | Exception]:
+        # Arrives while the first call is still launching the browser
+        await asyncio.sleep(0.01)
+        return await deepl.translate_many_async(["world."])
+
+    assert await asyncio.gather(deepl.translate_many_async(["hello."]), late()) == [["hello."], ["world."]]
+    assert events == ["launch", "hello.", "world.", "close"]
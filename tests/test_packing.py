@@ -0,0 +1,39 @@
+import pytest
+
+from deepl.packing import is_packable, join_segments, pack_segments, split_segments
+
+
+@pytest.mark.parametrize(
+    ("segment", "expected"),
+    [
+        ("Save", True),
+        ("Save changes?", True),
+        ("", False),
+        (" Save", False),
+        ("Save\nchanges", False),
+    ],
+)
+def test_is_packable(segment: str, expected: bool) -> None:  # noqa: FBT001
+    assert is_packable(segment) is expected
+
+
+def test_pack_segments() -> None:
+    assert pack_segments(["aaa", "bbb", "ccc", "dddddddd", "e"], 7) == [[0, 1], [2], [3], [4]]
+
+
+def test_pack_segments_by_escaped_length() -> None:
+    def escaped_length(segment: str) -> int:
+        return len(segment) + segment.count("/")
+
+    assert pack_segments(["a/b", "ccc"], 7) == [[0, 1]]
+    assert pack_segments(["a/b", "ccc"], 7, escaped_length) == [[0], [1]]
+
+
+def test_join_and_split() -> None:
+    joined = join_segments(["Open", "Save", "Quit"])
+    assert split_segments(joined, 3) == ["Open", "Save", "Quit"]
+
+
+def test_split_mismatch() -> None:
+    assert split_segments("Open Save\nQuit", 3) is None
+    assert split_segments("Open\n\nQuit", 3) is None
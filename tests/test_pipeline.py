@@ -0,0 +1,178 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from deepl import DeepLCLI, TranslationCache
+from deepl.main import main
+from deepl.pipeline import Checkpoint, parse_record, translate_jsonl
+
+
+def test_parse_record() -> None:
+    assert parse_record({"id": 1, "text": "hello.", "fr": "en", "to": "ja"}) == (1, "hello.", "en", "ja")
+    assert parse_record({"id": "a", "text": "hello.", "to": "de"}, "en", "ja") == ("a", "hello.", "en", "de")
+
+
+@pytest.mark.parametrize(
+    ("record", "match"),
+    [
+        ([1], "not a JSON object"),
+        ({"text": "hello."}, "no `id`"),
+        ({"id": 1, "text": 1}, "no string `text`"),
+        ({"id": 1, "text": "hello.", "to": "ja"}, "None is not valid source language"),
+        ({"id": 1, "text": "hello.", "fr": "en", "to": "xx"}, "'xx' is not valid target language"),
+    ],
+)
+def test_parse_invalid_record(record: object, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        parse_record(record)
+
+
+def test_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "sub" / "checkpoint.jsonl"
+    checkpoint = Checkpoint(path)
+    checkpoint.mark_done(1)
+    checkpoint.mark_done("1")
+    checkpoint.mark_done({"b": 1, "a": 2})
+    assert len(checkpoint) == 3
+
+    # The last id was cut off by a crash
+    path.write_text(path.read_text() + '"cut')
+    checkpoint = Checkpoint(path)
+    assert 1 in checkpoint
+    assert "1" in checkpoint
+    assert {"a": 2, "b": 1} in checkpoint
+    assert 2 not in checkpoint
+    checkpoint.mark_done(2)
+    assert 2 in Checkpoint(path)
+
+
+@pytest.mark.asyncio
+async def test_translate_jsonl(cache: TranslationCache, tmp_path: Path) -> None:
+    pairs: list[tuple[str, str]] = []
+
+    def new_translator(fr_lang: str, to_lang: str) -> DeepLCLI:
+        pairs.append((fr_lang, to_lang))
+        return DeepLCLI(fr_lang, to_lang, cache=cache)
+
+    lines = [
+        '{"id": 1, "text": "hello."}',
+        '{"id": 2, "text": "hello.", "to": "de"}',
+        "",
+        '{"id": 3, "text": "世界。", "fr": "ja", "to": "en"}',
+        '{"id": 4, "text": "hello."}',
+        '{"id": 5, "text": " "}',
+        "{",
+        '{"id": 6, "text": "hello.", "to": "xx"}',
+    ]
+    checkpoint = Checkpoint(tmp_path / "checkpoint.jsonl")
+    checkpoint.mark_done(4)
+    results = [res async for res in translate_jsonl(lines, new_translator, 2, checkpoint, fr_lang="en", to_lang="ja")]
+
+    by_id = {res["id"]: res for res in results}
+    assert by_id[1] == {"id": 1, "translation": "こんにちは。", "error": None}
+    assert by_id[2]["translation"] == "Hallo."
+    assert by_id[3]["translation"] == "World."
+    assert 4 not in by_id
+    assert by_id[5]["translation"] == ""
+    assert by_id[None]["error"].startswith("line 7: ")
+    assert by_id[6]["error"] == "line 8: 'xx' is not valid target language."
+    assert sorted(pairs) == [("en", "de"), ("en", "ja"), ("ja", "en")]
+    assert all(i in checkpoint for i in (1, 2, 3, 4, 5))
+    assert 6 not in checkpoint
+
+
+class FakeTranslator(DeepLCLI):
+    """Translator that pretends to start a browser for every script."""
+
+    def __init__(self, fr_lang: str, to_lang: str, events: list[tuple[str, str, str]]) -> None:
+        super().__init__(fr_lang, to_lang)
+        self.events = events
+        self.running = False
+
+    @property
+    def is_started(self) -> bool:
+        return self.running
+
+    def needs_request(self, script: str, to_lang: str | None = None) -> bool:  # noqa: ARG002
+        return True
+
+    async def start_async(self) -> None:
+        self.running = True
+        self.events.append(("start", self.fr_lang, self.to_lang))
+
+    async def close_async(self) -> None:
+        if self.running:
+            self.running = False
+            self.events.append(("close", self.fr_lang, self.to_lang))
+
+    async def translate_document_async(self, script: str, concurrency: int = 4) -> str:  # noqa: ARG002
+        await asyncio.sleep(0)
+        return f"{self.to_lang}:{script}"
+
+
+@pytest.mark.asyncio
+async def test_translate_jsonl_closes_least_recently_used() -> None:
+    events: list[tuple[str, str, str]] = []
+    lines = [
+        '{"id": 1, "text": "a", "to": "ja"}',
+        '{"id": 2, "text": "b", "to": "de"}',
+        '{"id": 3, "text": "c", "to": "de"}',
+        '{"id": 4, "text": "d", "fr": "ja", "to": "en"}',
+        '{"id": 5, "text": "e", "to": "ja"}',
+    ]
+    results = [
+        res
+        async for res in translate_jsonl(
+            lines,
+            lambda fr, to: FakeTranslator(fr, to, events),
+            1,
+            fr_lang="en",
+            max_translators=2,
+        )
+    ]
+
+    assert [res["translation"] for res in results] == ["ja:a", "de:b", "de:c", "en:d", "ja:e"]
+    assert events == [
+        ("start", "en", "ja"),
+        ("start", "en", "de"),
+        ("close", "en", "ja"),
+        ("start", "ja", "en"),
+        ("close", "en", "de"),
+        ("start", "en", "ja"),
+        ("close", "ja", "en"),
+        ("close", "en", "ja"),
+    ]
+
+
+def test_main_jsonl(
+    cache: TranslationCache,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    source = tmp_path / "in.jsonl"
+    source.write_text(
+        '{"id": "a", "text": "hello.", "fr": "en", "to": "ja"}\n{"id": "b", "text": "世界。", "fr": "ja"}\n',
+    )
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    argv = ["deepl", "--jsonl", str(source), "-T", "en", "--cache", str(cache.path), "--checkpoint", str(checkpoint)]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    main()
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(results, key=lambda res: res["id"]) == [
+        {"id": "a", "translation": "こんにちは。", "error": None},
+        {"id": "b", "translation": "World.", "error": None},
+    ]
+
+    main()
+    assert capsys.readouterr().out == ""
+
+
+def test_languages_required_without_jsonl(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["deepl", "-s", "-T", "ja"])
+    with pytest.raises(SystemExit):
+        main()
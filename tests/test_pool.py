@@ -0,0 +1,197 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from deepl.pool import PagePool
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def make_pool(**kwargs: Any) -> tuple[PagePool, list[FakePage]]:  # noqa: ANN401
+    created: list[FakePage] = []
+
+    async def factory() -> Any:  # noqa: ANN401
+        page = FakePage()
+        created.append(page)
+        return page
+
+    return PagePool(factory, **kwargs), created
+
+
+@pytest.mark.asyncio
+async def test_start_fills_pool() -> None:
+    pool, created = make_pool(size=3)
+    await pool.start()
+    assert len(pool) == 3
+    assert len(created) == 3
+
+
+@pytest.mark.asyncio
+async def test_start_tolerates_failed_pages() -> None:
+    attempts = 0
+
+    async def factory() -> Any:  # noqa: ANN401
+        nonlocal attempts
+        attempts += 1
+        if attempts % 2 == 0:
+            msg = "throttled"
+            raise ValueError(msg)
+        return FakePage()
+
+    pool = PagePool(factory, size=4)
+    await pool.start()
+    assert len(pool) == 2
+    await pool.start()
+    assert len(pool) == 3
+
+
+@pytest.mark.asyncio
+async def test_start_raises_if_no_page_is_created() -> None:
+    async def factory() -> Any:  # noqa: ANN401
+        msg = "throttled"
+        raise ValueError(msg)
+
+    pool = PagePool(factory, size=2)
+    with pytest.raises(ValueError, match="throttled"):
+        await pool.start()
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_page_is_reused() -> None:
+    pool, created = make_pool(size=1)
+    async with pool.page() as first:
+        pass
+    async with pool.page() as second:
+        pass
+    assert first is second
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_page_is_recycled_after_max_uses() -> None:
+    pool, created = make_pool(size=1, max_uses=2)
+    for _ in range(3):
+        async with pool.page():
+            pass
+    assert len(created) == 2
+    assert created[0].closed
+    assert pool.stats.pages_recycled == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_page_is_discarded() -> None:
+    pool, created = make_pool(size=1)
+    with pytest.raises(ValueError, match="boom"):
+        async with pool.page():
+            raise ValueError("boom")  # noqa: EM101
+    assert created[0].closed
+    async with pool.page() as page:
+        assert page is created[1]
+    assert pool.stats.pages_dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_closed_page_is_discarded_on_release() -> None:
+    pool, created = make_pool(size=1)
+    async with pool.page() as page:
+        await page.close()
+    assert len(pool) == 0
+    async with pool.page() as page:
+        assert page is created[1]
+    assert pool.stats.pages_dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_page_is_replaced() -> None:
+    async def health_check(page: Any) -> bool:  # noqa: ANN401
+        return page is not created[0]
+
+    pool, created = make_pool(size=1, health_check=health_check)
+    await pool.start()
+    async with pool.page() as page:
+        assert page is created[1]
+    assert pool.stats.pages_dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_page_is_discarded_when_health_check_is_cancelled() -> None:
+    slow = True
+
+    async def health_check(page: Any) -> bool:  # noqa: ANN401, ARG001
+        if slow:
+            await asyncio.sleep(3600)
+        return True
+
+    pool, created = make_pool(size=1, health_check=health_check)
+    await pool.start()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pool.acquire(), 0.01)
+    assert created[0].closed
+    assert len(pool) == 0
+
+    slow = False
+    page = await asyncio.wait_for(pool.acquire(), 1)
+    assert page is created[1]
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_bounded_pages() -> None:
+    pool, created = make_pool(size=2)
+    active = 0
+    peak = 0
+
+    async def work() -> None:
+        nonlocal active, peak
+        async with pool.page():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(work() for _ in range(10)))
+    assert peak == 2
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_closed_pool_refuses_checkout() -> None:
+    pool, created = make_pool(size=1)
+    await pool.start()
+    await pool.close()
+    assert created[0].closed
+    with pytest.raises(RuntimeError):
+        await pool.acquire()
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_pages_in_use() -> None:
+    pool, created = make_pool(size=2)
+    await pool.start()
+    page = await pool.acquire()
+    drained = asyncio.ensure_future(pool.drain())
+    await asyncio.sleep(0.01)
+    assert pool.is_closed
+    assert created[1].closed
+    assert not drained.done()
+
+    await pool.release(page)
+    await asyncio.wait_for(drained, 1)
+    assert page.is_closed()
+    assert len(pool) == 0
+    assert pool.stats.pages_recycled == 0
+
+
+def test_invalid_size() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        make_pool(size=0)
@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+from playwright.async_api import ProxySettings
+
+from deepl import DeepLCLI, ProxyPool
+from deepl.main import parse_args
+from deepl.proxies import parse_proxy
+
+A: ProxySettings = {"server": "http://a:3128"}
+B: ProxySettings = {"server": "http://b:3128"}
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://a:3128", {"server": "http://a:3128"}),
+        ("a:3128", {"server": "http://a:3128"}),
+        ("socks5://b", {"server": "socks5://b"}),
+        ("http://us%40r:p%3Ass@a:3128", {"server": "http://a:3128", "username": "us@r", "password": "p:ss"}),
+    ],
+)
+def test_parse_proxy(url: str, expected: dict[str, str]) -> None:
+    assert parse_proxy(url) == expected
+
+
+def test_parse_invalid_proxy() -> None:
+    with pytest.raises(ValueError, match="is not a proxy URL"):
+        parse_proxy("http://")
+
+
+def test_spreads_pages_across_proxies() -> None:
+    pool = ProxyPool([A, B])
+    assert [pool.checkout(), pool.checkout(), pool.checkout()] == [A, B, A]
+    assert pool.stats["http://a:3128"].in_use == 2
+    pool.release(A)
+    pool.release(A)
+    assert pool.checkout() == A
+
+
+def test_prefers_healthy_and_fast_proxies() -> None:
+    pool = ProxyPool([A, B])
+    pool.record(A, ok=True, latency=2.0)
+    pool.record(B, ok=True, latency=0.5)
+    assert pool.best() == B
+    pool.record(B, ok=False)
+    assert pool.best() == A
+    assert pool.stats["http://b:3128"].success_rate == 0.5
+
+
+def test_takes_failing_proxy_out() -> None:
+    pool = ProxyPool([A, B], max_failures=2, cooldown=60)
+    pool.record(A, ok=False)
+    assert pool.is_available(A)
+    pool.record(A, ok=False)
+    assert not pool.is_available(A)
+    assert [pool.checkout(), pool.checkout()] == [B, B]
+    assert "down for" in str(pool)
+
+    # If every proxy is out, the one coming back first is used anyway
+    pool.record(B, ok=False)
+    pool.record(B, ok=False)
+    assert pool.best() == A
+
+
+def test_failing_proxy_comes_back_after_cooldown() -> None:
+    pool = ProxyPool([A], max_failures=1, cooldown=0.05)
+    pool.record(A, ok=False)
+    assert not pool.is_available(A)
+    time.sleep(0.06)
+    assert pool.is_available(A)
+    pool.record(A, ok=True, latency=0.1)
+    pool.record(A, ok=False)
+    assert not pool.is_available(A)
+
+
+@pytest.mark.asyncio
+async def test_caps_pages_per_proxy() -> None:
+    pool = ProxyPool([A, B], max_pages=1)
+    assert pool.capacity == 2
+    assert {str(pool.checkout()), str(pool.checkout())} == {str(A), str(B)}
+    assert pool.checkout() is None
+
+    waiter = asyncio.ensure_future(pool.acquire(interval=0.01))
+    await asyncio.sleep(0.03)
+    assert not waiter.done()
+    pool.release(B)
+    assert await waiter == B
+
+
+@pytest.mark.parametrize(
+    ("proxies", "kwargs"),
+    [([], {}), ([A, A], {}), ([A], {"max_pages": 0}), ([A], {"max_failures": 0})],
+)
+def test_invalid_pool(proxies: list[ProxySettings], kwargs: dict[str, int]) -> None:
+    with pytest.raises(ValueError, match=r"proxy|must"):
+        ProxyPool(proxies, **kwargs)
+
+
+def test_translator_proxies() -> None:
+    assert DeepLCLI("en", "ja", proxy=A).proxy == A
+    assert DeepLCLI("en", "ja", proxy=A).proxies is None
+    t = DeepLCLI("en", "ja", proxy=[A, B])
+    assert t.proxy is None
+    assert t.proxies is not None
+    assert t.proxies.proxies == [A, B]
+    pool = ProxyPool([A, B])
+    assert DeepLCLI("en", "ja", proxy=pool).proxies is pool
+
+
+def test_parse_proxy_args(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.argv", ["deepl", "-F", "en", "-T", "ja", "-s", "--proxy", "a:3128", "--proxy", "b:3128"])
+    args = parse_args()
+    assert args.proxy == [A, B]
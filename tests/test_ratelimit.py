@@ -0,0 +1,89 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from deepl import RateLimiter, RetryPolicy
+from deepl.ratelimit import is_retryable_status, parse_retry_after
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [(200, False), (403, False), (429, True), (500, True), (503, True), (600, False)],
+)
+def test_is_retryable_status(status: int, expected: bool) -> None:  # noqa: FBT001
+    assert is_retryable_status(status) is expected
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after(" 3 ") == 3.0
+    assert parse_retry_after("soon") is None
+    delay = parse_retry_after(formatdate(time.time() + 60, usegmt=True))
+    assert delay is not None
+    assert 55 < delay <= 60
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+
+
+def test_rate_limiter_bursts_then_paces() -> None:
+    limiter = RateLimiter(rate=10, burst=2)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_backs_off_and_recovers() -> None:
+    limiter = RateLimiter(rate=4, burst=4, min_rate=1, backoff=0.5, increase=1)
+    limiter.on_throttled()
+    assert limiter.rate == 2
+    limiter.on_throttled()
+    limiter.on_throttled()
+    assert limiter.rate == 1
+    assert limiter.throttled == 3
+    # The saved-up burst is dropped
+    assert limiter.reserve() == pytest.approx(1, abs=0.01)
+
+    for _ in range(5):
+        limiter.on_success()
+    assert limiter.rate == 4
+
+
+def test_rate_limiter_pauses_for_retry_after() -> None:
+    limiter = RateLimiter(rate=10, burst=1)
+    limiter.on_throttled(retry_after=2)
+    assert limiter.reserve() == pytest.approx(2.2, abs=0.01)
+    assert limiter.reserve() == pytest.approx(2.4, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_is_shared_by_tasks() -> None:
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.perf_counter()
+    await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+    assert time.perf_counter() - start >= 0.09
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"rate": 0}, {"burst": 0}, {"min_rate": -1}, {"backoff": 0}, {"backoff": 1.5}],
+)
+def test_rate_limiter_invalid(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError, match="must be"):
+        RateLimiter(**kwargs)  # ty: ignore[invalid-argument-type]
+
+
+def test_retry_policy_delay() -> None:
+    retry = RetryPolicy(base_delay=1, max_delay=5, jitter=0)
+    assert [retry.delay(n) for n in range(4)] == [1, 2, 4, 5]
+    assert retry.delay(0, retry_after=3) == 3
+
+    jittered = RetryPolicy(base_delay=1, max_delay=5, jitter=0.5)
+    assert all(2 <= jittered.delay(2) <= 4 for _ in range(100))
+
+
+@pytest.mark.parametrize("kwargs", [{"retries": -1}, {"base_delay": -1}, {"jitter": 2}])
+def test_retry_policy_invalid(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError, match="must"):
+        RetryPolicy(**kwargs)  # ty: ignore[invalid-argument-type]
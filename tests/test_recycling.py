@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+from deepl.recycling import RecycleStats, process_rss
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_process_rss() -> None:
+    rss = process_rss([os.getpid()])
+    assert rss is not None
+    assert rss > 0
+    # Processes that have exited are skipped
+    assert process_rss([os.getpid(), 2**22 + 1]) == rss
+    assert process_rss([]) == 0
+
+
+def test_recycle_stats() -> None:
+    stats = RecycleStats()
+    assert str(stats).endswith("0 browser restarts, browser memory -")
+    stats.browser_restarts = 1
+    stats.rss = 512 * 2**20
+    assert str(stats).endswith("1 browser restarts, browser memory 512 MiB")
@@ -0,0 +1,143 @@
+import pickle
+from pathlib import Path
+from typing import Any
+
+import pytest
+from playwright._impl._errors import Error as PlaywrightError
+
+from deepl.main import parse_args, translator_options
+from deepl.resources import DEFAULT_BLOCKED_TYPES, AssetCache, ResourcePolicy, ResourceStats, handle_route
+
+SCRIPT_URL = "https://static.deepl.com/js/app.js"
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str, method: str = "GET") -> None:
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+
+
+class FakeResponse:
+    def __init__(self) -> None:
+        self.status = 200
+        self.headers = {"content-type": "text/javascript", "content-encoding": "gzip", "cache-control": "max-age=60"}
+
+    async def body(self) -> bytes:
+        return b"app();"
+
+
+class FakeRoute:
+    def __init__(self, request: FakeRequest) -> None:
+        self.request = request
+        self.action: str | None = None
+        self.fulfilled: dict[str, Any] = {}
+
+    async def abort(self) -> None:
+        self.action = "abort"
+
+    async def continue_(self) -> None:
+        self.action = "continue"
+
+    async def fetch(self) -> FakeResponse:
+        if self.request.url.endswith("/broken.js"):
+            msg = "net::ERR_CONNECTION_RESET"
+            raise PlaywrightError(msg)
+        return FakeResponse()
+
+    async def fulfill(self, **kwargs: Any) -> None:  # noqa: ANN401
+        self.action = "fulfill"
+        self.fulfilled = kwargs
+
+
+@pytest.mark.parametrize(
+    ("url", "resource_type", "expected"),
+    [
+        ("https://www.deepl.com/en/translator", "document", False),
+        ("https://static.deepl.com/img/logo.svg", "image", True),
+        ("https://www.googletagmanager.com/gtm.js", "script", True),
+        ("https://googletagmanager.com/gtm.js", "script", True),
+        ("https://notgoogletagmanager.com/gtm.js", "script", False),
+    ],
+)
+def test_default_policy(url: str, resource_type: str, expected: bool) -> None:  # noqa: FBT001
+    assert ResourcePolicy().is_blocked(url, resource_type) is expected
+
+
+def test_allow_domains() -> None:
+    policy = ResourcePolicy(block_types=["document"], allow_domains=["deepl.com"])
+    assert not policy.is_blocked("https://www.deepl.com/en/translator", "document")
+    assert policy.is_blocked("https://example.com/a.js", "script")
+
+
+def test_asset_cache_respects_cache_control() -> None:
+    cache = AssetCache()
+    assert cache.set(SCRIPT_URL, 200, {"Cache-Control": "public, max-age=60", "Content-Length": "6"}, b"app();")
+    assert cache.get(SCRIPT_URL) == ({"Cache-Control": "public, max-age=60"}, b"app();")
+    assert not cache.set(SCRIPT_URL + "?a", 200, {"cache-control": "no-store"}, b"")
+    assert not cache.set(SCRIPT_URL + "?b", 200, {"cache-control": "max-age=0"}, b"")
+    assert not cache.set(SCRIPT_URL + "?c", 404, {}, b"")
+    assert len(cache) == 1
+
+
+def test_asset_cache_expires() -> None:
+    cache = AssetCache(ttl=-1)
+    cache.set(SCRIPT_URL, 200, {}, b"app();")
+    assert cache.get(SCRIPT_URL) is None
+
+
+def test_asset_cache_is_persistent(tmp_path: Path) -> None:
+    path = tmp_path / "sub" / "assets.sqlite3"
+    cache = AssetCache(path)
+    cache.set(SCRIPT_URL, 200, {}, b"app();")
+    cache.close()
+    assert AssetCache(path).get(SCRIPT_URL) == ({}, b"app();")
+
+
+def test_asset_cache_is_cacheable() -> None:
+    cache = AssetCache()
+    assert cache.is_cacheable(SCRIPT_URL, "GET", "stylesheet")
+    assert not cache.is_cacheable(SCRIPT_URL, "POST", "script")
+    assert not cache.is_cacheable("https://www2.deepl.com/jsonrpc", "GET", "fetch")
+    assert not cache.is_cacheable("https://example.com/app.js", "GET", "script")
+
+
+@pytest.mark.asyncio
+async def test_handle_route() -> None:
+    policy = ResourcePolicy()
+    cache = AssetCache()
+    stats = ResourceStats()
+    stats.page_loads = 2
+
+    routes: list[Any] = [
+        FakeRoute(FakeRequest("https://static.deepl.com/img/logo.svg", "image")),
+        FakeRoute(FakeRequest("https://www.deepl.com/en/translator", "document")),
+        FakeRoute(FakeRequest(SCRIPT_URL, "script")),
+        FakeRoute(FakeRequest(SCRIPT_URL, "script")),
+        FakeRoute(FakeRequest("https://static.deepl.com/js/broken.js", "script")),
+    ]
+    for route in routes:
+        await handle_route(route, policy, cache, stats)
+
+    assert [route.action for route in routes] == ["abort", "continue", "fulfill", "fulfill", "continue"]
+    assert "response" in routes[2].fulfilled
+    assert routes[3].fulfilled["body"] == b"app();"
+    assert "content-encoding" not in routes[3].fulfilled["headers"]
+    assert (stats.blocked, stats.cached, stats.cached_bytes, stats.fetched) == (1, 1, 6, 3)
+    assert str(stats).endswith("saved 1.0 requests and 0 KiB per page load")
+
+
+def test_resource_policy_args(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.argv", ["deepl", "-F", "en", "-T", "ja", "-s"])
+    policy = translator_options(parse_args())["resources"]
+    assert policy.block_types == DEFAULT_BLOCKED_TYPES
+    assert policy.is_blocked("https://www.google-analytics.com/collect", "xhr")
+    assert policy.allow_domains is None
+
+    argv = ["--block-types", "image, script", "--block-domains", "", "--allow-domains", "deepl.com"]
+    monkeypatch.setattr("sys.argv", ["deepl", "-F", "en", "-T", "ja", "-s", *argv])
+    policy = pickle.loads(pickle.dumps(translator_options(parse_args())["resources"]))  # noqa: S301
+    assert policy.block_types == {"image", "script"}
+    assert policy.block_domains == set()
+    assert policy.is_blocked("https://example.com/", "document")
+    assert not policy.is_blocked("https://www.deepl.com/translator", "document")
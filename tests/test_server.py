@@ -0,0 +1,54 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from deepl import DeepLCLIError
+from deepl.server import TranslationServer, parse_address, translate_via_server
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [
+        ("127.0.0.1:8765", ("127.0.0.1", 8765)),
+        ("localhost:80", ("localhost", 80)),
+        ("unix:/tmp/deepl.sock", Path("/tmp/deepl.sock")),  # noqa: S108
+    ],
+)
+def test_parse_address(address: str, expected: object) -> None:
+    assert parse_address(address) == expected
+
+
+@pytest.mark.parametrize("address", ["8765", ":8765", "localhost:http"])
+def test_parse_invalid_address(address: str) -> None:
+    with pytest.raises(ValueError, match="HOST:PORT"):
+        parse_address(address)
+
+
+@pytest.mark.asyncio
+async def test_serve_over_unix_socket(tmp_path: Path) -> None:
+    sock = tmp_path / "deepl.sock"
+    address = f"unix:{sock}"
+    serving = asyncio.ensure_future(TranslationServer().serve(address))
+    while not sock.exists():  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+
+    reader, writer = await asyncio.open_unix_connection(sock)
+    writer.write(b"GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    status, *_, body = (await reader.read()).decode().split("\r\n")
+    assert status == "HTTP/1.1 200 OK"
+    assert json.loads(body) == {"status": "ok", "pairs": []}
+
+    with pytest.raises(DeepLCLIError, match="400"):
+        await asyncio.to_thread(translate_via_server, address, "hello.", "enn", "ja")
+
+    serving.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await serving
+    assert not sock.exists()
+
+
+def test_unreachable_server(tmp_path: Path) -> None:
+    with pytest.raises(DeepLCLIError, match="Unable to reach"):
+        translate_via_server(f"unix:{tmp_path / 'none.sock'}", "hello.", "en", "ja")
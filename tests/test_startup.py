@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(*args: str) -> set[str]:
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return {line.split("|")[-1].strip() for line in proc.stderr.splitlines() if line.startswith("import time:")}
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import deepl"),
+        ("-c", "from deepl import TranslationCache"),
+        ("-m", "deepl.main", "--version"),
+        ("-m", "deepl.main", "--help"),
+        ("-m", "deepl.main", "-s", "-F", "en", "-T", "invalid"),
+    ],
+)
+def test_startup_does_not_import_playwright(args: tuple[str, ...]) -> None:
+    modules = imported_modules(*args)
+    assert "deepl" in modules
+    assert not {m.split(".")[0] for m in modules} & {"playwright", "install_playwright"}
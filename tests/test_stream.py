@@ -0,0 +1,54 @@
+import asyncio
+import contextlib
+from collections.abc import Coroutine
+from typing import Any
+
+import pytest
+
+from deepl import DeepLCLI
+
+
+def track_in_flight(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Make each translation take a while, counting the translations in flight and cancelled."""
+    counts = {"in_flight": 0, "peak": 0, "cancelled": 0}
+
+    async def slow(script: str) -> str:
+        counts["in_flight"] += 1
+        counts["peak"] = max(counts["peak"], counts["in_flight"])
+        try:
+            await asyncio.sleep(0.01 if script != "slow." else 3600)
+        except asyncio.CancelledError:
+            counts["cancelled"] += 1
+            raise
+        finally:
+            counts["in_flight"] -= 1
+        return script.upper()
+
+    def patched(script: str) -> Coroutine[Any, Any, str]:
+        return slow(script)
+
+    monkeypatch.setattr(deepl, "translate_async", patched)
+    return counts
+
+
+@pytest.mark.asyncio
+async def test_translate_stream_bounds_in_flight(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch) -> None:
+    counts = track_in_flight(deepl, monkeypatch)
+    scripts = ["hello.", "world."] * 5
+
+    results = [res async for res in deepl.translate_stream_async(scripts, 2)]
+
+    assert results == [script.upper() for script in scripts]
+    assert counts["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_stream_closed_early(deepl: DeepLCLI, monkeypatch: pytest.MonkeyPatch) -> None:
+    counts = track_in_flight(deepl, monkeypatch)
+
+    async with contextlib.aclosing(deepl.translate_stream_async(["hello.", "slow.", "slow."], 3)) as results:
+        async for res in results:
+            assert res == "HELLO."
+            break
+
+    assert counts == {"in_flight": 0, "peak": 3, "cancelled": 2}
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from deepl import DeepLCLI, Timings, TranslationCache
+from deepl.timings import measure, set_source
+
+
+def test_measure_without_active_timings() -> None:
+    with measure("fill"):
+        pass
+
+
+def test_measure_accumulates_phases() -> None:
+    timings = Timings()
+    with timings.activate():
+        with measure("fill"):
+            pass
+        with measure("fill"):
+            pass
+        with pytest.raises(ValueError, match="boom"), measure("read"):
+            raise ValueError("boom")  # noqa: EM101
+        set_source("page")
+    assert set(timings.phases) == {"fill", "read"}
+    assert timings.total >= sum(timings.phases.values())
+    assert timings.source == "page"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_phase_is_not_recorded() -> None:
+    timings = Timings()
+
+    async def wait() -> None:
+        with measure("wait_rendered"):
+            await asyncio.sleep(10)
+
+    with timings.activate():
+        task = asyncio.ensure_future(wait())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert timings.phases == {}
+
+
+def test_str_orders_phases() -> None:
+    timings = Timings()
+    timings.phases = {"read": 1.0, "goto": 812.3}
+    timings.total = 900
+    assert str(timings) == "goto=812ms read=1ms total=900ms (failed)"
+
+
+def test_translate_reports_timings() -> None:
+    cache = TranslationCache()
+    cache.set("en", "ja", "hello.", "こんにちは。")
+    reported: list[Timings] = []
+    t = DeepLCLI("en", "ja", cache=cache, on_timings=reported.append)
+    assert t.translate("hello.") == "こんにちは。"
+    assert reported == [t.last_timings]
+    assert reported[0].source == "cache"
+    assert set(reported[0].phases) == {"cache"}
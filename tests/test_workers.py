@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from deepl import DeepLCLIError, TranslationCache
+from deepl.main import main
+from deepl.workers import WorkerPool
+
+
+def test_translate_many_in_order(cache: TranslationCache) -> None:
+    with WorkerPool("en", "ja", workers=2, pages=2, cache=cache) as pool:
+        results = pool.translate_many(["hello.", "world.", "", "hello."])
+    assert results[:2] == ["こんにちは。", "世界。"]
+    assert isinstance(results[2], DeepLCLIError)
+    assert results[3] == "こんにちは。"
+
+
+@pytest.mark.asyncio
+async def test_translate_document_async(cache: TranslationCache) -> None:
+    pool = WorkerPool("en", "ja", workers=1, pages=2, cache=cache)
+    pool.max_length = 8
+    async with pool:
+        assert pool.is_started
+        assert await pool.translate_document_async("hello.\n\nworld.\n") == "こんにちは。\n\n世界。"
+    assert not pool.is_started
+
+
+def test_submit_before_start() -> None:
+    with pytest.raises(DeepLCLIError, match="not started"):
+        WorkerPool("en", "ja", workers=1).submit("hello.")
+
+
+@pytest.mark.parametrize(("workers", "pages"), [(-1, 1), (1, 0)])
+def test_invalid_pool(workers: int, pages: int) -> None:
+    with pytest.raises(DeepLCLIError, match="must be positive"):
+        WorkerPool("en", "ja", workers=workers, pages=pages)
+
+
+def test_main_batch_with_workers(cache: TranslationCache, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "in").mkdir()
+    (tmp_path / "in" / "a.txt").write_text("hello.\n")
+    (tmp_path / "in" / "b.txt").write_text("world.\n")
+    monkeypatch.setenv("DEEPL_CLI_CACHE", str(cache.path))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["deepl", "-F", "en", "-T", "ja", "-f", str(tmp_path / "in"), "-o", str(tmp_path / "out"), "-w", "2"],
+    )
+    main()
+    assert (tmp_path / "out" / "a.txt").read_text() == "こんにちは。\n"
+    assert (tmp_path / "out" / "b.txt").read_text() == "世界。\n"
+
+
+def test_workers_need_output_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["deepl", "-F", "en", "-T", "ja", "-s", "-w", "2"])
+    with pytest.raises(SystemExit):
+        main()